@@ -4,8 +4,10 @@ Author: Lewis Gallagher
 """
 
 import os
-from typing import List, Any
+from typing import List, Any, Dict, Iterable, Iterator, Tuple, Union
 import time
+from collections import deque
+import numpy as np
 
 
 EXAMPLE_INPUT = '''\
@@ -25,43 +27,90 @@ EXAMPLE_OUTPUT_PART1 = 7
 EXAMPLE_OUTPUT_PART2 = 5
 
 
-def _parse_input(data: str) -> List[str]:
-    """Parse input text file into usable data structure."""
+def _parse_input(data: str) -> np.ndarray:
+    """Parse input text file into an array of depths, converted in C rather than one int() per line. Bad readings raise."""
 
-    return [int(i) for i in data.splitlines()]
+    return np.array(data.split(), dtype=np.int64)
 
 
-def compare_depths(data: List[int], window_size: int) -> int:
+def _parse_stream(lines: Iterable[str]) -> Iterator[int]:
+    """Parse lines lazily into depths."""
+
+    for line in lines:
+        if line.strip():
+            yield int(line)
+
+
+def window_increases(readings: Iterable[int], window_sizes: List[int]) -> Iterator[Tuple[int, List[bool]]]:
     """
-    Takes a sequence of integers and compares readings based on sums of window size. Window size can be 0 for single readings.
-    Should take O(n) time as the function iterates over the input list once.
+    Yields each reading with whether it made the sum of each window size go up, reading the input once and holding only
+    the last max(window_sizes) readings. Neighbouring windows share all but one reading, so the rolling sum goes up
+    exactly when the reading entering the window is larger than the one leaving it.
     """
 
-    upcount = 0
-    prev_sum = 0
+    if any(w < 1 for w in window_sizes):
+        raise ValueError(f'Window sizes must be at least 1, got {window_sizes}')
+
+    history = deque(maxlen=max(window_sizes, default=1))
+
+    for depth in readings:
+        # Cant compare a window size until there's a full window to drop a reading from.
+        yield depth, [len(history) >= w and depth > history[-w] for w in window_sizes]
+        history.append(depth)
 
-    # Get sums of window sizes.
-    for i in range(len(data) - window_size + 1):
-        w_sum = sum(data[i:i+window_size])
 
-        # Cant compare the first reading.
-        if i != 0: 
-            # If deeper, iterate.
-            if w_sum > prev_sum:
-                upcount += 1
+def count_increases(data: Union[np.ndarray, Iterable[int]], window_sizes: Iterable[int]) -> Dict[int, int]:
+    """
+    Counts how many times the sum of each window size goes up, for several window sizes at once.
+    A window sum goes up exactly when data[i + w] > data[i] (see window_increases), so the cost is independent of w.
+    Arrays are compared with one vectorised pass per window size. Anything else (e.g. a stream) goes through
+    window_increases.
+    """
+
+    window_sizes = list(window_sizes)
+    if any(w < 1 for w in window_sizes):
+        raise ValueError(f'Window sizes must be at least 1, got {window_sizes}')
 
-        prev_sum = w_sum
+    if isinstance(data, np.ndarray):
+        return {w: int(np.count_nonzero(data[w:] > data[:-w])) for w in window_sizes}
 
-    return upcount
+    counts = dict.fromkeys(window_sizes, 0)
+    for _, increased in window_increases(data, window_sizes):
+        for w, up in zip(window_sizes, increased):
+            counts[w] += up
 
+    return counts
 
-def part_1_solution(data: List[int]) -> int:
+
+def compare_depths(data: Union[np.ndarray, Iterable[int]], window_size: int) -> int:
+    """
+    Takes a sequence of integers and compares readings based on sums of window size. Window size can be 1 for single readings.
+    Takes O(n) time whatever the window size, see count_increases.
+    """
+
+    return count_increases(data, [window_size])[window_size]
+
+
+def monitor_depths(readings: Iterable[int], window_size: int = 1) -> Iterator[Tuple[int, bool, int]]:
+    """
+    Yields (depth, whether its window sum went up, increases so far) as each reading arrives, so partial results are
+    available before the input ends. Only the last window_size readings are kept, see window_increases.
+    """
+
+    upcount = 0
+
+    for depth, (increased,) in window_increases(readings, [window_size]):
+        upcount += increased
+        yield depth, increased, upcount
+
+
+def part_1_solution(data: np.ndarray) -> int:
     """Compute solution to puzzle part 1."""
 
     return compare_depths(data, 1)
     
 
-def part_2_solution(data: List[int]) -> Any:
+def part_2_solution(data: np.ndarray) -> Any:
     """Compute solution to puzzle part 2."""
 
     return compare_depths(data, 3)
@@ -76,17 +125,21 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
-    print(f'Part 2 execution time: {execution_time_1:.4f}')
\ No newline at end of file
+    execution_time_2 = (time.perf_counter() - start_time_2)
+    print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
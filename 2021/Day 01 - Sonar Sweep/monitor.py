@@ -0,0 +1,71 @@
+"""
+Live sonar monitor for Advent of Code 2021 day 1.
+Reads depths from a file or stdin as they arrive and reports the running number of window increases,
+holding only the last window_size readings in memory.
+
+Usage:
+    tail -f depths.log | python monitor.py --window 3
+    python monitor.py depths.log --follow --every 1000
+"""
+
+import sys
+import time
+import argparse
+from typing import Iterator, TextIO
+
+from aoc import _parse_stream, monitor_depths
+
+
+def follow(f: TextIO, interval: float = 0.5) -> Iterator[str]:
+    """Yields complete lines from f forever, waiting for more to be written once it reaches the end, like `tail -f`."""
+
+    partial = ''
+    while True:
+        line = f.readline()
+        if not line:
+            time.sleep(interval)
+            continue
+
+        # A writer may be part way through a line, so hold on to it until the newline arrives.
+        partial += line
+        if partial.endswith('\n'):
+            yield partial
+            partial = ''
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Print running sonar depth increases as readings arrive.')
+    parser.add_argument('file', nargs='?', help='File of depths to read (default: stdin).')
+    parser.add_argument('--window', type=positive_int, default=1, help='Window size to sum readings over (default: 1).')
+    parser.add_argument('--every', type=positive_int, default=1, help='Only report every N readings (default: every reading).')
+    parser.add_argument('--follow', action='store_true', help='Keep waiting for new readings at the end of the file.')
+    args = parser.parse_args()
+
+    f = open(args.file, 'r', encoding='utf-8') if args.file else sys.stdin
+    lines = follow(f) if args.follow else f
+
+    count, upcount = 0, 0
+    try:
+        for count, (depth, increased, upcount) in enumerate(monitor_depths(_parse_stream(lines), args.window), 1):
+            if count % args.every == 0:
+                print(f'{count}\t{depth}\t{"increased" if increased else "-"}\t{upcount}', flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+    print(f'{count} readings, {upcount} increases with a window of {args.window}', file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
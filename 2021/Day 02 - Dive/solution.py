@@ -4,8 +4,9 @@ Author: Lewis Gallagher
 """
 
 import os
-from typing import List, Any
+from typing import Any, Iterable, Iterator, Tuple
 import time
+import numpy as np
 
 
 EXAMPLE_INPUT = '''\
@@ -20,40 +21,121 @@ forward 2
 EXAMPLE_OUTPUT_PART1 = 150
 EXAMPLE_OUTPUT_PART2 = 900
 
+# Commands are encoded by their first letter, which is all it takes to tell them apart.
+FORWARD, DOWN, UP = ord('f'), ord('d'), ord('u')
 
-def _parse_input(data: str) -> List[str]:
-    """Parse input text file into usable data structure."""
+# (opcodes, magnitudes) arrays.
+Commands = Tuple[np.ndarray, np.ndarray]
 
-    data = data.splitlines()
+# (aim, horizontal, depth) after running a block of commands from a standing start.
+Summary = Tuple[int, int, int]
 
-    return data
 
+def encode(text: str) -> Commands:
+    """
+    Encodes commands into parallel uint8 opcode and int64 magnitude arrays in bulk, with one split of the whole text
+    rather than one per line. Words alternate command, magnitude, and the opcode is a command's first byte.
+    Anything other than forward, down or up followed by an integer raises ValueError.
+    """
 
-def part_1_solution(data: List[str]) -> Any:
+    tokens = text.split()
+    commands, magnitudes = tokens[0::2], tokens[1::2]
+    if len(commands) != len(magnitudes):
+        raise ValueError(f'Found {len(commands)} commands but {len(magnitudes)} magnitudes')
+
+    words = np.array(commands, dtype=str)
+    unknown = ~np.isin(words, ('forward', 'down', 'up'))
+    if unknown.any():
+        raise ValueError(f'Unknown command {commands[int(np.argmax(unknown))]!r}')
+
+    # Casting to single byte strings keeps just the first letter of each command.
+    ops = words.astype('S1').view(np.uint8)
+
+    try:
+        mags = np.array(magnitudes, dtype=np.int64)
+    except ValueError as e:
+        raise ValueError(f'Bad magnitude in commands: {e}') from None
+
+    return ops, mags
+
+
+def _parse_input(data: str) -> Commands:
+    """Parse input text file into opcode and magnitude arrays."""
+
+    return encode(data)
+
+
+def _parse_stream(lines: Iterable[str], chunk_size: int = 1 << 20) -> Iterator[Commands]:
+    """Parse lines lazily into encoded chunks of chunk_size commands, which the solutions combine."""
+
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield encode('\n'.join(chunk))
+            chunk = []
+
+    if chunk:
+        yield encode('\n'.join(chunk))
+
+
+def summarise(data: Commands) -> Summary:
+    """
+    Runs a block of commands from aim 0 at the surface.
+    Aim is a running total of down minus up, and each forward move descends by the aim at that point.
+    """
+
+    ops, mags = data
+    if len(ops) == 0:
+        return 0, 0, 0
+
+    forward = ops == FORWARD
+    aim = np.cumsum(np.where(ops == DOWN, mags, 0) - np.where(ops == UP, mags, 0))
+
+    return int(aim[-1]), int(mags[forward].sum()), int((aim[forward] * mags[forward]).sum())
+
+
+def combine(first: Summary, second: Summary) -> Summary:
+    """
+    Summary of running first's commands then second's. Every forward move in second also descends by the aim first
+    finished with, so second's depth gains first's aim times its horizontal distance. That lets chunks of a stream be
+    summarised one at a time and combined in order.
+    """
+
+    aim_1, horizontal_1, depth_1 = first
+    aim_2, horizontal_2, depth_2 = second
+    return aim_1 + aim_2, horizontal_1 + horizontal_2, depth_1 + depth_2 + aim_1 * horizontal_2
+
+
+def reduce_chunks(chunks: Iterable[Commands]) -> Summary:
+    """Summarises each chunk and combines them in order, holding one chunk at a time."""
+
+    total = (0, 0, 0)
+    for chunk in chunks:
+        total = combine(total, summarise(chunk))
+    return total
+
+
+def part_1_solution(data: Commands) -> Any:
     """Compute solution to puzzle part 1.
     
     forward X increases the horizontal position by X units.
     down X increases the depth by X units.
     up X decreases the depth by X units."""
 
-    depth = 0
-    horizontal = 0
-
-    for i in data:
-        cmd, x = i.split()
-        x = int(x)       
+    # A stream of chunks from _parse_stream. Part 1's depth is part 2's aim.
+    if not isinstance(data, tuple):
+        aim, horizontal, _ = reduce_chunks(data)
+        return aim * horizontal
 
-        if cmd == 'down':
-            depth += x
-        elif cmd == 'up':
-            depth -= x
-        elif cmd == 'forward':
-            horizontal += x
+    ops, mags = data
+    horizontal = mags[ops == FORWARD].sum()
+    depth = mags[ops == DOWN].sum() - mags[ops == UP].sum()
 
-    return depth*horizontal
+    return int(depth * horizontal)
 
 
-def part_2_solution(data: List[str]) -> Any:
+def part_2_solution(data: Commands) -> Any:
     """Compute solution to puzzle part 2.
     
     down X increases your aim by X units.
@@ -61,24 +143,10 @@ def part_2_solution(data: List[str]) -> Any:
     forward X does two things:
         It increases your horizontal position by X units.
         It increases your depth by your aim multiplied by X."""
-    
-    aim = 0
-    depth = 0
-    horizontal = 0
 
-    for i in data:
-        cmd, x = i.split()
-        x = int(x)  
+    _, horizontal, depth = summarise(data) if isinstance(data, tuple) else reduce_chunks(data)
 
-        if cmd == 'down':
-            aim += x
-        elif cmd == 'up':
-            aim -= x
-        elif cmd == 'forward':
-            horizontal += x
-            depth += aim*x
-        
-    return depth*horizontal
+    return depth * horizontal
 
 
 if __name__ == "__main__":
@@ -90,17 +158,24 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART2
+
+    # And streaming in chunks of a few commands.
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines(), chunk_size=4)) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
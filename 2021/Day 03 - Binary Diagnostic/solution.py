@@ -4,9 +4,9 @@ Author: Lewis Gallagher
 """
 
 import os
-from typing import List, Any
+from typing import List, Any, Iterable, Tuple
 import time
-from collections import Counter
+from array import array
 import numpy as np
 
 
@@ -28,68 +28,199 @@ EXAMPLE_INPUT = '''\
 EXAMPLE_OUTPUT_PART1 = 198
 EXAMPLE_OUTPUT_PART2 = 230
 
+# Reports are packed into uint64, so this is the widest we can take.
+MAX_BITS = 64
 
-def _parse_input(data: str) -> List[str]:
-    """Parse input text file into usable data structure."""
+# (packed reports, number of bits per report)
+Reports = Tuple[np.ndarray, int]
 
-    data = [[int(x) for x in i] for i in data.splitlines()]
 
-    return data
+def _parse_input(data: str) -> Reports:
+    """
+    Parse input text file into one packed uint64 per report, along with the report width.
+    The width has to be kept as leading zeros are significant.
+    """
 
+    lines = data.split()
+    width = len(lines[0])
+    if width > MAX_BITS:
+        raise ValueError(f'Reports can be at most {MAX_BITS} bits, got {width}')
 
-def part_1_solution(data: List[str]) -> Any:
-    """Compute solution to puzzle part 1."""
-
-    data = np.transpose(data)
-
-    gamma = []
-    epsilon = []
+    # One row of 0/1 per report, most significant bit first, built from the raw bytes in one go.
+    bits = np.frombuffer(''.join(lines).encode('ascii'), dtype=np.uint8).reshape(len(lines), width) - ord('0')
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    reports = np.bitwise_or.reduce(bits.astype(np.uint64) << shifts, axis=1)
 
-    for i in range(len(data)):
-        c = Counter(data[i]).most_common(2)
+    return reports, width
 
-        g = c[0][0]
-        e = c[-1][0]
-        gamma.append(g)
-        epsilon.append(e)
-    
-    gamma = int(''.join(map(str, gamma)),2)
-    epsilon = int(''.join(map(str, epsilon)),2)
 
-    return gamma*epsilon
+def bit_counts(reports: np.ndarray, width: int) -> np.ndarray:
+    """Number of reports with each bit set, indexed by bit position (0 is the least significant)."""
 
+    shifts = np.arange(width, dtype=np.uint64)
+    return ((reports[:, None] >> shifts) & np.uint64(1)).sum(axis=0)
 
-def part_2_solution(data: List[str]) -> Any:
-    """Compute solution to puzzle part 2."""
 
-    data_o2 = data
-    data_co2 = data
+def rating(ordered: np.ndarray, width: int, most_common: bool) -> int:
+    """
+    Applies the bit criteria to sorted reports without copying them. The remaining reports are always a contiguous
+    range ordered[lo:hi] sharing the bits already chosen (prefix), and within that range those with the next bit
+    clear come first, so a single searchsorted finds where the ones start.
+    most_common keeps the most common bit (1 on a tie), otherwise the least common (0 on a tie).
+    """
 
-    # transpose data
-    data_t = np.transpose(data)
+    lo, hi = 0, len(ordered)
+    prefix = 0
 
-    for pos in range(len(data_t)):
+    for bit in reversed(range(width)):
+        if hi - lo == 1:
+            break
 
-        # Count values at each position as matrice are updated
-        o2_counter = Counter([x[pos] for x in data_o2])
-        co2_counter = Counter([x[pos] for x in data_co2])
+        split = lo + int(np.searchsorted(ordered[lo:hi], np.uint64(prefix | 1 << bit)))
+        zeros, ones = split - lo, hi - split
 
-        # Update matrices
-        if o2_counter[0] > o2_counter[1]:
-            data_o2 = [x for x in data_o2 if x[pos] == 0]
+        # If every report has the same bit, there's only one side to keep.
+        if zeros and ones:
+            keep_ones = ones >= zeros if most_common else ones < zeros
         else:
-            data_o2 = [x for x in data_o2 if x[pos] == 1]
-        
-        if co2_counter[0] > co2_counter[1]:
-            data_co2 = [x for x in data_co2 if x[pos] == 1]
+            keep_ones = ones > 0
+
+        if keep_ones:
+            lo = split
+            prefix |= 1 << bit
         else:
-            data_co2 = [x for x in data_co2 if x[pos] == 0]
+            hi = split
+
+    return int(ordered[lo])
+
+
+class ReportTrie:
+    """
+    Counted binary trie of reports, for when reports keep arriving and the ratings are needed after every batch.
+    Each node counts the reports below it, so the bit criteria walk reads counts rather than re-filtering reports,
+    and ones[depth] counts reports with that bit set for gamma and epsilon. Every operation is O(width).
+    Nodes live in flat arrays (children[2 * node + bit], counts[node]) rather than objects, with node 0 the root.
+    Removing a report only lowers counts, so its nodes are reused if it's inserted again.
+    """
+
+    def __init__(self, width: int, reports: Iterable[int] = ()) -> None:
+        if not 0 < width <= MAX_BITS:
+            raise ValueError(f'Reports must be 1 to {MAX_BITS} bits, got {width}')
+
+        self.width = width
+        self.children = array('l', [0, 0])  # 0 means no child, as the root is never anyone's child.
+        self.counts = array('l', [0])
+        self.ones = [0] * width  # Indexed by depth, so ones[0] is the most significant bit.
+
+        for report in reports:
+            self.insert(report)
+
+    def __len__(self) -> int:
+        return self.counts[0]
+
+    def __repr__(self) -> str:
+        return f"ReportTrie(width={self.width}, reports={len(self)}, nodes={len(self.counts)})"
+
+    def _bits(self, report: int) -> Iterable[int]:
+        """Bits of a report, most significant first."""
+
+        if not 0 <= report < 1 << self.width:
+            raise ValueError(f'{report} does not fit in {self.width} bits')
+        return ((report >> shift) & 1 for shift in range(self.width - 1, -1, -1))
+
+    def insert(self, report: int) -> None:
+        node = 0
+        self.counts[0] += 1
+
+        for depth, bit in enumerate(self._bits(report)):
+            child = self.children[2 * node + bit]
+            if not child:
+                child = len(self.counts)
+                self.children[2 * node + bit] = child
+                self.children.extend((0, 0))
+                self.counts.append(0)
+
+            self.counts[child] += 1
+            self.ones[depth] += bit
+            node = child
+
+    def remove(self, report: int) -> None:
+        """Removes one copy of report, raising KeyError if it isn't in the trie."""
+
+        # Walk first so a missing report leaves the counts untouched.
+        path = [0]
+        for bit in self._bits(report):
+            child = self.children[2 * path[-1] + bit]
+            if not child or not self.counts[child]:
+                raise KeyError(report)
+            path.append(child)
+
+        for node in path:
+            self.counts[node] -= 1
+        for depth, bit in enumerate(self._bits(report)):
+            self.ones[depth] -= bit
 
-        if data_o2:
-            o2 = int(''.join(map(str, data_o2[0])), 2)
-        if data_co2:
-            co2 = int(''.join(map(str, data_co2[0])), 2)
+    def rating(self, most_common: bool) -> int:
+        """
+        Follows the bit criteria down the trie.
+        most_common keeps the most common bit (1 on a tie), otherwise the least common (0 on a tie).
+        """
 
+        if not len(self):
+            raise ValueError('No reports to rate')
+
+        node, value = 0, 0
+        for _ in range(self.width):
+            zero, one = self.children[2 * node], self.children[2 * node + 1]
+            zeros = self.counts[zero] if zero else 0
+            ones = self.counts[one] if one else 0
+
+            # If every report has the same bit, there's only one side to keep.
+            if zeros and ones:
+                keep_ones = ones >= zeros if most_common else ones < zeros
+            else:
+                keep_ones = ones > 0
+
+            node = one if keep_ones else zero
+            value = value << 1 | keep_ones
+
+        return value
+
+    def gamma(self) -> int:
+        n = len(self)
+        return sum(1 << (self.width - 1 - depth) for depth, ones in enumerate(self.ones) if 2 * ones > n)
+
+    def epsilon(self) -> int:
+        return self.gamma() ^ ((1 << self.width) - 1)
+
+    def power_consumption(self) -> int:
+        return self.gamma() * self.epsilon()
+
+    def life_support(self) -> int:
+        return self.rating(most_common=True) * self.rating(most_common=False)
+
+
+def part_1_solution(data: Reports) -> Any:
+    """Compute solution to puzzle part 1."""
+
+    reports, width = data
+    ones = bit_counts(reports, width)
+
+    # Gamma takes the most common value of each bit and epsilon the least, so epsilon is gamma with every bit flipped.
+    gamma = sum(1 << bit for bit in range(width) if 2 * ones[bit] > len(reports))
+    epsilon = gamma ^ ((1 << width) - 1)
+
+    return gamma*epsilon
+
+
+def part_2_solution(data: Reports) -> Any:
+    """Compute solution to puzzle part 2."""
+
+    reports, width = data
+    ordered = np.sort(reports)
+
+    o2 = rating(ordered, width, most_common=True)
+    co2 = rating(ordered, width, most_common=False)
 
     return o2*co2
 
@@ -102,17 +233,26 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # The trie has to agree, including after reports are removed and added back.
+    reports, width = example_data
+    trie = ReportTrie(width, reports.tolist())
+    assert trie.power_consumption() == EXAMPLE_OUTPUT_PART1
+    assert trie.life_support() == EXAMPLE_OUTPUT_PART2
+    trie.remove(int(reports[0]))
+    trie.insert(int(reports[0]))
+    assert trie.life_support() == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
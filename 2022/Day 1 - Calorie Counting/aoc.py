@@ -2,8 +2,9 @@
 Solution for Advent of Code 2022 day 1 - https://adventofcode.com/2022/day/1
 """
 import os
-from typing import List, Any
-import timeit
+import heapq
+from typing import List, Any, Iterable, Iterator
+import time
 
 EXAMPLE_INPUT = '''\
 1000
@@ -25,17 +26,45 @@ EXAMPLE_OUTPUT_PART1 = 24000
 EXAMPLE_OUTPUT_PART2 = 45000
 
 
-def _parse_input(data: List[str]) -> List[str]:
-    """Parse input text file into usable data structure."""
-    return [[int(e) for e in elf.splitlines()] for elf in data.split("\n\n")]
+def _parse_input(data: str) -> List[int]:
+    """Parse input text file into the total calories carried by each elf."""
+    return [sum(int(e) for e in elf.split()) for elf in data.split("\n\n")]
 
-def part_1_solution(data: List[str]) -> Any:
+def _parse_stream(lines: Iterable[str]) -> Iterator[int]:
+    """Parse lines lazily into each elf's total."""
+    total = None
+    for line in lines:
+        line = line.strip()
+        if line:
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+
+    # The last elf isn't followed by a blank line.
+    if total is not None:
+        yield total
+
+def top_totals(totals: Iterable[int], k: int) -> List[int]:
+    """
+    The k largest totals, largest first, in a single pass.
+    Keeps a min-heap of the best k so far, so it's O(n log k) time and O(k) memory rather than sorting everything.
+    """
+    heap = []
+    for total in totals:
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+    return sorted(heap, reverse=True)
+
+def part_1_solution(data: Iterable[int]) -> Any:
     """Compute solution to puzzle part 1."""
-    return sorted([sum(elf) for elf in data])[-1]
+    return top_totals(data, 1)[0]
 
-def part_2_solution(data: List[str]) -> Any:
+def part_2_solution(data: Iterable[int]) -> Any:
     """Compute solution to puzzle part 2."""
-    return sum(sorted([sum(elf) for elf in data])[-3:])
+    return sum(top_totals(data, 3))
 
 if __name__ == "__main__":
     # Compute puzzle with example data.
@@ -45,11 +74,20 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
-    # Read puzzle input.
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
-        data = _parse_input(f.read())
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART2
+
+    # Stream the puzzle input straight from the file once, so the elves' totals are never all in memory.
+    # The top three totals answer both parts: part 1 is the largest of them.
+    input_path = os.path.join(os.path.dirname(__file__), "input.txt")
+
+    start_time = time.perf_counter()
+    with open(input_path, "r", encoding="utf-8") as f:
+        top_three = top_totals(_parse_stream(f), 3)
+    execution_time = (time.perf_counter() - start_time)
 
     # Print answers.
-    print(f'Part 1: { part_1_solution(data=data) }')
-    print(f'Part 2: { part_2_solution(data=data) }')
-    print(timeit.timeit())
\ No newline at end of file
+    print(f'Part 1: { part_1_solution(top_three) }')
+    print(f'Part 2: { part_2_solution(top_three) }')
+    print(f'Execution time (one pass for both parts): {execution_time:.4f}')
@@ -3,8 +3,11 @@ Solution for Advent of Code 2022 day 10 - https://adventofcode.com/2022/day/10
 """
 
 import os
-from typing import List, Any
-import timeit
+import math
+from array import array
+from typing import List, Any, Callable, Optional, Tuple
+import time
+import numpy as np
 
 
 EXAMPLE_INPUT = '''\
@@ -158,55 +161,174 @@ noop'''
 
 EXAMPLE_OUTPUT_PART1 = 13140
 
+EXAMPLE_OUTPUT_PART2 = '''\
+##..##..##..##..##..##..##..##..##..##..
+###...###...###...###...###...###...###.
+####....####....####....####....####....
+#####.....#####.....#####.....#####.....
+######......######......######......####
+#######.......#######.......#######.....'''
 
-def _parse_input(data: str) -> List[str]:
-    """Parse input text file into usable data structure."""
+# Opcodes, and how many cycles each one takes (indexed by opcode).
+NOOP, ADDX = 0, 1
+OPCODES = {'noop': NOOP, 'addx': ADDX}
+CYCLES = (1, 2)
 
-    return [i.split() for i in data.splitlines()]
+SCREEN_WIDTH = 40
+SCREEN_HEIGHT = 6
+SPRITE_WIDTH = 3
 
 
-def part_1_solution(data: List[str]) -> Any:
-    """Compute solution to puzzle part 1."""
-    
-    # Count cycles and initialise X signal value.
-    X = 1
-    signals = []
-
-    for action in data:        
-        # addx takes 2 cycles (range(2)) and updates X at the end.
-        if action[0] == 'addx':
-            for _ in range(2):
-                signals.append(X)
-            X += int(action[1])
-
-        # noop takes 1 cycle and doesn't alter X so append X as is.
-        elif action[0] == 'noop':
-            signals.append(X)
-        
-    # Return i-1 because cycles begin at 1.
-    return signals, sum([signals[i-1] * i for i in range(20,len(signals), 40)])
-
-
-def part_2_solution(data: List[str]) -> Any:
-    """Compute solution to puzzle part 2."""
+class Program:
+    """A program decoded once into parallel opcode and argument arrays (noop gets 0)."""
+
+    __slots__ = ('ops', 'args')
+
+    def __init__(self, ops: array, args: array) -> None:
+        self.ops = ops
+        self.args = args
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+
+def _parse_input(data: str) -> Program:
+    """Parse input text file into a decoded program."""
+
+    ops = array('B')
+    args = array('q')
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        name, *arg = line.split()
+        if name not in OPCODES:
+            raise ValueError(f'Unknown instruction {line!r}')
+        ops.append(OPCODES[name])
+        args.append(int(arg[0]) if arg else 0)
+
+    return Program(ops, args)
+
+
+class Machine:
+    """
+    Runs a decoded program on the X register. Hooks registered with `on_cycle` are called during the cycles they ask
+    for with the cycle number and the value of X during that cycle, so nothing has to keep a value per cycle.
+    """
+
+    __slots__ = ('program', 'x', 'cycle', 'hooks')
+
+    def __init__(self, program: Program) -> None:
+        self.program = program
+        self.x = 1
+        # Cycles completed so far.
+        self.cycle = 0
+        self.hooks = []
+
+    def on_cycle(self, callback: Callable[[int, int], None], start: int = 1, step: int = 1,
+                 stop: Optional[int] = None) -> None:
+        """Calls callback(cycle, x) during cycles start, start + step, ... up to stop (default: the end of the program)."""
+
+        if step < 1:
+            raise ValueError(f'Hook step must be at least 1, got {step}')
+        self.hooks.append([start, step, math.inf if stop is None else stop, callback])
+
+    def run(self) -> int:
+        """Runs the program to the end and returns the final value of X."""
+
+        x, cycle, hooks = self.x, self.cycle, self.hooks
+        cycles = CYCLES
+
+        for op, arg in zip(self.program.ops, self.program.args):
+            # Cycles cycle + 1 to end all happen while this instruction runs, so X holds its current value through them.
+            end = cycle + cycles[op]
+            for hook in hooks:
+                due, step, stop, callback = hook
+                while due <= end and due <= stop:
+                    callback(due, x)
+                    due += step
+                hook[0] = due
+
+            if op == ADDX:
+                x += arg
+            cycle = end
+
+        self.x, self.cycle = x, cycle
+        return x
+
 
-    # Get list of signals from part 1.
-    sprite_locs = part_1_solution(data)[0]
-    # Split signas into list of lists equal to size of screen.
-    sprite_locs = [sprite_locs[i:i + 40] for i in range(0, len(sprite_locs), 40)]
-    # Make empty screen filled with '.'.
-    screen = [[ '.' for _ in range(40)] for j in range(6)]
+def run_device(program: Program, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT,
+               sprite_width: int = SPRITE_WIDTH) -> Tuple[int, List[List[str]]]:
+    """Runs the program once with a signal strength sampler and a CRT attached, returning both parts' answers."""
 
-    for i in range(len(sprite_locs)):
-        for j in range(len(sprite_locs[i])):
-            # Make sprite range
-            sprite_pos = [sprite_locs[i][j]-1, sprite_locs[i][j], sprite_locs[i][j]+1]
+    machine = Machine(program)
 
-            # If the pixel being drawn by the screen is within the sprite range then fill pixel.
-            if j in sprite_pos:
-                screen[i][j] = '#'
+    # Signal strength is sampled during the 20th cycle and every 40 cycles after that.
+    strengths = [0]
+    def sample(cycle: int, x: int) -> None:
+        strengths[0] += cycle * x
+    machine.on_cycle(sample, start=20, step=40)
 
-    return screen
+    # The CRT draws one pixel per cycle, left to right and then top to bottom. It's lit if the sprite, centred on X
+    # (left of centre for even widths), covers it.
+    screen = [['.' for _ in range(width)] for _ in range(height)]
+    left = (sprite_width - 1) // 2
+    def draw(cycle: int, x: int) -> None:
+        row, col = divmod(cycle - 1, width)
+        if 0 <= col - x + left < sprite_width:
+            screen[row][col] = '#'
+    machine.on_cycle(draw, stop=width * height)
+
+    machine.run()
+    return strengths[0], screen
+
+
+def x_trace(program: Program) -> np.ndarray:
+    """
+    Value of X during every cycle as one array. X during an instruction is 1 plus the sum of the addx arguments before it,
+    i.e. an exclusive cumsum, and np.repeat stretches that over the instruction's 1 or 2 cycles.
+    """
+
+    ops = np.frombuffer(program.ops, dtype=np.uint8)
+    args = np.frombuffer(program.args, dtype=np.int64)
+    during = 1 + np.cumsum(args) - args
+    return np.repeat(during, np.asarray(CYCLES)[ops])
+
+
+def render(trace: np.ndarray, width: int = SCREEN_WIDTH, height: Optional[int] = None,
+           sprite_width: int = SPRITE_WIDTH) -> np.ndarray:
+    """
+    Boolean (height, width) screen drawn from an X trace, with every pixel tested in one broadcast comparison.
+    height defaults to as many rows as the trace fills. Cycles past the end of the screen aren't drawn, and pixels
+    after the end of the trace stay dark.
+    """
+
+    if height is None:
+        height = -(-len(trace) // width)
+
+    # Cycles without a trace get an X far enough left that the sprite never covers column 0.
+    xs = np.full(width * height, -sprite_width - 1, dtype=np.int64)
+    drawn = min(len(trace), xs.size)
+    xs[:drawn] = trace[:drawn]
+
+    offsets = np.arange(width) - xs.reshape(height, width) + (sprite_width - 1) // 2
+    return (offsets >= 0) & (offsets < sprite_width)
+
+
+def show(screen: np.ndarray) -> str:
+    """Lines of '#' for lit pixels and '.' for dark ones."""
+
+    pixels = np.where(screen, np.uint8(ord('#')), np.uint8(ord('.')))
+    return '\n'.join(row.tobytes().decode('ascii') for row in pixels)
+
+
+def part_1_solution(data: Program) -> Any:
+    """Compute solution to puzzle part 1."""
+    return run_device(data)[0]
+
+
+def part_2_solution(data: Program) -> Any:
+    """Compute solution to puzzle part 2."""
+    return show(render(x_trace(data), SCREEN_WIDTH, SCREEN_HEIGHT))
 
 
 if __name__ == "__main__":
@@ -214,13 +336,23 @@ if __name__ == "__main__":
     example_data = _parse_input(EXAMPLE_INPUT)
 
     # Assert the example input results are as expected.
-    assert part_1_solution(example_data)[1] == EXAMPLE_OUTPUT_PART1
+    assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
+
+    # The register machine's CRT hook must draw the same screen.
+    assert '\n'.join(''.join(row) for row in run_device(example_data)[1]) == EXAMPLE_OUTPUT_PART2
 
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
-    # # Print answers
-    print(f'Part 1: { part_1_solution(data=data)[1] }')
-    print(f'Part 2: { part_2_solution(data=data) }')
-    print(timeit.timeit())
\ No newline at end of file
+    # Print answers
+    start_time_1 = time.perf_counter()
+    print(f'Part 1: { part_1_solution(data=data) }')
+    execution_time_1 = (time.perf_counter() - start_time_1)
+    print(f'Part 1 execution time: {execution_time_1:.4f}')
+
+    start_time_2 = time.perf_counter()
+    print(f'Part 2:\n{ part_2_solution(data=data) }')
+    execution_time_2 = (time.perf_counter() - start_time_2)
+    print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -5,7 +5,7 @@ Author - Lewis Gallagher
 
 from __future__ import annotations
 import os
-from typing import List, Dict
+from typing import List, Callable, Optional, Tuple
 import time
 from collections import deque
 import re
@@ -45,89 +45,126 @@ Monkey 3:
 EXAMPLE_OUTPUT_PART1 = 10605
 EXAMPLE_OUTPUT_PART2 = 2713310158
 
+# Following an item costs about twice as much per round as playing it. An item that hasn't repeated within this
+# fraction of the rounds is given up on and the rounds are played out instead, which wastes at most a fifth of the
+# time play takes. Short games still follow items for a while, as that costs little and play can't skip any rounds.
+CYCLE_SEARCH_FRACTION = 10
+MIN_CYCLE_ROUNDS = 1000
+
+
+def compile_operation(operation: List[str]) -> Callable[[int], int]:
+    """
+    Turns a parsed operation such as ['*', '19'] or ['+', 'old'] into a function of the old worry level, once,
+    so inspecting an item doesn't have to look at the operation's text again.
+    """
+
+    operator, operand = operation
+    if operator not in ('*', '+'):
+        raise ValueError(f'Unknown operation {" ".join(operation)!r}')
+
+    if operand == 'old':
+        return (lambda old: old * old) if operator == '*' else (lambda old: old + old)
+
+    value = int(operand)
+    return (lambda old: old * value) if operator == '*' else (lambda old: old + value)
+
 
 class Monkey:
     """
     The Monkey class possesses many attributes.
     current_items represents the all the items a monkey has and their worry levles.
-    operation represents how the worry level of each item should change upon inspection.
+    operation represents how the worry level of each item should change upon inspection, and apply is that
+    operation compiled into a function.
     """
-    def __init__(self, monkey_num: int, current_items: List[int], operation: str, divisor: int, true_idx: int, false_idx: int) -> None:
+
+    __slots__ = ('monkey_num', 'current_items', 'operation', 'apply', 'divisor', 'true_idx', 'false_idx', 'inspected_count')
+
+    def __init__(self, monkey_num: int, current_items: List[int], operation: List[str], divisor: int, true_idx: int, false_idx: int) -> None:
         self.monkey_num = monkey_num # E.g. 0
         self.current_items = current_items # E.g. [11,65,75]
         self.operation = operation # E.g. ['*', '8']
+        self.apply = compile_operation(operation) # E.g. lambda old: old * 8
         self.divisor = divisor # E.g. 23
         self.true_idx = true_idx # E.g. 1
         self.false_idx = false_idx # E.g. 2
         self.inspected_count = 0 # Start at zero
-    
+
     def __repr__(self) -> str:
         return f"Monkey:(id={self.monkey_num}, items={self.current_items}, inspect_count={self.inspected_count})"
 
+    def __getstate__(self):
+        # Lambdas can't be pickled, so leave apply out and compile it again on the way back in.
+        return {name: getattr(self, name) for name in self.__slots__ if name != 'apply'}
+
+    def __setstate__(self, state) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.apply = compile_operation(self.operation)
 
     def inspect_item(self, releif=True, lcm=None) -> int:
         """Inspects the next item in a Monkey's item list. 
         Inspecting causes our worry level to go up, before it is divided by three and rounded down. 
         Then we test who to throw to, by dividing by a divisor."""
 
-        # Find if the operation is multiplication or addition and compute operation accordingly:
-        # new = old * int
-        # new = old + int
-        # new = old * old
-        # new = old + old
-
-        try:
-            if self.operation[0] == '*' and self.operation[1] == 'old':
-                self.current_items[0] = self.current_items[0]**2
-
-            elif self.operation[0] == '*' and self.operation[1].isnumeric():
-                self.current_items[0] = self.current_items[0] * int(self.operation[1])
-
-            elif self.operation[0] == '+' and self.operation[1] == 'old':
-                self.current_items[0] = self.current_items[0] + self.current_items[0]
-
-            elif self.operation[0] == '+' and self.operation[1].isnumeric():
-                self.current_items[0] = self.current_items[0] + int(self.operation[1])
-
-        except ValueError:
-            print('Operation could not be completed.')
+        worry = self.apply(self.current_items[0])
 
         # Reduce our worry level using releif or lcm.
         if releif:
-            self.current_items[0] = self.current_items[0] // 3
+            worry //= 3
         if lcm:
-            self.current_items[0] %= lcm
+            worry %= lcm
+        self.current_items[0] = worry
 
         # Increment inspected counter.
         self.inspected_count += 1
- 
+
         # Return an int representing which monkey to throw to.
-        if self.current_items[0] % self.divisor == 0:
+        if worry % self.divisor == 0:
             return self.true_idx    
         else:
             return self.false_idx
 
-
     def add_item(self, item: int):
         """Receives an item and appends it to end of monkey's item list."""
         self.current_items.append(item)
 
-
     def give_item(self, other: Monkey) -> int:
         """Adds current item to the item list of a monkey while removing from the list of the current monkey."""
         other.add_item(self.current_items.popleft())        
 
+    def take_turn(self, monkeys: List[Monkey], releif: bool = True, lcm: Optional[int] = None) -> None:
+        """
+        Inspects and throws every item the monkey is holding. Does the same as inspect_item and give_item for each item,
+        but with everything looked up once per turn rather than once per item.
+        """
+
+        items = self.current_items
+        apply, divisor = self.apply, self.divisor
+        if_true = monkeys[self.true_idx].current_items
+        if_false = monkeys[self.false_idx].current_items
+
+        for worry in items:
+            worry = apply(worry)
+            if releif:
+                worry //= 3
+            if lcm:
+                worry %= lcm
+            (if_false if worry % divisor else if_true).append(worry)
 
-def get_lcm(monkey_dict: Dict[int, Monkey]):
+        self.inspected_count += len(items)
+        items.clear()
+
+
+def get_lcm(monkeys: List[Monkey]):
     """Copmutes lowest common multiple of all divisors. Because all divisors are prime numbers this equals the product of them all."""
-    return math.lcm(*[monkey.divisor for monkey in monkey_dict.values()])
+    return math.lcm(*[monkey.divisor for monkey in monkeys])
 
 
-def _parse_input(data: str) -> List[str]:
+def _parse_input(data: str) -> List[Monkey]:
     """
     Reads the input data into a list of lists, where each sublist represents a monkey.
     Then regex out all the relevant numbers and create a Monkey class object.
-    Append Monkey object to a dictionairy of Monkeys where the keys are the monkey_num.
+    Returns the Monkeys in a list indexed by monkey_num, so throws can go straight to the target monkey.
     """
 
     monkey_dict = dict()
@@ -135,7 +172,7 @@ def _parse_input(data: str) -> List[str]:
     monkey_list = [[monkey.strip() for monkey in monkies.split('\n')] for monkies in data.strip().split('\n\n')]
 
     for monkey in monkey_list:
-        monkey_number = re.findall(r"^\s*Monkey (\d)", monkey[0])[0]
+        monkey_number = re.findall(r"^\s*Monkey (\d+)", monkey[0])[0]
         starting_items = re.findall(r"^\s*Starting items: (\d+.*)", monkey[1])
         operation = re.findall(r"^\s*Operation: new = old ([+*] .+)", monkey[2])
         divisor = re.findall(r"^\s*Test: divisible by (\d*)", monkey[3])[0]
@@ -155,41 +192,137 @@ def _parse_input(data: str) -> List[str]:
             false_idx = int(test_false_throw)
         )
 
-        monkey_dict[monkey_number] = monkey
+        monkey_dict[monkey.monkey_num] = monkey
 
-    return monkey_dict
+    if sorted(monkey_dict) != list(range(len(monkey_dict))):
+        raise ValueError(f'Monkeys must be numbered 0 to {len(monkey_dict) - 1}, got {sorted(monkey_dict)}')
 
+    for monkey in monkey_dict.values():
+        if not (0 <= monkey.true_idx < len(monkey_dict) and 0 <= monkey.false_idx < len(monkey_dict)):
+            raise ValueError(f'Monkey {monkey.monkey_num} throws to a monkey that does not exist')
 
-def part_1_solution(monkey_dict: Dict[int, Monkey]) -> int:
-    """Compute solution to puzzle part 1."""
+    return [monkey_dict[num] for num in range(len(monkey_dict))]
 
-    # 20 rounds of play.
-    rounds_to_play = 20
 
-    for _ in range(1, rounds_to_play+1):
-        for monkey in monkey_dict.values(): # Iterator through monkeys in order.
-            while monkey.current_items: # Monkey inspects and throws until it has no more items.
-                to_monkey = list(monkey_dict.values())[monkey.inspect_item()] # Find which monkey to throw to.
-                monkey.give_item(to_monkey) # Throw to the chosen monkey.
+def play(monkeys: List[Monkey], rounds_to_play: int, releif: bool = True) -> int:
+    """
+    Plays the rounds and returns monkey business. i.e. the total of two highest inspection_counts multiplied together.
+    Without relief, worry levels are kept mod the lcm of the divisors, which leaves every divisibility test unchanged.
+    """
+
+    lcm = None if releif else get_lcm(monkeys)
+
+    for _ in range(rounds_to_play):
+        for monkey in monkeys: # Iterator through monkeys in order.
+            monkey.take_turn(monkeys, releif, lcm)
+
+    return math.prod(sorted(monkey.inspected_count for monkey in monkeys)[-2:])
+
+
+def item_rounds(monkeys: List[Monkey], worry: int, holder: int, rounds_to_play: int, releif: bool = True,
+                lcm: Optional[int] = None, max_rounds: Optional[int] = None) -> Tuple[List[Tuple[int, ...]], Optional[int]]:
+    """
+    Follows one item on its own, round by round. An item's path doesn't depend on any other item, so its
+    (worry level, holder) at the start of a round decides every round after it.
+    Returns the monkeys that inspected it in each round, stopping when that state repeats or after rounds_to_play
+    (or max_rounds) rounds, and the round the repeating cycle starts in (None if it didn't repeat).
+    """
+
+    seen = {}
+    rounds = []
+    state = (worry, holder)
+    limit = rounds_to_play if max_rounds is None else min(rounds_to_play, max_rounds)
+
+    while len(rounds) < limit:
+        if state in seen:
+            return rounds, seen[state]
+        seen[state] = len(rounds)
+
+        worry, holder = state
+        inspected = []
+        while True:
+            monkey = monkeys[holder]
+            inspected.append(holder)
+            worry = monkey.apply(worry)
+            if releif:
+                worry //= 3
+            if lcm:
+                worry %= lcm
+            target = monkey.true_idx if worry % monkey.divisor == 0 else monkey.false_idx
+
+            # Monkeys take their turns in order, so an item thrown to a later monkey is inspected again this round.
+            # Thrown to an earlier one, it waits for the next round.
+            earlier = target < holder
+            holder = target
+            if earlier:
+                break
+
+        rounds.append(tuple(inspected))
+        state = (worry, holder)
+
+    return rounds, None
+
+
+def inspection_counts(monkeys: List[Monkey], rounds_to_play: int, releif: bool = True,
+                      max_rounds: Optional[int] = None) -> Optional[List[int]]:
+    """
+    How many items each monkey inspects over rounds_to_play rounds, without playing them out. Each item is followed
+    until its state repeats, and the rounds after that are whole cycles plus a partial one. Without relief the state
+    is kept mod the lcm, so there are only so many and it always repeats, making a billion rounds cost the same as ten
+    thousand. Doesn't change the monkeys.
+    Returns None if an item hasn't repeated after max_rounds rounds, as its cycle may be too long for following it to
+    beat playing the rounds. max_rounds defaults to a tenth of rounds_to_play (see CYCLE_SEARCH_FRACTION) but at
+    least MIN_CYCLE_ROUNDS, so longer games allow longer cycles. An item's states are all held while it's followed,
+    so memory grows with the length of its cycle.
+    """
 
-    # Return monkey business. i.e. the total of two highest inspection_counts multiplied together.
-    return math.prod(sorted(monkey.inspected_count for monkey in monkey_dict.values())[-2:])
+    lcm = None if releif else get_lcm(monkeys)
+    if max_rounds is None:
+        max_rounds = max(MIN_CYCLE_ROUNDS, rounds_to_play // CYCLE_SEARCH_FRACTION)
+    counts = [0] * len(monkeys)
 
+    for monkey in monkeys:
+        for worry in monkey.current_items:
+            rounds, cycle_start = item_rounds(monkeys, worry, monkey.monkey_num, rounds_to_play, releif, lcm, max_rounds)
 
-def part_2_solution(monkey_dict: Dict[int, Monkey]) -> int:
+            if cycle_start is None:
+                if len(rounds) < rounds_to_play:
+                    return None
+                for inspected in rounds:
+                    for num in inspected:
+                        counts[num] += 1
+                continue
+
+            cycle = rounds[cycle_start:]
+            whole_cycles, partial = divmod(rounds_to_play - cycle_start, len(cycle))
+            for inspected in rounds[:cycle_start] + cycle[:partial]:
+                for num in inspected:
+                    counts[num] += 1
+            for inspected in cycle:
+                for num in inspected:
+                    counts[num] += whole_cycles
+
+    return counts
+
+
+def part_1_solution(monkeys: List[Monkey]) -> int:
+    """Compute solution to puzzle part 1."""
+
+    # 20 rounds of play.
+    return play(monkeys, 20)
+
+
+def part_2_solution(monkeys: List[Monkey]) -> int:
     """Compute solution to puzzle part 2."""
 
-    # 10000 rounds of play.
-    rounds_to_play = 10000
-    
-    for _ in range(1, rounds_to_play+1):
-        for monkey in monkey_dict.values(): # Iterator through monkeys in order.
-            while monkey.current_items: # Monkey inspects and throws until it has no more items.
-                to_monkey = list(monkey_dict.values())[monkey.inspect_item(releif=False, lcm=get_lcm(monkey_dict))] # Find which monkey to throw to using lcm mod.
-                monkey.give_item(to_monkey) # Throw to the chosen monkey.
+    # 10000 rounds of play, with no relief. Items are followed one at a time until they cycle rather than played out.
+    counts = inspection_counts(monkeys, 10000, releif=False)
 
-    # Return monkey business. i.e. the total of two highest inspection_counts multiplied together.
-    return math.prod(sorted(monkey.inspected_count for monkey in monkey_dict.values())[-2:])
+    # Some item's cycle is too long to find, so play the rounds out.
+    if counts is None:
+        return play(monkeys, 10000, releif=False)
+
+    return math.prod(sorted(counts)[-2:])
 
 
 if __name__ == "__main__":
@@ -200,17 +333,26 @@ if __name__ == "__main__":
     assert part_1_solution(deepcopy(example_data)) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(deepcopy(example_data)) == EXAMPLE_OUTPUT_PART2
 
+    # Following each item to its cycle must count the same inspections as playing every round.
+    for rounds_to_play, releif in ((20, True), (10000, False)):
+        played = deepcopy(example_data)
+        play(played, rounds_to_play, releif)
+        assert inspection_counts(example_data, rounds_to_play, releif) == [monkey.inspected_count for monkey in played]
+
+    # Giving up on the cycles falls back to playing the rounds out.
+    assert inspection_counts(example_data, 10000, releif=False, max_rounds=1) is None
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers.
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'Part 1: { part_1_solution(deepcopy(data)) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print('Part 1 execution time: ' + str(execution_time_1))
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'Part 2: { part_2_solution(deepcopy(data)) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print('Part 2 execution time: ' + str(execution_time_2))
\ No newline at end of file
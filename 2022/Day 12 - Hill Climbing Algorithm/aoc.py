@@ -6,6 +6,10 @@ Author: Lewis Gallagher
 import os
 from typing import List, Any
 import time
+import numpy as np
+
+from aoc_utils.grid import Grid
+from aoc_utils.search import bfs_levels, grid_edges
 
 
 EXAMPLE_INPUT = '''\
@@ -15,46 +19,71 @@ accszExk
 acctuvwj
 abdefghi'''
 
-EXAMPLE_OUTPUT_PART1 = 0
-EXAMPLE_OUTPUT_PART2 = 0
+EXAMPLE_OUTPUT_PART1 = 31
+EXAMPLE_OUTPUT_PART2 = 29
+
+
+def _parse_input(data: str) -> Grid:
+    """Parse input text file into a height map."""
+
+    return Grid.from_text(data)
+
 
+def heights(data: Grid) -> Grid:
+    """Height map with the start marked as a and the end as z."""
 
-def _parse_input(data: str) -> List[str]:
-    """Parse input text file into usable data structure."""
+    heights = data.copy()
+    heights[data.mask('S')] = 'a'
+    heights[data.mask('E')] = 'z'
+    return heights
 
-    return [[i for i in row] for row in data.splitlines()]
 
+def can_climb(current: np.ndarray, step: np.ndarray) -> np.ndarray:
+    """The next square can be at most one higher, but any amount lower. Checks every pair of squares at once."""
+    return step - current <= 1
 
-def part_1_solution(data: List[str]) -> Any:
+
+def part_1_solution(data: Grid) -> Any:
     """Compute solution to puzzle part 1."""
 
-    return 0
+    start = data.to_index(*data.find('S'))
+    end = data.to_index(*data.find('E'))
+
+    result = bfs_levels(data.size, [start], grid_edges(heights(data), can_climb), goal=end)
+    return result.distance
 
 
-def part_2_solution(data: List[str]) -> Any:
+def part_2_solution(data: Grid) -> Any:
     """Compute solution to puzzle part 2."""
-    return 0
+
+    grid = heights(data)
+    end = data.to_index(*data.find('E'))
+
+    # Search from every a at once. The first time E is reached is the shortest path from any of them.
+    starts = np.flatnonzero(grid.flat == ord('a'))
+
+    result = bfs_levels(grid.size, starts, grid_edges(grid, can_climb), goal=end)
+    return result.distance
 
 
 if __name__ == "__main__":
     # Compute puzzle with example data
     example_data = _parse_input(EXAMPLE_INPUT)
-    print(example_data)
     # Assert the example input results are as expected.
-    # assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
-    # assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
+    assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
     # Read puzzle input.
     # with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
     #     data = _parse_input(f.read())
 
     # # Print answers
-    # start_time_1 = time.time()
+    # start_time_1 = time.perf_counter()
     # print(f'Part 1: { part_1_solution(data) }')
-    # execution_time_1 = (time.time() - start_time_1)
+    # execution_time_1 = (time.perf_counter() - start_time_1)
     # print('Part 1 execution time: ' + str(execution_time_1))
 
-    # start_time_2 = time.time()
+    # start_time_2 = time.perf_counter()
     # print(f'Part 2: { part_2_solution(data) }')
-    # execution_time_2 = (time.time() - start_time_2)
+    # execution_time_2 = (time.perf_counter() - start_time_2)
     # print('Part 2 execution time: ' + str(execution_time_2))
\ No newline at end of file
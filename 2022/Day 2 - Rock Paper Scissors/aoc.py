@@ -3,8 +3,10 @@ Solution for Advent of Code 2022 day 2 - https://adventofcode.com/2022/day/2
 """
 
 import os
-from typing import List, Any
+import mmap
+from typing import List, Any, Iterable, Iterator, Tuple, Union
 import time
+import numpy as np
 
 
 EXAMPLE_INPUT = '''\
@@ -15,51 +17,137 @@ C Z'''
 EXAMPLE_OUTPUT_PART1 = 15
 EXAMPLE_OUTPUT_PART2 = 12
 
+# Create dict for my moves.
+SCORES = {'X':1, 'Y':2, 'Z':3}
 
+# All possible outcomes (0=loss, 3=draw, 6=win).
+OUTCOMES = {
+    'A':{'X':3, 'Y':6, 'Z':0}, # Rock
+    'B':{'X':0, 'Y':3, 'Z':6}, # Paper
+    'C':{'X':6, 'Y':0, 'Z':3}, # Scissors
+    }
 
+# Part 2: dict for instructions (lose/draw/win)
+INSTRUCTIONS = {'X':0, 'Y':3, 'Z':6}
 
-def _parse_input(data: List[str]) -> List[str]:
-    """Parse input text file into usable data structure."""
+# What to play to get each outcome now that X=lose, Y=draw, Z=win (0=loss, 3=draw, 6=win).
+RESPONSES = {
+    'A':{0:'Z', 3:'X', 6:'Y'}, # Rock
+    'B':{0:'X', 3:'Y', 6:'Z'}, # Paper
+    'C':{0:'Y', 3:'Z', 6:'X'}, # Scissors
+    }
 
-    game = [[i for i in round.split()] for round in data.splitlines()]
-    return game
+# There are only 9 distinct rounds. Index them by (opponent - 'A') * 3 + (column 2 - 'X'), and score each once per part.
+ROUNDS = [(them, col) for them in 'ABC' for col in 'XYZ']
+SCORE_1 = np.array([SCORES[col] + OUTCOMES[them][col] for them, col in ROUNDS], dtype=np.int64)
+SCORE_2 = np.array([INSTRUCTIONS[col] + SCORES[RESPONSES[them][INSTRUCTIONS[col]]] for them, col in ROUNDS], dtype=np.int64)
 
+# Large files are counted this many bytes at a time, so the temporary arrays stay small.
+CHUNK_BYTES = 1 << 26
 
-def part_1_solution(data: List[str]) -> Any:
-    """Compute solution to puzzle part 1."""
-    
-    # Create dict for my moves.
-    scores = {'X':1, 'Y':2, 'Z':3}
 
-    # All possible outcomes (0=loss, 3=draw, 6=win).
-    outcomes = {
-        'A':{'X':3, 'Y':6, 'Z':0}, # Rock
-        'B':{'X':0, 'Y':3, 'Z':6}, # Paper
-        'C':{'X':6, 'Y':0, 'Z':3}, # Scissors
-        }
+def count_rounds(buffer: Union[bytes, memoryview, mmap.mmap]) -> np.ndarray:
+    """
+    Counts how many times each of the 9 rounds appears in raw input bytes, without splitting lines.
+    Every round is 4 bytes ("A Y\n"), so once carriage returns and trailing newlines are dropped the bytes reshape
+    into one row per line. A line that doesn't fit that layout raises ValueError rather than shifting every later round.
+    """
 
-    return sum([scores[play[1]] + outcomes[play[0]][play[1]] for play in data])
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    raw = raw[raw != ord('\r')]
+    end = len(raw)
+    while end and raw[end - 1] == ord('\n'):
+        end -= 1
+    if end == 0:
+        return np.zeros(9, dtype=np.int64)
 
+    # Put back one newline to end the last line, and pad a short last line with zeros so it fails the checks below.
+    rows = np.zeros(-(-(end + 1) // 4) * 4, dtype=np.uint8)
+    rows[:end] = raw[:end]
+    rows[end] = ord('\n')
+    rows = rows.reshape(-1, 4)
 
-def part_2_solution(data: List[str]) -> Any:
-    """Compute solution to puzzle part 2.
-    Now the second column tells us what outcome we need, not what to play. X=loss, Y=draw, Z=win.
+    them = rows[:, 0].astype(np.int64) - ord('A')
+    us = rows[:, 2].astype(np.int64) - ord('X')
+    valid = (them >= 0) & (them < 3) & (rows[:, 1] == ord(' ')) & (us >= 0) & (us < 3) & (rows[:, 3] == ord('\n'))
+    if not valid.all():
+        raise ValueError(f'Round {int(np.argmin(valid)) + 1} is not an opponent move (A-C), a space and a response (X-Z)')
+
+    return np.bincount(them * 3 + us, minlength=9)
+
+
+def score(counts: np.ndarray) -> Tuple[int, int]:
+    """Both parts' total scores from the round counts."""
+
+    return int(counts @ SCORE_1), int(counts @ SCORE_2)
+
+
+def count_file(path: str) -> np.ndarray:
+    """
+    Counts the rounds in a file through a memory map, a chunk at a time, so tournaments bigger than memory work.
+    Chunks end on a newline so no round is split between two of them.
     """
 
-    # Create dict for my moves (same as part 1).   
-    scores = {'X':1, 'Y':2, 'Z':3}
+    counts = np.zeros(9, dtype=np.int64)
+
+    # An empty file can't be memory mapped, and has no rounds anyway.
+    if os.path.getsize(path) == 0:
+        return counts
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < len(mm):
+            end = len(mm) if start + CHUNK_BYTES >= len(mm) else mm.rfind(b'\n', start, start + CHUNK_BYTES) + 1
+            if end <= start:
+                end = len(mm)
+            with memoryview(mm)[start:end] as chunk:
+                counts += count_rounds(chunk)
+            start = end
+
+    return counts
+
+
+def _parse_input(data: str) -> np.ndarray:
+    """Parse input text file into the number of times each round is played."""
+
+    return count_rounds(data.encode('ascii'))
 
-    # Dict for instructions (lose/draw/win)
-    instructions = {'X':0, 'Y':3, 'Z':6}
 
-    # All possible outcomes now that X=win, Y=draw, Z=win (0=loss, 3=draw, 6=win).
-    outcomes = {
-        'A':{0:'Z', 3:'X', 6:'Y'}, # Rock
-        'B':{0:'X', 3:'Y', 6:'Z'}, # Paper
-        'C':{0:'Y', 3:'Z', 6:'X'}, # Scissors
-        }
+def _parse_stream(lines: Iterable[str], chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+    """Parse lines lazily into round counts, one array per chunk_size lines."""
 
-    return sum([instructions.get(play[1]) + scores[outcomes[play[0]][instructions.get(play[1])]] for play in data])
+    chunk = []
+    for line in lines:
+        # Lines may or may not still have their newline (e.g. from a file or splitlines).
+        chunk.append(line.rstrip('\r\n'))
+        if len(chunk) == chunk_size:
+            yield count_rounds('\n'.join(chunk).encode('ascii'))
+            chunk = []
+
+    if chunk:
+        yield count_rounds('\n'.join(chunk).encode('ascii'))
+
+
+def _total_counts(data: Union[np.ndarray, Iterable[np.ndarray]]) -> np.ndarray:
+    """Round counts from _parse_input, or the sum of the chunks from _parse_stream."""
+
+    if isinstance(data, np.ndarray):
+        return data
+    return sum(data, np.zeros(9, dtype=np.int64))
+
+
+def part_1_solution(data: np.ndarray) -> Any:
+    """Compute solution to puzzle part 1."""
+
+    return int(_total_counts(data) @ SCORE_1)
+
+
+def part_2_solution(data: np.ndarray) -> Any:
+    """Compute solution to puzzle part 2.
+    Now the second column tells us what outcome we need, not what to play. X=loss, Y=draw, Z=win.
+    """
+
+    return int(_total_counts(data) @ SCORE_2)
 
 
 if __name__ == "__main__":
@@ -70,18 +158,25 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
+    input_path = os.path.join(os.path.dirname(__file__), "input.txt")
+    with open(input_path, "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
+    # Both parts come from one pass over the memory mapped file too.
+    assert score(count_file(input_path)) == (part_1_solution(data), part_2_solution(data))
+
     # Print answers
-    # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
-    print(f'Part 2 execution time: {execution_time_1:.4f}')
\ No newline at end of file
+    execution_time_2 = (time.perf_counter() - start_time_2)
+    print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
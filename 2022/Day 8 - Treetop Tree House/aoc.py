@@ -3,9 +3,12 @@ Solution for Advent of Code 2022 day 8 - https://adventofcode.com/2022/day/8
 """
 
 import os
-from typing import List
+import tempfile
+from typing import List, Callable, Iterator, Optional, Tuple
 import numpy as np
-import timeit
+import time
+
+from aoc_utils.grid import Grid
 
 
 EXAMPLE_INPUT = '''\
@@ -19,81 +22,227 @@ EXAMPLE_OUTPUT_PART1 = 21
 EXAMPLE_OUTPUT_PART2 = 8
 
 
-def _parse_input(data: str) -> List[int]:
-    """Parse input text file into list of lists."""
-    data = [[int(d) for d in row] for row in data.splitlines()]
+def _parse_input(data: str) -> Grid:
+    """Parse input text file into a grid of tree heights. Heights are stored as their ASCII digits, which sort the same."""
+    return Grid.from_text(data)
+
+
+# Heights are single digits.
+HEIGHTS = 10
+
+ZERO = np.uint8(ord('0'))
+
+# Bytes of forest the tiled solvers hold in memory at once.
+TILE_BYTES = 1 << 24
+
+
+def heights(data: Grid) -> np.ndarray:
+    """uint8 array of the tree heights (0-9)."""
+    return data.cells - ZERO
+
+
+def visible_from_top(trees: np.ndarray, above: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Boolean array of the trees visible looking down from the top edge, i.e. taller than every tree above them.
+    The running maximum down each column is what a tree has to beat, so one accumulate covers the whole grid.
+    above is the tallest tree in each column above trees[0] when trees is a band out of a bigger forest.
+    """
+
+    tallest = np.maximum.accumulate(trees, axis=0)
+    visible = np.ones(trees.shape, dtype=bool)
+    visible[1:] = trees[1:] > tallest[:-1]
+    if above is not None:
+        visible &= trees > above
+    return visible
 
-    return data
 
+def view_distances_up(trees: np.ndarray, last_blocker: Optional[np.ndarray] = None, first_row: int = 0) -> np.ndarray:
+    """
+    How far each tree can see upwards before a tree at least as tall (or the edge) blocks the view.
+    Sweeps down the rows with every column at once. Heights are digits, so the monotonic stack of each column only ever
+    needs the last row at or above each height, and a (heights, columns) table of those replaces the stack.
+    To carry a sweep on over several bands, pass the same last_blocker table to each call (it's updated in place)
+    along with the row number of each band's first row.
+    """
 
-def is_visible(i: int, j: int, data: List[int]) -> bool:
-    """Takes (x,y) coordinates as input and checks if the tree at that location is visible from the left, right, top or bottom respectively."""
+    nrows, ncols = trees.shape
+    if last_blocker is None:
+        last_blocker = np.zeros((HEIGHTS, ncols), dtype=np.int32)
+    levels = np.arange(HEIGHTS, dtype=trees.dtype)[:, None]
+    cols = np.arange(ncols)
+    blockers = np.empty(trees.shape, dtype=np.int32)
 
-    tree = data[i][j]
+    for i in range(nrows):
+        row = trees[i]
+        blockers[i] = last_blocker[row, cols]
+        # This tree now blocks the view of every tree below it that is the same height or shorter.
+        # Rows only go up, so a maximum updates those levels without a masked assignment.
+        np.maximum(last_blocker, (levels <= row) * np.int32(first_row + i), out=last_blocker)
 
-    if tree > max(data[i][:j]) or \
-        tree > max(data[i][j+1:]) or \
-        tree > max([row[j] for row in data[:i]]) or \
-        tree > max([row[j] for row in data[i+1:]]):
-        return True
+    return np.arange(first_row, first_row + nrows, dtype=np.int32)[:, None] - blockers
 
 
-def get_visible_distance(tree: int, neighbours: List[int]) -> int:
-    """Increment dist if neighbours are smaller than current tree"""
-    dist = 0
-    for neighbour in neighbours:
-        if neighbour >= tree:
-            dist += 1
-            return dist
-        else:
-            dist += 1
-    return dist
+def view_distances_left(trees: np.ndarray) -> np.ndarray:
+    """
+    How far each tree can see to the left before a tree at least as tall (or the edge) blocks the view, every row at once.
+    For each height, a running maximum along the rows of the columns holding a tree at least that tall gives the
+    nearest blocker to the left of every tree, so it takes one vectorised pass per height rather than a loop over columns.
+    """
 
+    nrows, ncols = trees.shape
+    cols = np.arange(ncols, dtype=np.int32)
+    distances = np.empty(trees.shape, dtype=np.int32)
+    blocker = np.zeros(trees.shape, dtype=np.int32)
+    # Scratch buffers reused for every height, as the passes are bound by memory traffic.
+    tall = np.empty((nrows, max(ncols - 1, 0)), dtype=bool)
+    tall_cols = np.empty(tall.shape, dtype=np.int32)
 
-def part_1_solution(data: List[str]) -> int:
+    for height in range(HEIGHTS):
+        # Column of the last tree at least this tall left of each column, or 0 (the edge) if there isn't one.
+        np.greater_equal(trees[:, :-1], height, out=tall)
+        np.multiply(tall, cols[:-1], out=tall_cols)
+        np.maximum.accumulate(tall_cols, axis=1, out=blocker[:, 1:])
+        np.subtract(cols, blocker, out=distances, where=trees == height)
+
+    return distances
+
+
+def _orientations(trees: np.ndarray) -> Iterator[Tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]]:
+    """
+    Yields the grid looking from each edge (top, bottom, left, right) as a contiguous array, alongside a function
+    that maps a result for that orientation back onto the original grid.
+    """
+
+    yield trees, lambda a: a
+    yield np.ascontiguousarray(trees[::-1]), lambda a: a[::-1]
+    yield np.ascontiguousarray(trees.T), lambda a: a.T
+    yield np.ascontiguousarray(trees.T[::-1]), lambda a: a[::-1].T
+
+
+def part_1_solution(data: Grid) -> int:
     """Compute solution to puzzle part 1."""
-    
-    # All tree edges are visible. Get sum of edges.
-    visible = len(data) * 2 + len(data[0]) * 2 - 4
 
-    # Iterate through inner rows and columns.
-    for i in range(1, len(data)-1):
-        for j in range(1, len(data[i])-1):
-            if is_visible(i, j, data):
-                visible += 1
+    trees = heights(data)
+    visible = np.zeros(trees.shape, dtype=bool)
+    for oriented, restore in _orientations(trees):
+        visible |= restore(visible_from_top(oriented))
+
+    return int(np.count_nonzero(visible))
+
+
+def part_2_solution(data: Grid) -> int:
+    """For each tree find the distance it can see in each direction and multiply them together to get its scenic score."""
+
+    trees = heights(data)
+    scenic_scores = np.ones(trees.shape, dtype=np.int64)
+    for oriented, restore in _orientations(trees):
+        scenic_scores *= restore(view_distances_up(oriented))
+
+    return int(scenic_scores.max(initial=0))
+
+
+def open_forest(path: str) -> np.ndarray:
+    """
+    Memory maps an input file as a read-only (rows, columns) array of ASCII digits without reading it.
+    The newlines stay in the file and are skipped by the row stride, so every row must be the same length.
+    """
+
+    with open(path, 'rb') as f:
+        first_line = f.readline()
+    width = len(first_line.rstrip(b'\r\n'))
+    if width == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    stride = len(first_line)
+    # The last row may not have a newline after it.
+    nrows = (len(raw) - width) // stride + 1
+    return np.lib.stride_tricks.as_strided(raw, shape=(nrows, width), strides=(stride, 1), writeable=False)
+
+
+def _bands(nrows: int, ncols: int, tile_bytes: int) -> List[Tuple[int, int]]:
+    """(start, end) rows of bands of whole rows, each about tile_bytes of forest."""
+
+    band_rows = max(1, tile_bytes // max(ncols, 1))
+    return [(start, min(start + band_rows, nrows)) for start in range(0, nrows, band_rows)]
+
+
+def tiled_part_1_solution(forest: np.ndarray, tile_bytes: int = TILE_BYTES) -> int:
+    """
+    Part 1 over a forest of ASCII digits (e.g. from open_forest), reading it a band of rows at a time.
+    A first pass saves, for each column and height, the last band with a tree at least that tall. The tallest tree
+    below a band is then the number of heights with a later band, so the second pass down the forest can check each
+    band from all four edges on its own while carrying the tallest tree above. Rows within a band are whole, so left
+    and right need no carried state. Besides the band, only (heights x columns) of state is kept, however many bands.
+    """
+
+    nrows, ncols = forest.shape
+    bands = _bands(nrows, ncols, tile_bytes)
+    levels = np.arange(HEIGHTS)[:, None]
+
+    last_band = np.full((HEIGHTS, ncols), -1, dtype=np.int64)
+    for b, (start, end) in enumerate(bands):
+        last_band[levels <= (forest[start:end] - ZERO).max(axis=0)] = b
+
+    visible = 0
+    tallest = None
+    for b, (start, end) in enumerate(bands):
+        trees = forest[start:end] - ZERO
+        # -1 where there's nothing below, so every tree at the bottom of the band beats it.
+        below = np.count_nonzero(last_band > b, axis=0) - 1
+
+        band_visible = visible_from_top(trees, tallest)
+        band_visible |= visible_from_top(trees[::-1], below)[::-1]
+        band_visible |= visible_from_top(trees.T).T
+        band_visible |= visible_from_top(trees.T[::-1])[::-1].T
+        visible += int(np.count_nonzero(band_visible))
+
+        band_max = trees.max(axis=0)
+        tallest = band_max if tallest is None else np.maximum(tallest, band_max)
 
     return visible
 
 
-def part_2_solution(data: List[str]) -> int:
-    """For each tree get it's neighbouring trees and find the distance it can see."""   
-    scenic_scores = []
+def tiled_part_2_solution(forest: np.ndarray, tile_bytes: int = TILE_BYTES) -> int:
+    """
+    Part 2 over a forest of ASCII digits (e.g. from open_forest), reading it a band of rows at a time.
+    A first pass up the forest writes the blocker table of the upward sweep at the bottom of each band to a temporary
+    file. The second pass down the forest carries the downward sweep's table and reads back each band's table from
+    below, so each band gets all four viewing distances without any other band in memory.
+    Memory holds a band and two (heights x columns) tables, but the temporary file is not bounded by the tile size:
+    it grows by 40 bytes per column for every band, so it's about 40 / (rows per band) times the size of the forest.
+    """
 
-    # Begin iterating over trees and get tree neighbours.
-    for i in range(len(data)):
-        for j in range(len(data[i])):
-            tree = data[i][j]
-            left_neighbours = data[i][:j]
-            right_neighbours = data[i][j+1:]
-            up_neighbours = [row[j] for row in data[:i]]
-            down_neighbours = [row[j] for row in data[i+1:]]
+    nrows, ncols = forest.shape
+    bands = _bands(nrows, ncols, tile_bytes)
 
-            # Reverse left and up neighbours because it needs to iterate over neighbours as if beginning at the nearest neighbour
-            left, right, up, down = [
-                get_visible_distance(tree, left_neighbours[::-1]),
-                get_visible_distance(tree, right_neighbours),
-                get_visible_distance(tree, up_neighbours[::-1]),
-                get_visible_distance(tree, down_neighbours)
-            ]
+    with tempfile.TemporaryFile() as f:
+        table_bytes = HEIGHTS * ncols * np.dtype(np.int32).itemsize
 
-            # Multiply visible distances together to get the scenic score and return the maximum score.
-            # I think there's some numpy.prod magic I can do here instead...
-            scenic_score = 1
-            for dist in [left, right, up, down]:
-                scenic_score = scenic_score * dist
-            scenic_scores.append(scenic_score)
+        # Rows count up from the bottom in this pass, as the forest is read upside down. Tables are written with
+        # plain file writes rather than through a memory map, so they don't stay resident.
+        last_blocker = np.zeros((HEIGHTS, ncols), dtype=np.int32)
+        for b in reversed(range(len(bands))):
+            f.seek(b * table_bytes)
+            f.write(last_blocker)
+            start, end = bands[b]
+            view_distances_up(np.ascontiguousarray(forest[start:end][::-1] - ZERO), last_blocker, nrows - end)
 
-    return max(scenic_scores)
+        best = 0
+        last_blocker = np.zeros((HEIGHTS, ncols), dtype=np.int32)
+        blockers_below = np.empty((HEIGHTS, ncols), dtype=np.int32)
+        for b, (start, end) in enumerate(bands):
+            trees = forest[start:end] - ZERO
+            f.seek(b * table_bytes)
+            f.readinto(blockers_below)
+
+            scenic_scores = view_distances_up(trees, last_blocker, start).astype(np.int64)
+            scenic_scores *= view_distances_up(np.ascontiguousarray(trees[::-1]), blockers_below, nrows - end)[::-1]
+            scenic_scores *= view_distances_left(trees)
+            scenic_scores *= view_distances_left(trees[:, ::-1])[:, ::-1]
+            best = max(best, int(scenic_scores.max(initial=0)))
+
+    return best
 
 
 if __name__ == "__main__":
@@ -104,11 +253,27 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # Bands of a single row must give the same answers as the whole grid.
+    assert tiled_part_1_solution(example_data.cells, tile_bytes=1) == EXAMPLE_OUTPUT_PART1
+    assert tiled_part_2_solution(example_data.cells, tile_bytes=1) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
+    input_path = os.path.join(os.path.dirname(__file__), "input.txt")
+    with open(input_path, "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
+    # The memory mapped input, solved in small bands, must agree with the in-memory solutions.
+    forest = open_forest(input_path)
+    assert tiled_part_1_solution(forest, tile_bytes=1 << 12) == part_1_solution(data)
+    assert tiled_part_2_solution(forest, tile_bytes=1 << 12) == part_2_solution(data)
+
     # Print answers
+    start_time_1 = time.perf_counter()
     print(f'Part 1: { part_1_solution(data=data) }')
+    execution_time_1 = (time.perf_counter() - start_time_1)
+    print(f'Part 1 execution time: {execution_time_1:.4f}')
+
+    start_time_2 = time.perf_counter()
     print(f'Part 2: { part_2_solution(data=data) }')
-    print(timeit.timeit())
\ No newline at end of file
+    execution_time_2 = (time.perf_counter() - start_time_2)
+    print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -4,8 +4,10 @@ Solution for Advent of Code 2022 day 9 - https://adventofcode.com/2022/day/9
 
 
 import os
-from typing import List, Any
-import timeit
+import math
+import bisect
+from typing import List, Any, Set, Tuple
+import time
 
 
 PART_1_EXAMPLE_INPUT = '''\
@@ -33,119 +35,373 @@ PART_1_EXAMPLE_OUTPUT = 13
 PART_2_EXAMPLE_OUTPUT = 36
 
 
-def _parse_input(data: str) -> List[tuple]:
-    """Parse input text file into usable data structure."""
-    data = [tuple(i.split()) for i in data.splitlines()]
+# (x, y) step of the head for each direction.
+DIRECTIONS = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
 
-    return data
-
-
-def are_adjacent(head: List[int], tail: List[int]) -> bool:
-    """Returns true if head xy position is adjacent to tail xy position"""
-
-    xdist = abs(head[0] - tail[0])
-    ydist = abs(head[1] - tail[1])
-    if (xdist == 0 or xdist == 1) and (ydist == 1 or ydist == 0):
-        return True
-
-
-def move_head(move: List[int], head: List[int]) -> List[int]:
-    """Updates head position by 1 depending on direction."""
+# Coordinates are shifted by this before packing, so negative ones pack into a non-negative 64 bit int.
+OFFSET = 1 << 31
 
-    if move == 'R':
-        head[0] += 1
-    elif move == 'L':
-        head[0] -= 1
-    elif move == 'U':
-        head[1] += 1
-    elif move == 'D':
-        head[1] -= 1
+# Longest block of moves (in lines) looked for when finding repeats in a script.
+MAX_PERIOD = 32
 
-    return head
+# Repetitions of a block simulated while waiting for the rope to settle into a cycle, before giving up and stepping the rest.
+MAX_CYCLE_SEARCH = 256
 
+# Fewest head steps worth skipping with a sweep. Short repeats turn up by chance in any script, and stepping them is
+# cheaper than the sweep's bookkeeping and the membership checks every sweep adds to the final count.
+MIN_SWEEP_STEPS = 1 << 14
 
-def distance(head: List[int], tail: List[int]) -> int:
-    """Returns the x-axis distance and y-axis distance of two points."""
 
-    xdist = head[0] - tail[0]
-    ydist = head[1] - tail[1]
+def _parse_input(data: str) -> List[Tuple[str, int]]:
+    """Parse input text file into (direction, count) moves."""
+    data = [(move, int(count)) for move, count in (line.split() for line in data.splitlines() if line.strip())]
 
-    return xdist, ydist
-
-def move_tail(tail: List[int], xdist: int, ydist: int) -> List[int]:
-    """Updates tail position based on distance to head position."""
+    return data
 
-    # If tail xdist or ydist is 2 away from head, reduce to 1 as we don't want them to overlap.
-    if xdist == 2:
-        xdist = 1
-    elif xdist == -2:
-        xdist = -1
 
-    if ydist == 2:
-        ydist = 1
-    elif ydist == -2:
-        ydist = -1
+def pack(x: int, y: int) -> int:
+    """Packs a position into one 64 bit int, which hashes faster and takes less memory in a set than a tuple."""
+    return (x + OFFSET) << 32 | (y + OFFSET)
 
-    # Update tail values.
-    tail[0] += xdist
-    tail[1] += ydist
 
-    return tail
+def unpack(key: int) -> Tuple[int, int]:
+    return (key >> 32) - OFFSET, (key & 0xFFFFFFFF) - OFFSET
 
 
-def part_1_solution(data: List[str]) -> Any:
+def _repeats(moves: List[Tuple[str, int]], i: int, period: int) -> int:
+    """
+    How many times moves[i:i + period] repeats back to back from i.
+    The run has the period for as long as the script matches itself shifted by period, which is found by comparing
+    doubling chunks and then halving ones, so it costs a few list comparisons in C rather than one per repeat.
+    """
+
+    limit = len(moves) - i - period
+    matched = 0
+    step = period
+    while matched + step <= limit and moves[i + matched:i + matched + step] == moves[i + period + matched:i + period + matched + step]:
+        matched += step
+        step *= 2
+
+    for bit in reversed(range((step - 1).bit_length())):
+        chunk = 1 << bit
+        if matched + chunk <= limit and moves[i + matched:i + matched + chunk] == moves[i + period + matched:i + period + matched + chunk]:
+            matched += chunk
+
+    return (matched + period) // period
+
+
+def compress(moves: List[Tuple[str, int]], max_period: int = MAX_PERIOD) -> List[Tuple[List[Tuple[str, int]], int]]:
+    """
+    Splits a script into (block, repeats) pairs, e.g. 'R 1, U 1' repeated a million times becomes ([R 1, U 1], 1000000).
+    At each point the block length that covers the most lines is taken. Lines that don't repeat are grouped into
+    blocks that run once.
+    """
+
+    groups = []
+    single = []
+    i = 0
+    n = len(moves)
+
+    while i < n:
+        best_period, best_repeats = 1, 1
+        for period in range(1, min(max_period, (n - i) // 2) + 1):
+            # Cheap check before comparing whole blocks.
+            if moves[i] != moves[i + period]:
+                continue
+            repeats = _repeats(moves, i, period)
+            if repeats > 1 and period * repeats > best_period * best_repeats:
+                best_period, best_repeats = period, repeats
+            # Multiples of a period that repeats to the end of the script can't cover any more of it.
+            if i + period * (repeats + 1) > n:
+                break
+
+        if best_repeats == 1:
+            single.append(moves[i])
+            i += 1
+            continue
+
+        if single:
+            groups.append((single, 1))
+            single = []
+        groups.append((moves[i:i + best_period], best_repeats))
+        i += best_period * best_repeats
+
+    if single:
+        groups.append((single, 1))
+
+    return groups
+
+
+def _rep_range(lo: int, hi: int, shift: int, box_lo: int, box_hi: int) -> Tuple[float, float]:
+    """Range of m for which [lo, hi] moved m * shift along one axis overlaps [box_lo, box_hi]."""
+
+    if shift == 0:
+        return (-math.inf, math.inf) if lo <= box_hi and hi >= box_lo else (1, 0)
+    if shift > 0:
+        return -((hi - box_lo) // shift), (box_hi - lo) // shift
+    return -((box_hi - lo) // -shift), (hi - box_lo) // -shift
+
+
+class Sweep:
+    """
+    The cells covered by a set of cells moved on by (tx, ty) once, twice, ... up to repeats times, without listing them.
+    Every cell lies on exactly one line of the form base + q * (tx, ty). Cells are stored as merged ranges of q per base,
+    so both membership and the number of distinct cells come from the ranges however many repeats there are.
+    """
+
+    __slots__ = ('cells', 'tx', 'ty', 'repeats', 'runs', 'size', 'box')
+
+    def __init__(self, cells: List[Tuple[int, int]], tx: int, ty: int, repeats: int) -> None:
+        if tx == 0 and ty == 0:
+            raise ValueError('A sweep needs a non-zero shift')
+
+        self.cells = cells
+        self.tx = tx
+        self.ty = ty
+        self.repeats = repeats
+
+        ranges = {}
+        for x, y in cells:
+            base, q = self._locate(x, y)
+            ranges.setdefault(base, []).append((q + 1, q + repeats))
+
+        # Merge overlapping ranges on each line, keeping the starts and ends in separate lists for bisect.
+        self.runs = {}
+        self.size = 0
+        for base, spans in ranges.items():
+            starts, ends = [], []
+            for start, end in sorted(spans):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self.runs[base] = (starts, ends)
+            self.size += sum(end - start + 1 for start, end in zip(starts, ends))
+
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        self.box = (min(xs) + min(tx, tx * repeats), max(xs) + max(tx, tx * repeats),
+                    min(ys) + min(ty, ty * repeats), max(ys) + max(ty, ty * repeats))
+
+    def _locate(self, x: int, y: int) -> Tuple[int, int]:
+        """(base, q) of the line a cell lies on. Moving a cell on by (tx, ty) adds one to q and keeps the base."""
+
+        q = x // self.tx if self.tx else y // self.ty
+        return pack(x - q * self.tx, y - q * self.ty), q
+
+    def contains(self, x: int, y: int) -> bool:
+        base, q = self._locate(x, y)
+        runs = self.runs.get(base)
+        if runs is None:
+            return False
+        starts, ends = runs
+        i = bisect.bisect_right(starts, q) - 1
+        return i >= 0 and q <= ends[i]
+
+    def overlaps(self, other: 'Sweep') -> Set[int]:
+        """
+        Packed cells covered by both sweeps. Only the repeats whose bounding box reaches the other sweep's box are
+        listed, so sweeps in different parts of the grid cost nothing. Sweeps that retrace each other do cost their size.
+        """
+
+        minx, maxx, miny, maxy = other.box
+        xs = [x for x, _ in self.cells]
+        ys = [y for _, y in self.cells]
+        low_x, high_x = _rep_range(min(xs), max(xs), self.tx, minx, maxx)
+        low_y, high_y = _rep_range(min(ys), max(ys), self.ty, miny, maxy)
+        first = int(max(1, low_x, low_y))
+        last = int(min(self.repeats, high_x, high_y))
+
+        shared = set()
+        for m in range(first, last + 1):
+            dx, dy = m * self.tx, m * self.ty
+            for x, y in self.cells:
+                if other.contains(x + dx, y + dy):
+                    shared.add(pack(x + dx, y + dy))
+        return shared
+
+
+class Rope:
+    """
+    A rope of any number of knots, knot 0 being the head. Positions live in two small lists of ints and each knot keeps
+    the set of packed positions it has visited, so one pass gives the visited counts of every knot.
+    Repeated blocks of moves that were skipped rather than stepped (see `repeat`) are kept per knot as sweeps, along
+    with how many distinct cells those sweeps cover between them.
+    """
+
+    __slots__ = ('xs', 'ys', 'visited', 'sweeps', 'swept')
+
+    def __init__(self, knots: int = 2) -> None:
+        if knots < 1:
+            raise ValueError(f'A rope needs at least 1 knot, got {knots}')
+
+        # Plain lists rather than array('q'), which has to box every element it hands back and so steps slower.
+        self.xs = [0] * knots
+        self.ys = [0] * knots
+        self.visited = [{pack(0, 0)} for _ in range(knots)]
+        self.sweeps = [[] for _ in range(knots)]
+        self.swept = [0] * knots
+
+    def step(self, dx: int, dy: int) -> None:
+        """Moves the head one step and lets the rest of the rope follow."""
+
+        xs, ys, visited = self.xs, self.ys, self.visited
+        xs[0] += dx
+        ys[0] += dy
+        visited[0].add(pack(xs[0], ys[0]))
+
+        for i in range(1, len(xs)):
+            xdist = xs[i-1] - xs[i]
+            ydist = ys[i-1] - ys[i]
+
+            # Still touching, so this knot and every knot behind it stay where they are.
+            if -1 <= xdist <= 1 and -1 <= ydist <= 1:
+                break
+
+            # Otherwise move one step towards the knot in front, diagonally if it isn't in the same row or column.
+            xs[i] += (xdist > 0) - (xdist < 0)
+            ys[i] += (ydist > 0) - (ydist < 0)
+            visited[i].add(pack(xs[i], ys[i]))
+
+    def move(self, direction: str, count: int) -> None:
+        dx, dy = DIRECTIONS[direction]
+        for _ in range(count):
+            self.step(dx, dy)
+
+    def run(self, moves: List[Tuple[str, int]]) -> None:
+        """Runs a script, skipping through repeated blocks of moves (see `compress` and `repeat`)."""
+
+        for block, repeats in compress(moves):
+            if repeats == 1 or repeats * _steps(block) < MIN_SWEEP_STEPS:
+                for _ in range(repeats):
+                    for direction, count in block:
+                        self.move(direction, count)
+            else:
+                self.repeat(block, repeats)
+
+    def _shape(self) -> Tuple[int, ...]:
+        """Where every knot is relative to the head. The rope moves the same way from the same shape wherever it is."""
+
+        x0, y0 = self.xs[0], self.ys[0]
+        return tuple(x - x0 for x in self.xs) + tuple(y - y0 for y in self.ys)
+
+    def repeat(self, block: List[Tuple[str, int]], repeats: int) -> None:
+        """
+        Runs a block of moves repeats times. Once the rope starts a repetition in a shape it started an earlier one in,
+        every later cycle of repetitions is the same cycle moved on by the head's shift, so the remaining whole cycles
+        are skipped: the knots jump ahead and each knot's cells from the cycle are added as one sweep. Cycles that skip
+        fewer than MIN_SWEEP_STEPS head steps are stepped instead.
+        """
+
+        seen = {}
+        heads = []
+        logs = []
+        done = 0
+
+        while done < repeats and done < MAX_CYCLE_SEARCH:
+            shape = self._shape()
+            if shape in seen:
+                break
+            seen[shape] = done
+            heads.append((self.xs[0], self.ys[0]))
+
+            # Log each knot's cells for this repetition in fresh sets, then fold them into the real ones.
+            visited = self.visited
+            self.visited = [set() for _ in visited]
+            for direction, count in block:
+                self.move(direction, count)
+            logs.append(self.visited)
+            for cells, new in zip(visited, self.visited):
+                cells |= new
+            self.visited = visited
+            done += 1
+
+        else:
+            # Finished, or the rope never settled, so step whatever is left.
+            for _ in range(repeats - done):
+                for direction, count in block:
+                    self.move(direction, count)
+            return
+
+        start = seen[shape]
+        period = done - start
+        cycles = (repeats - done) // period
+        tx, ty = self.xs[0] - heads[start][0], self.ys[0] - heads[start][1]
+
+        if tx or ty:
+            if cycles * period * _steps(block) < MIN_SWEEP_STEPS:
+                cycles = 0
+            for i in range(len(self.xs)) if cycles else ():
+                cells = [unpack(key) for key in set().union(*(log[i] for log in logs[start:]))]
+                self._add_sweep(i, Sweep(cells, tx, ty, cycles))
+                self.xs[i] += cycles * tx
+                self.ys[i] += cycles * ty
+
+        # A cycle that brings the rope back where it started only revisits cells, so its repeats are dropped outright.
+        for _ in range(repeats - done - cycles * period):
+            for direction, count in block:
+                self.move(direction, count)
+
+    def _add_sweep(self, knot: int, sweep: Sweep) -> None:
+        shared = set()
+        for other in self.sweeps[knot]:
+            shared |= sweep.overlaps(other)
+        self.swept[knot] += sweep.size - len(shared)
+        self.sweeps[knot].append(sweep)
+
+    def visited_counts(self) -> List[int]:
+        """Number of distinct positions each knot has visited, head first."""
+
+        counts = []
+        for cells, sweeps, swept in zip(self.visited, self.sweeps, self.swept):
+            counts.append(len(cells) + swept - len(_swept_cells(cells, sweeps)))
+        return counts
+
+
+def _steps(block: List[Tuple[str, int]]) -> int:
+    """Head steps in one run of a block of moves."""
+    return sum(count for _, count in block)
+
+
+def _swept_cells(cells: Set[int], sweeps: List[Sweep]) -> Set[int]:
+    """
+    The packed cells a sweep also covers, so stepped cells aren't counted twice.
+    Each sweep only checks the cells inside its bounding box, picked out by sorting the cells by x once and
+    bisecting, rather than every cell being checked against every sweep.
+    """
+
+    if not sweeps:
+        return set()
+
+    by_x = sorted(unpack(key) for key in cells)
+    xs = [x for x, _ in by_x]
+    shared = set()
+    for sweep in sweeps:
+        minx, maxx, miny, maxy = sweep.box
+        for x, y in by_x[bisect.bisect_left(xs, minx):bisect.bisect_right(xs, maxx)]:
+            if miny <= y <= maxy and sweep.contains(x, y):
+                shared.add(pack(x, y))
+    return shared
+
+
+def simulate(moves: List[Tuple[str, int]], knots: int) -> List[int]:
+    """Runs the moves on a rope of the given number of knots and returns how many positions each knot visited."""
+
+    rope = Rope(knots)
+    rope.run(moves)
+
+    return rope.visited_counts()
+
+
+def part_1_solution(data: List[Tuple[str, int]]) -> Any:
     """Compute solution to puzzle part 1."""
-    
-    head = [0,0]
-    tail = [0,0]
-    visited = []
-
-    # Iterate over moves.
-    for move, count in data:
-        # Move head one count at a time.
-        for _ in range(int(count)):
-            head = move_head(move, head)
-            
-            # Check if tail is still adjacent. Adjacent distances are 0 (same), 1(hori/vert) or 2(diag).
-            xdist, ydist = distance(head, tail)
-
-            # If distance is greater than 1 then move tail behind head.
-            if abs(xdist) >= 2 or abs(ydist) >= 2:
-                move_tail(tail, xdist, ydist)
-
-            # Append tail coordinates to list of visited coordinates.
-            visited.append(list(tail))
+    return simulate(data, 2)[-1]
 
-    # Return the length of a Set of coordinates to get unique values.
-    return len(set(tuple(coord) for coord in visited))
 
-
-def part_2_solution(data: List[str]) -> Any:
+def part_2_solution(data: List[Tuple[str, int]]) -> Any:
     """Compute solution to puzzle part 2."""
-
-    rope = [[0,0], [0,0], [0,0], [0,0], [0,0], [0,0], [0,0], [0,0], [0,0], [0,0]]
-    visited = []
-
-    # Iterate over moves.
-    for move, count in data:
-
-        # Move head postion one at a time.
-        for _ in range(int(count)):
-            rope[0] = move_head(move, rope[0])
-
-            # Treat each pair of rope segements as a head and a tail.  
-            for i in range(1, len(rope)):
-                xdist, ydist = distance(rope[i-1], rope[i])
-
-                # Check if they're adjacent and if not, move the tail segment.
-                if abs(xdist) >= 2 or abs(ydist) >= 2:
-                    rope[i] = move_tail(rope[i], xdist, ydist)
-
-            # Append last index of rope coordinates to list of visited coordinates.
-            visited.append(list(rope[-1]))
-
-    # Return the length of a Set of coordinates to get unique values.
-    return len(set(tuple(coord) for coord in visited))
+    return simulate(data, 10)[-1]
 
 
 if __name__ == "__main__":
@@ -157,11 +413,26 @@ if __name__ == "__main__":
     assert part_1_solution(example_data_part_1) == PART_1_EXAMPLE_OUTPUT
     assert part_2_solution(example_data_part_2) == PART_2_EXAMPLE_OUTPUT
 
+    # Knot 1 of a longer rope follows the head exactly like the tail of a 2 knot rope, so one pass answers both parts.
+    assert simulate(example_data_part_1, 10)[1] == PART_1_EXAMPLE_OUTPUT
+
+    # Skipping through a repeated script must count the same cells as stepping every move.
+    stepped = Rope(10)
+    for direction, count in example_data_part_2 * 200:
+        stepped.move(direction, count)
+    assert simulate(example_data_part_2 * 200, 10) == stepped.visited_counts()
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
+    start_time_1 = time.perf_counter()
     print(f'Part 1: { part_1_solution(data=data) }')
+    execution_time_1 = (time.perf_counter() - start_time_1)
+    print(f'Part 1 execution time: {execution_time_1:.4f}')
+
+    start_time_2 = time.perf_counter()
     print(f'Part 2: { part_2_solution(data=data) }')
-    print(timeit.timeit())
\ No newline at end of file
+    execution_time_2 = (time.perf_counter() - start_time_2)
+    print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -4,7 +4,7 @@ Author: Lewis Gallagher
 """
 
 import os
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 import time
 
 EXAMPLE_INPUT1 = '''\
@@ -34,10 +34,19 @@ def _parse_input(data: str) -> List[str]:
     return [line for line in data.splitlines()]
 
 
+def _parse_stream(lines: Iterable[str]) -> Iterator[str]:
+    """Parse lines lazily."""
+
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
 def part_1_solution(data: List[str]) -> int:
     """Compute solution to puzzle part 1."""
 
-    sums = []
+    total = 0
 
     for line in data:
 
@@ -61,10 +70,9 @@ def part_1_solution(data: List[str]) -> int:
             else:
                 j-=1
 
-        s = int(''.join(nums))   
-        sums.append(s) 
+        total += int(''.join(nums))
 
-    return sum(sums)
+    return total
 
 def part_2_solution(data: List[str]) -> int:
     """Compute solution to puzzle part 2."""
@@ -81,7 +89,7 @@ def part_2_solution(data: List[str]) -> int:
         'nine':9
     }
 
-    sums = []
+    total = 0
 
     for line in data:
 
@@ -105,10 +113,9 @@ def part_2_solution(data: List[str]) -> int:
                     j_found = True
             j-=1
 
-        s = int(''.join([str(i) for i in nums]))
-        sums.append(s)
+        total += int(''.join([str(i) for i in nums]))
 
-    return sum(sums)
+    return total
 
 
 if __name__ == "__main__":
@@ -120,17 +127,21 @@ if __name__ == "__main__":
     assert part_1_solution(example_data1) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data2) == EXAMPLE_OUTPUT_PART2
 
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT1.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT2.splitlines())) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
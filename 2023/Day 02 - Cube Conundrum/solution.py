@@ -4,7 +4,7 @@ Author: Lewis Gallagher
 """
 
 import os
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 import time
 import re
 import numpy as np
@@ -28,11 +28,20 @@ def _parse_input(data: str) -> List[str]:
     return [line for line in data.splitlines()]
 
 
+def _parse_stream(lines: Iterable[str]) -> Iterator[str]:
+    """Parse lines lazily into games."""
+
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
 def part_1_solution(data: List[str]) -> int:
     """Compute solution to puzzle part 1."""
 
     lookup = {'red':12, 'green':13, 'blue':14}
-    possible_games = set()
+    total = 0
 
     for game in data:
 
@@ -40,7 +49,7 @@ def part_1_solution(data: List[str]) -> int:
         num, cubes = game.split(': ')
 
         num = int(num.split(' ')[-1])
-        possible_games.add(num)
+        possible = True
 
         # Seperate hands of cubes.
         hands = cubes.split('; ')
@@ -52,15 +61,18 @@ def part_1_solution(data: List[str]) -> int:
             # Check if the colour count exceeds the maximum.
             for c in count_cols:
                 if int(c[0]) > lookup.get(c[1]):
-                    possible_games.discard(num)
+                    possible = False
 
-    return sum(possible_games)
+        if possible:
+            total += num
+
+    return total
 
 
 def part_2_solution(data: List[str]) -> int:
     """Compute solution to puzzle part 2."""
 
-    powers = []
+    total = 0
 
     for game in data:
 
@@ -85,9 +97,9 @@ def part_2_solution(data: List[str]) -> int:
 
         # Product of a list containing zeros will be zero. Filter them.
         to_power = [i for i in list(need_cubes.values()) if i != 0]
-        powers.append(np.prod(to_power))
+        total += np.prod(to_power)
 
-    return sum(powers)
+    return total
 
 
 if __name__ == "__main__":
@@ -98,17 +110,21 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -99,12 +99,12 @@ if __name__ == "__main__":
         seeds, maps = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(seeds, maps) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    # start_time_2 = time.time()
+    # start_time_2 = time.perf_counter()
     # print(f'\nPart 2: { part_2_solution(data) }')
-    # execution_time_2 = (time.time() - start_time_2)
+    # execution_time_2 = (time.perf_counter() - start_time_2)
     # print(f'Part 2 execution time: {execution_time_2:.4f}')
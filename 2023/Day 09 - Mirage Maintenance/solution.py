@@ -4,7 +4,7 @@ Author: Lewis Gallagher
 """
 
 import os
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 import time
 
 
@@ -24,6 +24,14 @@ def _parse_input(data: str) -> List[str]:
     return [[int(j) for j in i.split()] for i in data.splitlines()]
 
 
+def _parse_stream(lines: Iterable[str]) -> Iterator[List[int]]:
+    """Parse lines lazily into histories."""
+
+    for line in lines:
+        if line.strip():
+            yield [int(j) for j in line.split()]
+
+
 def build_list(li: List[int]) -> List[int]:
 
     new_list = [None] * (len(li) - 1)
@@ -37,7 +45,7 @@ def build_list(li: List[int]) -> List[int]:
 def part_1_solution(data: List[int]) -> int:
     """Compute solution to puzzle part 1."""
 
-    predicted = []
+    total = 0
 
     for li in data:
 
@@ -51,15 +59,15 @@ def part_1_solution(data: List[int]) -> int:
             val = new_list[i][-1] + new_list[i+1][-1]
             new_list[i].append(val)
 
-        predicted.append(new_list[0][-1])
+        total += new_list[0][-1]
 
-    return sum(predicted)
+    return total
 
 
 def part_2_solution(data: List[str]) -> Any:
     """Compute solution to puzzle part 2."""
 
-    predicted = []
+    total = 0
 
     for li in data:
 
@@ -73,9 +81,9 @@ def part_2_solution(data: List[str]) -> Any:
             val = new_list[i][0] - new_list[i+1][0]
             new_list[i].insert(0, val)
 
-        predicted.append(val)
+        total += val
 
-    return sum(predicted)
+    return total
 
 
 if __name__ == "__main__":
@@ -88,17 +96,21 @@ if __name__ == "__main__":
     assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
     assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
 
+    # Same answers via _parse_stream.
+    assert part_1_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(_parse_stream(EXAMPLE_INPUT.splitlines())) == EXAMPLE_OUTPUT_PART2
+
     # Read puzzle input.
     with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
@@ -9,6 +9,8 @@ import time
 import numpy as np
 from itertools import combinations
 
+from aoc_utils.grid import Grid
+
 
 EXAMPLE_INPUT = '''\
 ...#......
@@ -27,10 +29,10 @@ EXAMPLE_OUTPUT_PART1 = 374
 EXAMPLE_OUTPUT_PART2 = 82000210
 
 
-def _parse_input(data: str) -> List[str]:
+def _parse_input(data: str) -> Grid:
     """Parse input text file into usable data structure."""
 
-    return np.array([[i for i in line] for line in data.splitlines()])
+    return Grid.from_text(data)
 
 
 def manhattan_distance(cord_a: List[tuple[int]], cord_b: List[tuple[int]]) -> int:
@@ -39,29 +41,25 @@ def manhattan_distance(cord_a: List[tuple[int]], cord_b: List[tuple[int]]) -> in
     return (abs(cord_a[0] - cord_b[0])) + (abs(cord_a[1] - cord_b[1]))
 
 
-def part_1_solution(grid: List[str]) -> int:
+def part_1_solution(grid: Grid) -> int:
     """
     Compute solution to puzzle part 1.
     Instead of expanding the grid upfront, we just determine where the empty rows and columns are and if our path crosses one of these rows/columns, we add to the distance travelled.
     """
 
     dist = 0
-    g_list = list()
     unique_combs = list()
 
     # Get locations of galaxies.
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == '#':
-                g_list.append((i,j))
+    g_list = [tuple(pos) for pos in grid.positions('#').tolist()]
 
     # Make a list of all unique combinations of galaxies.
     for n, i in enumerate(combinations(g_list, 2)):
         unique_combs.append(i)
 
     # Find empty rows and columns.
-    empty_rows = list(map(int, np.where(np.all(grid == '.', axis = 1))[0]))
-    empty_cols = list(map(int, np.where(np.all(grid == '.', axis = 0))[0]))
+    empty_rows = list(map(int, np.where(np.all(grid.mask('.'), axis = 1))[0]))
+    empty_cols = list(map(int, np.where(np.all(grid.mask('.'), axis = 0))[0]))
 
     # For each pair - calculate the manhattan distance including empty rows and columns crossed.    
     for n, c in enumerate(unique_combs, start = 1):
@@ -78,29 +76,25 @@ def part_1_solution(grid: List[str]) -> int:
     return dist
 
 
-def part_2_solution(grid: List[str]) -> int:
+def part_2_solution(grid: Grid) -> int:
     """
     Compute solution to puzzle part 2.
     Identical to part one, however the galaxies are 1 million times larger, so we multiply the number of empty rows/columns we cross by 999,999.
     """
 
     dist = 0
-    g_list = list()
     unique_combs = list()
 
     # Get locations of galaxies.
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == '#':
-                g_list.append((i,j))
+    g_list = [tuple(pos) for pos in grid.positions('#').tolist()]
 
     # Make a list of all unique combinations of galaxies.
     for n, i in enumerate(combinations(g_list, 2)):
         unique_combs.append(i)
 
     # Find empty rows and columns.
-    empty_rows = list(map(int, np.where(np.all(grid == '.', axis = 1))[0]))
-    empty_cols = list(map(int, np.where(np.all(grid == '.', axis = 0))[0]))
+    empty_rows = list(map(int, np.where(np.all(grid.mask('.'), axis = 1))[0]))
+    empty_cols = list(map(int, np.where(np.all(grid.mask('.'), axis = 0))[0]))
 
     # For each pair - calculate the manhattan distance including empty rows and columns crossed.    
     for n, c in enumerate(unique_combs, start = 1):
@@ -130,12 +124,12 @@ if __name__ == "__main__":
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -8,6 +8,8 @@ from typing import List, Any
 import time
 import numpy as np
 
+from aoc_utils.grid import Grid
+
 
 EXAMPLE_INPUT = '''\
 #.##..##.
@@ -32,27 +34,27 @@ EXAMPLE_OUTPUT_PART1 = 405
 EXAMPLE_OUTPUT_PART2 = 400
 
 
-def _parse_input(data: str) -> List[str]:
+def _parse_input(data: str) -> List[Grid]:
     """Parse input text file into usable data structure."""
 
-    return np.array([[i for i in line.split()] for line in data.split('\n\n')], dtype='object')
+    return [Grid.from_text(pattern) for pattern in data.strip().split('\n\n')]
 
 
-def find_mirror(grid: List[str]) -> int:
+def find_mirror(grid: np.ndarray) -> int:
     """
-    Takes a list of strings and finds the reflection point. Returns the number of rows above the reflection point.
+    Takes a 2D array and finds the reflection point. Returns the number of rows above the reflection point.
     """
 
     nrow = len(grid)
-    for n, (a, b) in enumerate(zip(grid, grid[1:])):
+    for n in range(nrow - 1):
         
-        if a == b:   
+        if np.array_equal(grid[n], grid[n+1]):
             m = n + 1                   # m is the mirror of n. Incidentally, our return value.
             length = min(m, nrow-(m))   # Find the smallest distance before grid boundary.
 
             # Iterate outwards from the mirror until the closest grid boudnary.
             for i in range(1, length):
-                if grid[n-i] == grid[m+i]:
+                if np.array_equal(grid[n-i], grid[m+i]):
                     continue
                 else:
                     break
@@ -64,26 +66,22 @@ def find_mirror(grid: List[str]) -> int:
     return 0
 
 
-def mismatches(a: str, b: str) -> int:
+def mismatches(a: np.ndarray, b: np.ndarray) -> int:
     """
-    Takes two strings and returns the number of mismatches between them.
+    Takes two rows and returns the number of mismatches between them.
     """
 
-    t = 0
-    for i, j in zip(a, b):
-        if i != j:
-            t += 1
-    return t
+    return int(np.count_nonzero(a != b))
 
 
-def find_mirror_2(grid: List[str]) -> int:
+def find_mirror_2(grid: np.ndarray) -> int:
     """
-    Takes a list of strings and finds the reflection point. There must be exactly 1 smudge in the grid.
+    Takes a 2D array and finds the reflection point. There must be exactly 1 smudge in the grid.
     """
 
     nrow = len(grid)
-    for n, (a, b) in enumerate(zip(grid, grid[1:])):
-        smudges = mismatches(a, b)
+    for n in range(nrow - 1):
+        smudges = mismatches(grid[n], grid[n+1])
         if smudges <= 1:  
             m = n + 1                   # m is the mirror of n. Incidentally, our return value.
             length = min(m, nrow-(m))   # Find the smallest distance before grid boundary.
@@ -103,31 +101,31 @@ def find_mirror_2(grid: List[str]) -> int:
     return 0
 
 
-def part_1_solution(data: List[str]) -> Any:
+def part_1_solution(data: List[Grid]) -> Any:
     """Compute solution to puzzle part 2."""
 
     # Finds the reflection point in the grid. Also transpose the grid to find reflecting columns.
     total = 0
 
     for grid in data:
-        row = find_mirror(grid)
+        row = find_mirror(grid.cells)
         total += row * 100
-        col = find_mirror(list(zip(*grid)))
+        col = find_mirror(grid.cells.T)
         total += col
 
     return total
 
 
-def part_2_solution(data: List[str]) -> Any:
+def part_2_solution(data: List[Grid]) -> Any:
     """Compute solution to puzzle part 2."""
 
     # Finds the reflection point in the grid. Also transpose the grid to find reflecting columns.
     total = 0
 
     for grid in data:
-        row = find_mirror_2(grid)
+        row = find_mirror_2(grid.cells)
         total += row * 100
-        col = find_mirror_2(list(zip(*grid)))
+        col = find_mirror_2(grid.cells.T)
         total += col
 
     return total
@@ -145,12 +143,12 @@ if __name__ == "__main__":
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -7,10 +7,12 @@ import os
 from typing import List, Any
 import time
 import numpy as np
-from collections import deque
 
+from aoc_utils.grid import Grid, ORTHOGONAL
+from aoc_utils.search import bfs
 
-EXAMPLE_INPUT = '''\
+
+EXAMPLE_INPUT = r'''
 .|...\....
 |.-.\.....
 .....|-...
@@ -24,117 +26,108 @@ EXAMPLE_INPUT = '''\
 '''
 
 EXAMPLE_OUTPUT_PART1 = 46
-EXAMPLE_OUTPUT_PART2 = 0
+EXAMPLE_OUTPUT_PART2 = 51
 
 
-def _parse_input(data: str) -> List[str]:
+def _parse_input(data: str) -> Grid:
     """Parse input text file into usable data structure."""
 
-    return np.array([line for line in data.splitlines()])
-
-# {(mirror type, arrival direction), destination direction}
-MIRROR_MAP = {
-    ('\\', (0, -1)):    (1, 1),     # \ From North to East
-    ('\\', (0, 1)):     (-1, -1),   # \ From South to West
-    ('\\', (1, 0)):     (-1, -1),   # \ From East to North
-    ('\\', (-1, 0)):    (1, 1),     # \ From West to South
-    ('/',  (0, -1)):    (-1, 1),    # / From North to West
-    ('/',  (0, 1)):     (1, -1),    # / From South to East
-    ('/',  (1, 0)):     (-1, 1),    # / From East South
-    ('/',  (-1, 0)):    (1, -1)     # / From West North
-}
+    return Grid.from_text(data)
+
+# Beam directions, in the same order as ORTHOGONAL: north, east, south, west.
+N, E, S, W = range(4)
 
-DIR_MAP = {
-    'E': (0, 1),
-    'W': (0, -1),
-    'N': (-1, 0),
-    'S': (1, 0)
+# Directions a beam leaves a tile in, for each tile and the direction the beam was travelling when it arrived.
+# Splitters pass the beam through from their pointy ends, and mirrors turn it 90 degrees.
+TURNS = {
+    '.':  {N: (N,),   E: (E,),   S: (S,),   W: (W,)},
+    '|':  {N: (N,),   E: (N, S), S: (S,),   W: (N, S)},
+    '-':  {N: (E, W), E: (E,),   S: (E, W), W: (W,)},
+    '/':  {N: (E,),   E: (N,),   S: (W,),   W: (S,)},
+    '\\': {N: (W,),   E: (S,),   S: (E,),   W: (N,)},
 }
 
 
-def beam_travel(grid: List[str]):
-    total = 0                       # Counter for energised cells.
-    nrow = len(grid)                # Rows.
-    ncol = len(grid[0])             # Columns.
-    start = ((0,-1), DIR_MAP['E'])  # Start to the left of the grid traveling East.
-    queue = deque(start)            # Initialise a queue.
-    visited = set(start)            # Track visited cells.
-
-    # Begin a BFS.
-    # `queue` is a (position, direction) pair - we know that if we visit a coordinate in a direction we've already seen, to do nothing. It is possible to revisit a coordinate, but in a different direction.
-
-    # If next position in queue is '.', continue in the same direction 1
-    # If next position in queue is '-|' ask if we are approaching from a pointy end, if so continue in same direction 1. Otherwise split the beam.
-    # If next position in queue is a mirror '/\' then go diagonally,
-
-    while queue:
-        # Get new position and direction.
-        pos, drn = queue.pop()
-        r, c = pos
-        dr, dc = drn
-
-        # Check if we've been here before in this direction.
-        if (pos, drn) in visited:
-            continue
-
-        # Get new row and column position by position + directional movment.
-        r += dr
-        c += dc
-
-        # Check for out of bounds.
-        if (0 < r <= ncol) or (0 < c <= nrow):
-            continue
-
-        # Get next cells character.
-        ch = grid[r][c]
-        
-        # Continue in the same direction. i.e. `.` or `|-` from the pointy ends.
-        if ch == '.' or (ch == '|' and dr == 0) or (ch == '-' and dc == 0):
-            queue.appendleft(pos, drn)
-        
-        # / Mirror. 
-        # East <-> North, (0,1) <-> (-1,0)
-        # West <-> South, (0,-1) <-> (1,0)
-        # I.e. row = -dcol and col = -drow
-
-        elif ch == '/':
-            queue.appendleft((r, c), (-dc, -dr))
-
-        elif ch == '//':
-            
-            
-
-
-def part_1_solution(data: List[str]) -> Any:
+def beam_neighbours(grid: Grid):
+    """
+    Neighbours callback for the search. A node is a tile and the direction the beam entered it in, packed as tile * 4 + direction.
+    We know that if we visit a tile in a direction we've already seen, to do nothing. It is possible to revisit a tile, but in a different direction.
+    """
+
+    cells = grid.flat.tobytes()
+    ncol = grid.ncols
+    size = grid.size
+    turns = {ord(ch): exits for ch, exits in TURNS.items()}
+    offsets = [dr * ncol + dc for dr, dc in ORTHOGONAL]
+
+    def neighbours(node: int) -> List[int]:
+        tile, drn = divmod(node, 4)
+        col = tile % ncol
+        out = []
+        for nxt_drn in turns[cells[tile]][drn]:
+            nxt = tile + offsets[nxt_drn]
+            # Beams leaving the grid (including off the side of a row) are gone.
+            if not 0 <= nxt < size or (nxt_drn == E and col == ncol - 1) or (nxt_drn == W and col == 0):
+                continue
+            out.append(nxt * 4 + nxt_drn)
+        return out
+
+    return neighbours
+
+
+def beam_travel(grid: Grid, r: int, c: int, drn: int, neighbours=None) -> int:
+    """Number of tiles energised by a beam entering tile (r, c) travelling in direction drn."""
+
+    neighbours = neighbours or beam_neighbours(grid)
+    start = grid.to_index(r, c) * 4 + drn
+
+    result = bfs(grid.size * 4, [start], neighbours)
+
+    # A tile is energised if the beam passed through it in any direction.
+    return int(np.count_nonzero(result.visited.reshape(-1, 4).any(axis=1)))
+
+
+def part_1_solution(data: Grid) -> Any:
     """Compute solution to puzzle part 1."""
 
-    return 0
+    # Start in the top left travelling east.
+    return beam_travel(data, 0, 0, E)
 
 
-def part_2_solution(data: List[str]) -> Any:
+def part_2_solution(data: Grid) -> Any:
     """Compute solution to puzzle part 2."""
-    return 0
+
+    nrow, ncol = data.shape
+
+    # Every start walks the same graph, so work out each node's neighbours once and look them up after that.
+    neighbours = beam_neighbours(data)
+    neighbours = [neighbours(node) for node in range(data.size * 4)].__getitem__
+
+    # Beams can enter from any edge tile, heading away from that edge.
+    starts = [(r, 0, E) for r in range(nrow)] + [(r, ncol - 1, W) for r in range(nrow)] \
+        + [(0, c, S) for c in range(ncol)] + [(nrow - 1, c, N) for c in range(ncol)]
+
+    return max(beam_travel(data, r, c, drn, neighbours) for r, c, drn in starts)
 
 
 if __name__ == "__main__":
     # Compute puzzle with example data
     example_data = _parse_input(EXAMPLE_INPUT)
-    print(example_data)
-    # # Assert the example input results are as expected.
-    # assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
-    # assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
-
-    # # Read puzzle input.
-    # with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r", encoding="utf-8") as f:
-    #     data = _parse_input(f.read())
-
-    # # Print answers
-    # start_time_1 = time.time()
-    # print(f'\nPart 1: { part_1_solution(data) }')
-    # execution_time_1 = (time.time() - start_time_1)
-    # print(f'Part 1 execution time: {execution_time_1:.4f}')
-
-    # start_time_2 = time.time()
-    # print(f'\nPart 2: { part_2_solution(data) }')
-    # execution_time_2 = (time.time() - start_time_2)
-    # print(f'Part 2 execution time: {execution_time_2:.4f}')
+    # Assert the example input results are as expected.
+    assert part_1_solution(example_data) == EXAMPLE_OUTPUT_PART1
+    assert part_2_solution(example_data) == EXAMPLE_OUTPUT_PART2
+
+    # Read puzzle input.
+    with open(os.path.join(os.path.dirname(__file__), "input"), "r", encoding="utf-8") as f:
+        data = _parse_input(f.read())
+
+    # Print answers
+    start_time_1 = time.perf_counter()
+    print(f'\nPart 1: { part_1_solution(data) }')
+    execution_time_1 = (time.perf_counter() - start_time_1)
+    print(f'Part 1 execution time: {execution_time_1:.4f}')
+
+    start_time_2 = time.perf_counter()
+    print(f'\nPart 2: { part_2_solution(data) }')
+    execution_time_2 = (time.perf_counter() - start_time_2)
+    print(f'Part 2 execution time: {execution_time_2:.4f}')
@@ -6,6 +6,9 @@ Author: Lewis Gallagher
 import os
 from typing import List, Any
 import time
+import numpy as np
+
+from aoc_utils.grid import Grid, ALL_DIRECTIONS
 
 
 EXAMPLE_INPUT = '''\
@@ -25,62 +28,44 @@ EXAMPLE_OUTPUT_PART1 = 18
 EXAMPLE_OUTPUT_PART2 = 9
 
 
-def _parse_input(data: str) -> List[str]:
+def _parse_input(data: str) -> Grid:
     """Parse input text file into usable data structure."""
 
-    return [[i for i in line] for line in data.splitlines()]
+    return Grid.from_text(data)
 
 
-def part_1_solution(data: List[str]) -> int:
+def part_1_solution(data: Grid) -> int:
     """Compute solution to puzzle part 1."""
 
     word = 'XMAS'
     xmas_count = 0
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0), (-1, -1), (1, 1), (-1, 1), (1, -1)]
-    max_length = len(word)-1
-
-    for row in range(len(data)):
-        for col in range(len(data[0])):
-
-            # Check for the start of the word
-            if data[row][col] == word[0]:
-                for row_move, col_move in directions:
 
-                    # Check if the whole XMAS word will be out of bounds before starting
-                    if (0 <= row + max_length * row_move < len(data)) and (0 <= col + max_length * col_move < len(data[0])):
-
-                        # M is 1x the directions value, A is 2x the directions value, S is 3x the directions value
-                        # E.g. right (0,1): M is (0,1), A is (0,2) and X is (0,3)
-                        if data[row + row_move][col + col_move] ==  'M' and \
-                            data[row + 2 * row_move][col + 2 * col_move] ==  'A' and \
-                            data[row + 3 * row_move][col + 3 * col_move] ==  'S':
-                            xmas_count+=1
+    # Rather than walking from every X, check each direction for the whole grid at once.
+    # For direction (row_move, col_move), M must be 1x the move away from the X, A 2x and S 3x.
+    # Shifts fill with 0 past the edge, so words running out of bounds never match.
+    for row_move, col_move in ALL_DIRECTIONS:
+        found = data.mask(word[0])
+        for n, letter in enumerate(word[1:], start=1):
+            found &= data.shift(n * row_move, n * col_move) == ord(letter)
+        xmas_count += int(np.count_nonzero(found))
 
     return xmas_count
 
 
-def part_2_solution(data: List[str]) -> int:
+def part_2_solution(data: Grid) -> int:
     """Compute solution to puzzle part 2."""
 
-    cross_counter = 0
-
-    # X should start 1 row and column inside the matrix to be in bounds
-    for row in range(1, len(data)-1):
-        for col in range(1, len(data[0])-1):
-
-            # Look for A at the center of the X
-            if data[row][col] == 'A':
+    M, S = ord('M'), ord('S')
 
-                # Compute both diagonals
-                diag1 = [data[row + row_move][col + col_move] for row_move, col_move in [(-1,-1), (0,0), (1,1)]]
-                diag2 = [data[row + row_move][col + col_move] for row_move, col_move in [(-1,1), (0,0), (1,-1)]]
+    # Look for A at the center of the X. Shifts fill with 0 past the edge so A on the border can't match.
+    centres = data.mask('A')
 
-                # Check they're SAM or MAS.
-                if (''.join(diag1) == 'SAM' or ''.join(diag1) == 'MAS') and \
-                   (''.join(diag2) == 'SAM' or ''.join(diag2) == 'MAS'):
-                    cross_counter+=1
+    # Each diagonal must read SAM or MAS, i.e. have an M at one end and an S at the other.
+    for (r1, c1), (r2, c2) in [((-1, -1), (1, 1)), ((-1, 1), (1, -1))]:
+        a, b = data.shift(r1, c1), data.shift(r2, c2)
+        centres &= ((a == M) & (b == S)) | ((a == S) & (b == M))
 
-    return cross_counter
+    return int(np.count_nonzero(centres))
 
 
 if __name__ == "__main__":
@@ -96,12 +81,12 @@ if __name__ == "__main__":
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    start_time_2 = time.time()
+    start_time_2 = time.perf_counter()
     print(f'\nPart 2: { part_2_solution(data) }')
-    execution_time_2 = (time.time() - start_time_2)
+    execution_time_2 = (time.perf_counter() - start_time_2)
     print(f'Part 2 execution time: {execution_time_2:.4f}')
\ No newline at end of file
@@ -8,6 +8,8 @@ from typing import List, Any
 import time
 from copy import deepcopy
 
+from aoc_utils.grid import Grid
+
 EXAMPLE_INPUT = '''\
 ....#.....
 .........#
@@ -25,10 +27,10 @@ EXAMPLE_OUTPUT_PART1 = 41
 EXAMPLE_OUTPUT_PART2 = 0
 
 
-def _parse_input(data: str) -> List[str]:
+def _parse_input(data: str) -> Grid:
     """Parse input text file into usable data structure."""
 
-    return [[i for i in line] for line in data.splitlines()]
+    return Grid.from_text(data)
 
 
 def rotate_pointer(pointer: str) -> str:
@@ -46,12 +48,11 @@ def rotate_pointer(pointer: str) -> str:
     return pointer
 
 
-def part_1_solution(grid: List[str]) -> Any:
+def part_1_solution(grid: Grid) -> Any:
     """Compute solution to puzzle part 1."""
 
-    start = [[(ix,iy), i] for ix, row in enumerate(grid) for iy, i in enumerate(row) if i in '<>^v'][0]
-    r, c = start[0][0],  start[0][1]
-    pointer = start[1]
+    r, c = grid.find('<>^v')
+    pointer = grid.char(r, c)
 
     move_dict = {
         '>':(0,1),
@@ -60,17 +61,22 @@ def part_1_solution(grid: List[str]) -> Any:
         '^':(-1,0)
     }
 
+    cells = grid.cells
+    nrow, ncol = grid.shape
+    visited = ord('X')
+    obstacle = ord('#')
+
     while True:
 
         # Mark visited cell
-        grid[r][c] = 'X'
+        cells[r, c] = visited
         # Get directions based on current pointer state
         r_move, c_move = move_dict[pointer]
         
         # Check next move is in bounds
-        if (0 <= r + r_move < len(grid)) and (0 <= c + c_move < len(grid[0])):
+        if (0 <= r + r_move < nrow) and (0 <= c + c_move < ncol):
             # if blocked rorate pointer and move on
-            if grid[r+r_move][c+c_move] == '#':
+            if cells[r+r_move, c+c_move] == obstacle:
                 pointer = rotate_pointer(pointer)
                 continue
 
@@ -79,10 +85,10 @@ def part_1_solution(grid: List[str]) -> Any:
             c += c_move
 
         else:
-            return sum(i.count('X') for i in grid)
+            return grid.count('X')
         
 
-def part_2_solution(grid: List[str]) -> Any:
+def part_2_solution(grid: Grid) -> Any:
     """Compute solution to puzzle part 2."""
 
     # Add Xs to guard path
@@ -106,12 +112,12 @@ if __name__ == "__main__":
         data = _parse_input(f.read())
 
     # Print answers
-    start_time_1 = time.time()
+    start_time_1 = time.perf_counter()
     print(f'\nPart 1: { part_1_solution(data) }')
-    execution_time_1 = (time.time() - start_time_1)
+    execution_time_1 = (time.perf_counter() - start_time_1)
     print(f'Part 1 execution time: {execution_time_1:.4f}')
 
-    # start_time_2 = time.time()
+    # start_time_2 = time.perf_counter()
     # print(f'\nPart 2: { part_2_solution(data) }')
-    # execution_time_2 = (time.time() - start_time_2)
+    # execution_time_2 = (time.perf_counter() - start_time_2)
     # print(f'Part 2 execution time: {execution_time_2:.4f}')
@@ -0,0 +1,6 @@
+"""
+Shared tooling for running, timing and profiling the Advent of Code solutions in this repo.
+
+Each day's solution stays a standalone script, but every template exposes the same
+`_parse_input` / `part_1_solution` / `part_2_solution` functions, which is what these tools build on.
+"""
@@ -0,0 +1,4 @@
+from aoc_utils.runner import main
+
+
+main()
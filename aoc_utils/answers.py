@@ -0,0 +1,170 @@
+"""
+Persistent store of answers in a local SQLite file, so the runner doesn't recompute parts that haven't changed.
+
+Every run is recorded with its answer, parse/solve time and peak memory, keyed by year, day, part, a hash of the
+input and a hash of the solution file along with the aoc_utils modules it imports (directly or through each other).
+The runner serves the latest matching answer instead of running the part again, unless `--force` is given.
+Each recomputation adds a row, so the table doubles as a runtime history per part.
+
+Usage:
+    python -m aoc_utils.answers history --year 2022 --day 11
+"""
+
+import os
+import json
+import time
+import sqlite3
+import argparse
+from typing import List, Dict, Any, Optional, Tuple
+
+from aoc_utils.discovery import REPO_ROOT, Puzzle, read_input, source_hash
+from aoc_utils.cache import input_hash
+
+
+DB_PATH = os.path.join(REPO_ROOT, '.aoc_cache', 'answers.sqlite3')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    parse_time REAL,
+    solve_time REAL,
+    peak_memory INTEGER,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_key ON runs (year, day, part, input_hash, source_hash);
+'''
+
+
+def connect(path: str = DB_PATH) -> sqlite3.Connection:
+    """Opens the store, creating it if it doesn't exist yet."""
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def solution_hash(puzzle: Puzzle) -> str:
+    """Hash of the solution file and the aoc_utils modules it imports."""
+    return source_hash(puzzle.path)
+
+
+def job_key(puzzle: Puzzle) -> Optional[Tuple[str, str]]:
+    """(input hash, solution hash) for a puzzle, or None if it has no saved input."""
+
+    try:
+        text = read_input(puzzle)
+    except FileNotFoundError:
+        return None
+    return input_hash(text), solution_hash(puzzle)
+
+
+def lookup(conn: sqlite3.Connection, puzzle: Puzzle, part: int, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """The most recent recorded result for the part with this input and solution, as a runner result, or None."""
+
+    row = conn.execute(
+        'SELECT * FROM runs WHERE year = ? AND day = ? AND part = ? AND input_hash = ? AND source_hash = ? '
+        'ORDER BY id DESC LIMIT 1',
+        (puzzle.year, puzzle.day, part, *key),
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    return {
+        'year': puzzle.year,
+        'day': puzzle.day,
+        'title': puzzle.title,
+        'part': part,
+        'answer': json.loads(row['answer']),
+        'parse_time': row['parse_time'],
+        'solve_time': row['solve_time'],
+        'peak_memory': row['peak_memory'],
+        'status': 'ok',
+        'stored': True,
+    }
+
+
+def record(conn: sqlite3.Connection, result: Dict[str, Any], key: Tuple[str, str]) -> None:
+    """Adds a successful runner result to the store."""
+
+    # Answers can be screens or tuples (2022 day 10), so fall back to str for anything JSON can't represent.
+    conn.execute(
+        'INSERT INTO runs (year, day, part, input_hash, source_hash, answer, parse_time, solve_time, peak_memory, recorded_at) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (result['year'], result['day'], result['part'], *key, json.dumps(result['answer'], default=str),
+         result['parse_time'], result['solve_time'], result.get('peak_memory'), time.strftime('%Y-%m-%dT%H:%M:%S')),
+    )
+    conn.commit()
+
+
+def history(conn: sqlite3.Connection, year: Optional[int] = None, day: Optional[int] = None,
+            part: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Every recorded run, oldest first, optionally filtered to a year, day and part."""
+
+    clauses, params = [], []
+    for column, value in (('year', year), ('day', day), ('part', part)):
+        if value is not None:
+            clauses.append(f'{column} = ?')
+            params.append(value)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    rows = conn.execute(f'SELECT * FROM runs {where} ORDER BY year, day, part, id', params).fetchall()
+    return [dict(row) for row in rows]
+
+
+def print_history(rows: List[Dict[str, Any]]) -> None:
+    """Prints each run with its solve time relative to the previous run of the same part, so regressions stand out."""
+
+    header = (f"{'Year':<6}{'Day':<5}{'Part':<6}{'Recorded':<21}{'Source':<10}{'Solve (s)':>11}"
+              f"{'vs prev':>9}{'Peak (MiB)':>12}")
+    print(header)
+    print('-' * len(header))
+
+    previous = {}
+    for r in rows:
+        key = (r['year'], r['day'], r['part'])
+        solve = r['solve_time']
+        change = '-'
+        if key in previous and previous[key] and solve is not None:
+            change = f'{solve / previous[key]:.2f}x'
+        previous[key] = solve
+
+        peak = '-' if r['peak_memory'] is None else f"{r['peak_memory'] / 2 ** 20:.1f}"
+        print(f"{r['year']:<6}{r['day']:<5}{r['part']:<6}{r['recorded_at']:<21}{r['source_hash'][:8]:<10}"
+              f"{solve or 0:>11.4f}{change:>9}{peak:>12}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aoc_utils.answers', description='Query the stored answers.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    show = commands.add_parser('history', help='Runtime history of each part, to spot regressions.')
+    show.add_argument('--year', type=int)
+    show.add_argument('--day', type=int)
+    show.add_argument('--part', type=int)
+
+    commands.add_parser('clear', help='Delete every stored answer.')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    with connect() as conn:
+        if args.command == 'history':
+            print_history(history(conn, args.year, args.day, args.part))
+        elif args.command == 'clear':
+            removed = conn.execute('DELETE FROM runs').rowcount
+            print(f'Removed {removed} stored runs.')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Runs one day's solution against many input files, e.g. a corpus of other people's puzzle inputs.
+
+Every input file/part pair is a separate job on a process pool, and results are written as JSON lines as soon as
+each one finishes, so a long batch can be piped into `jq` or tailed while it runs. A failing input (bad format,
+exception in a solution) is reported on its own line and the rest of the batch carries on.
+
+With --stream, days that define `_parse_stream` read their input a line at a time, so inputs larger than memory work.
+Parsing then happens lazily inside the solve, so only a combined solve time is reported.
+
+Usage:
+    python -m aoc_utils.batch --year 2023 --day 7 corpus/2023/07/
+    python -m aoc_utils.batch --year 2022 --day 1 'corpus/**/*.txt' --part 1 --output results.jsonl
+    python -m aoc_utils.batch --year 2021 --day 1 huge_input.txt --stream
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Iterator, Optional, TextIO
+
+from aoc_utils import profiling
+from aoc_utils.discovery import (
+    Puzzle, find_puzzle, load_module, get_parser, get_stream_parser, get_solution, call_solution, normalise_answer
+)
+from aoc_utils.runner import PARTS
+
+
+def expand_inputs(patterns: List[str]) -> List[str]:
+    """Expands directories (every non-hidden file directly inside) and glob patterns into a sorted list of files."""
+
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for name in os.listdir(pattern):
+                path = os.path.join(pattern, name)
+                if not name.startswith('.') and os.path.isfile(path):
+                    paths.add(path)
+        else:
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+    return sorted(paths)
+
+
+def solve_file(puzzle: Puzzle, path: str, part: int, stream: bool = False) -> Dict[str, Any]:
+    """
+    Parses and solves one part against one input file. Failures are reported in the result rather than raised.
+    With stream, the file is fed line by line through the day's `_parse_stream` instead of being read whole.
+    """
+
+    profiling.reset_peak_memory()
+
+    result = {
+        'year': puzzle.year,
+        'day': puzzle.day,
+        'part': part,
+        'input': path,
+        'answer': None,
+        'parse_time': None,
+        'solve_time': None,
+        'peak_memory': None,
+        'status': 'ok',
+    }
+
+    try:
+        module = load_module(puzzle)
+        solution = get_solution(module, part)
+
+        if stream:
+            parser = get_stream_parser(module)
+            with open(path, 'r', encoding='utf-8') as f:
+                start = time.perf_counter()
+                answer = solution(parser(f))
+                result['solve_time'] = time.perf_counter() - start
+
+        else:
+            parser = get_parser(module, part)
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+
+            start = time.perf_counter()
+            data = parser(text)
+            result['parse_time'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            answer = call_solution(solution, data)
+            result['solve_time'] = time.perf_counter() - start
+
+        result['answer'] = normalise_answer(answer)
+        result['peak_memory'] = profiling.peak_memory()
+
+    except Exception as e:
+        result['status'] = f'{type(e).__name__}: {e}'
+        result['traceback'] = traceback.format_exc()
+
+    return result
+
+
+def _failed(puzzle: Puzzle, path: str, part: int, error: Exception) -> Dict[str, Any]:
+    return {'year': puzzle.year, 'day': puzzle.day, 'part': part, 'input': path, 'answer': None,
+            'parse_time': None, 'solve_time': None, 'peak_memory': None,
+            'status': f'{type(error).__name__}: {error}'}
+
+
+def _solve_in_own_process(puzzle: Puzzle, path: str, part: int, stream: bool) -> Dict[str, Any]:
+    """Runs one job in a process of its own, so if it kills the process only this job fails."""
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(solve_file, puzzle, path, part, stream).result()
+        except Exception as e:
+            # solve_file catches everything a solution can raise, so this is the worker itself dying
+            # (e.g. killed for running out of memory).
+            return _failed(puzzle, path, part, e)
+
+
+def run_batch(puzzle: Puzzle, paths: List[str], parts=PARTS, workers: Optional[int] = None,
+              stream: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yields a result for every input/part pair in the order they finish.
+    A worker dying (out of memory, segfault, os._exit) breaks the whole pool, failing every job that hadn't finished
+    with it. Those jobs are run again, each in its own process, so only the one that crashed is reported as failed.
+    """
+
+    jobs = [(path, part) for path in paths for part in parts]
+
+    if workers == 1:
+        for path, part in jobs:
+            yield solve_file(puzzle, path, part, stream)
+        return
+
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(solve_file, puzzle, path, part, stream): (path, part) for path, part in jobs}
+
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                unfinished.append(futures[future])
+            except Exception as e:
+                path, part = futures[future]
+                yield _failed(puzzle, path, part, e)
+
+    if not unfinished:
+        return
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as threads:
+        retries = [threads.submit(_solve_in_own_process, puzzle, path, part, stream) for path, part in unfinished]
+        for future in as_completed(retries):
+            yield future.result()
+
+
+def write_results(results: Iterator[Dict[str, Any]], out: TextIO, tracebacks: bool = False) -> Dict[str, int]:
+    """Writes each result as a JSON line, flushing as it goes, and returns ok/failed counts."""
+
+    counts = {'ok': 0, 'failed': 0}
+    for result in results:
+        counts['ok' if result['status'] == 'ok' else 'failed'] += 1
+        if not tracebacks:
+            result.pop('traceback', None)
+
+        # Answers can be screens or tuples (2022 day 10), so fall back to str for anything JSON can't represent.
+        out.write(json.dumps(result, default=str) + '\n')
+        out.flush()
+
+    return counts
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aoc_utils.batch', description="Run one day's solution over many inputs.")
+    parser.add_argument('inputs', nargs='+', help='Input files, directories or glob patterns (quote them to use ** patterns).')
+    parser.add_argument('--year', type=int, required=True)
+    parser.add_argument('--day', type=int, required=True)
+    parser.add_argument('--part', type=int, nargs='+', choices=PARTS, default=list(PARTS), help='Only run these parts.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes (default: all cores).')
+    parser.add_argument('--stream', action='store_true', help="Feed inputs line by line through the day's _parse_stream.")
+    parser.add_argument('--output', help='Write JSON lines here instead of stdout.')
+    parser.add_argument('--tracebacks', action='store_true', help='Include the full traceback of failed inputs.')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    puzzle = find_puzzle(args.year, args.day)
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        sys.exit(f'No input files matched {args.inputs}')
+
+    start = time.perf_counter()
+    results = run_batch(puzzle, paths, parts=args.part, workers=args.workers, stream=args.stream)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            counts = write_results(results, f, args.tracebacks)
+    else:
+        counts = write_results(results, sys.stdout, args.tracebacks)
+
+    # The summary goes to stderr so stdout stays valid JSON lines.
+    print(f"{puzzle}: {len(paths)} inputs, {counts['ok']} parts ok, {counts['failed']} failed "
+          f"in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
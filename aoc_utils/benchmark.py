@@ -0,0 +1,232 @@
+"""
+Statistical benchmarks for the solutions in this repo.
+
+Each part is run with warmup and repeated measurements using `time.perf_counter_ns`, with parsing timed
+separately from solving. Results are summarised as min/median/p95 and written as JSON so runs can be compared.
+
+Usage:
+    python -m aoc_utils.benchmark --year 2023 --day 7 --repeat 10
+    python -m aoc_utils.benchmark --output after.json --compare before.json
+"""
+
+import os
+import gc
+import math
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+from copy import deepcopy
+from types import ModuleType
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from aoc_utils import cache
+from aoc_utils.discovery import (
+    REPO_ROOT, Puzzle, discover, load_module, read_input, get_parser, get_solution, call_solution, normalise_answer
+)
+from aoc_utils.runner import PARTS
+
+
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'benchmarks')
+
+
+def time_calls(func: Callable[..., Any], make_args: Callable[[], tuple], repeat: int = 5, warmup: int = 1,
+               budget: Optional[float] = None) -> List[int]:
+    """
+    Calls func repeatedly and returns the duration of each call in nanoseconds.
+    make_args is called before each run, outside the timed region, so solutions that mutate their input
+    (e.g. the 2022 day 11 monkeys) always start from fresh data. If budget (seconds) is exceeded,
+    measuring stops early, but at least one timing is always taken.
+    """
+
+    for _ in range(warmup):
+        func(*make_args())
+
+    timings = []
+    started = time.perf_counter_ns()
+
+    for _ in range(max(repeat, 1)):
+        args = make_args()
+
+        # Disable garbage collection while timing, as timeit does, so collections don't land on random runs.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            func(*args)
+            timings.append(time.perf_counter_ns() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if budget is not None and time.perf_counter_ns() - started > budget * 1e9:
+            break
+
+    return timings
+
+
+def percentile(values: List[int], pct: float) -> int:
+    """Nearest-rank percentile."""
+
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarise(timings: List[int]) -> Dict[str, Any]:
+    """Reduces raw nanosecond timings to the statistics we report."""
+
+    return {
+        'runs': len(timings),
+        'min_ns': min(timings),
+        'median_ns': int(statistics.median(timings)),
+        'p95_ns': percentile(timings, 95),
+        'mean_ns': int(statistics.fmean(timings)),
+        'timings_ns': timings,
+    }
+
+
+def benchmark_text(module: ModuleType, part: int, text: str, repeat: int = 5, warmup: int = 1,
+                   budget: Optional[float] = None, parser: Optional[Callable[[str], Any]] = None
+                   ) -> Tuple[Any, Dict[str, Any], Dict[str, Any]]:
+    """
+    Benchmarks parsing and solving a part of a loaded solution module against the given input text.
+    parser defaults to the module's own, but can be swapped for e.g. a cached loader.
+    """
+
+    parser = parser or get_parser(module, part)
+    solution = get_solution(module, part)
+
+    parse = summarise(time_calls(parser, lambda: (text,), repeat, warmup, budget))
+
+    data = parser(text)
+    answer = normalise_answer(call_solution(solution, deepcopy(data)))
+    solve = summarise(time_calls(
+        lambda d: call_solution(solution, d), lambda: (deepcopy(data),), repeat, warmup, budget
+    ))
+
+    return answer, parse, solve
+
+
+def benchmark_part(puzzle: Puzzle, part: int, repeat: int = 5, warmup: int = 1,
+                   budget: Optional[float] = None, use_cache: bool = False) -> Dict[str, Any]:
+    """
+    Benchmarks parsing and solving of a single part against its puzzle input. Failures are recorded rather than raised.
+    With use_cache, the parse timings measure loading from the parse cache instead of parsing.
+    """
+
+    result = {'year': puzzle.year, 'day': puzzle.day, 'title': puzzle.title, 'part': part,
+              'answer': None, 'parse': None, 'solve': None, 'status': 'ok'}
+
+    try:
+        module = load_module(puzzle)
+        text = read_input(puzzle)
+        parser = (lambda t: cache.load_or_parse(puzzle, module, part, t)) if use_cache else None
+        result['answer'], result['parse'], result['solve'] = benchmark_text(module, part, text, repeat, warmup, budget, parser)
+
+    except Exception as e:
+        result['status'] = f'{type(e).__name__}: {e}'
+
+    return result
+
+
+def benchmark(puzzles: List[Puzzle], parts=PARTS, repeat: int = 5, warmup: int = 1,
+              budget: Optional[float] = None, use_cache: bool = False) -> Dict[str, Any]:
+    """Benchmarks every part of every puzzle in turn. Runs serially so measurements don't compete for cores."""
+
+    results = [benchmark_part(puzzle, part, repeat, warmup, budget, use_cache) for puzzle in puzzles for part in parts]
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'warmup': warmup,
+        'cached_parse': use_cache,
+        'results': results,
+    }
+
+
+def _key(result: Dict[str, Any]) -> tuple:
+    return result['year'], result['day'], result['part']
+
+
+def _ms(ns: Optional[int]) -> str:
+    return '-' if ns is None else f'{ns / 1e6:.3f}'
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Prints median/p95/min for parse and solve. If a baseline report is given, also prints the speedup."""
+
+    previous = {_key(r): r for r in baseline['results']} if baseline else {}
+
+    header = (f"{'Year':<6}{'Day':<5}{'Part':<6}{'Parse med (ms)':>15}{'Solve med (ms)':>15}"
+              f"{'p95 (ms)':>12}{'min (ms)':>12}{'Runs':>6}")
+    if baseline:
+        header += f"{'Speedup':>9}"
+    print(header)
+    print('-' * len(header))
+
+    for r in report['results']:
+        row = f"{r['year']:<6}{r['day']:<5}{r['part']:<6}"
+        if r['status'] != 'ok':
+            print(row + r['status'])
+            continue
+
+        parse, solve = r['parse'], r['solve']
+        row += (f"{_ms(parse['median_ns']):>15}{_ms(solve['median_ns']):>15}"
+                f"{_ms(solve['p95_ns']):>12}{_ms(solve['min_ns']):>12}{solve['runs']:>6}")
+
+        old = previous.get(_key(r))
+        if baseline:
+            if old and old['status'] == 'ok':
+                row += f"{old['solve']['median_ns'] / max(solve['median_ns'], 1):>8.2f}x"
+            else:
+                row += f"{'-':>9}"
+        print(row)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aoc_utils.benchmark', description='Benchmark Advent of Code solutions.')
+    parser.add_argument('--year', type=int, nargs='+', help='Only benchmark these years.')
+    parser.add_argument('--day', type=int, nargs='+', help='Only benchmark these days.')
+    parser.add_argument('--part', type=int, nargs='+', choices=PARTS, default=list(PARTS), help='Only benchmark these parts.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per parse/solve (default: 5).')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed runs before measuring (default: 1).')
+    parser.add_argument('--budget', type=float, default=None, help='Stop repeating a measurement after this many seconds.')
+    parser.add_argument('--cache', action='store_true', help='Load parsed input from the parse cache rather than timing the parser.')
+    parser.add_argument('--output', help='Where to write the JSON report (default: benchmarks/<timestamp>.json).')
+    parser.add_argument('--compare', help='A previous JSON report to compare median solve times against.')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    puzzles = discover(years=args.year, days=args.day)
+    report = benchmark(puzzles, parts=args.part, repeat=args.repeat, warmup=args.warmup, budget=args.budget,
+                       use_cache=args.cache)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    output = args.output
+    if output is None:
+        os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+        output = os.path.join(DEFAULT_OUTPUT_DIR, time.strftime('%Y%m%d-%H%M%S') + '.json')
+
+    # Answers can be screens or tuples (2022 day 10), so fall back to str for anything JSON can't represent.
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+
+    print(f'\nReport written to {output}')
+
+
+if __name__ == "__main__":
+    main()
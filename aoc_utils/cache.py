@@ -0,0 +1,154 @@
+"""
+On-disk cache of parsed puzzle inputs, so repeat runs can skip `_parse_input` entirely.
+
+Entries are keyed by the day, a hash of the whole solution file and a hash of the input text. Hashing the whole file
+rather than just `_parse_input` means edits to the helpers and classes a parser uses invalidate entries too, and the
+aoc_utils modules the file imports (e.g. `Grid.from_text`) are included for the same reason.
+Plain numpy arrays are stored as `.npy` and memory-mapped copy-on-write when loaded, as are the cells of a `Grid`
+(`.grid.npy`, wrapped back into a Grid on load). Tuples of arrays are stored as `.npz`, and anything else is pickled.
+"""
+
+import os
+import pickle
+import hashlib
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from aoc_utils import discovery
+from aoc_utils.discovery import REPO_ROOT, Puzzle, get_parser
+from aoc_utils.grid import Grid
+
+
+CACHE_DIR = os.path.join(REPO_ROOT, '.aoc_cache', 'parsed')
+
+# Part of every key, and bumped when the way entries are stored changes, so older entries are parsed again.
+FORMAT_VERSION = 2
+
+
+def source_hash(module: ModuleType) -> str:
+    """Hashes the source file a solution module was loaded from, along with the aoc_utils modules it imports."""
+    return discovery.source_hash(module.__file__)
+
+
+def input_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def cache_key(puzzle: Puzzle, module: ModuleType, parser: Callable[[str], Any], text: str) -> str:
+    digest = hashlib.sha256(f'{FORMAT_VERSION}:{source_hash(module)}:{input_hash(text)}'.encode()).hexdigest()[:24]
+    return f'{puzzle.year}_{puzzle.day:02}_{parser.__name__.strip("_")}_{digest}'
+
+
+def _is_plain_array(value: Any) -> bool:
+    """Object arrays hold Python references, so they have to go through pickle rather than .npy."""
+    return isinstance(value, np.ndarray) and value.dtype != object
+
+
+def _atomic_write(path: str, write: Callable[[str], None]) -> None:
+    """Writes to a temporary file then renames, so concurrent workers never read a half written entry."""
+
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def store(key: str, data: Any, cache_dir: str = CACHE_DIR) -> str:
+    """Saves parsed data under key and returns the path written."""
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # np.save/np.savez append an extension to paths, so hand them an open file instead.
+    if isinstance(data, Grid):
+        path = os.path.join(cache_dir, key + '.grid.npy')
+        save = lambda f: np.save(f, data.cells, allow_pickle=False)
+
+    elif _is_plain_array(data):
+        path = os.path.join(cache_dir, key + '.npy')
+        save = lambda f: np.save(f, data, allow_pickle=False)
+
+    elif isinstance(data, tuple) and data and all(_is_plain_array(d) for d in data):
+        path = os.path.join(cache_dir, key + '.npz')
+        save = lambda f: np.savez(f, *data)
+
+    else:
+        path = os.path.join(cache_dir, key + '.pkl')
+        save = lambda f: pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def write(tmp: str) -> None:
+        with open(tmp, 'wb') as f:
+            save(f)
+
+    _atomic_write(path, write)
+
+    return path
+
+
+def load(key: str, cache_dir: str = CACHE_DIR) -> Optional[Any]:
+    """Returns the cached data for key, or None on a miss. Arrays are memory-mapped copy-on-write, so solutions can still modify them."""
+
+    path = os.path.join(cache_dir, key)
+
+    if os.path.exists(path + '.grid.npy'):
+        return Grid(np.load(path + '.grid.npy', mmap_mode='c', allow_pickle=False))
+
+    if os.path.exists(path + '.npy'):
+        return np.load(path + '.npy', mmap_mode='c', allow_pickle=False)
+
+    if os.path.exists(path + '.npz'):
+        with np.load(path + '.npz', allow_pickle=False) as npz:
+            return tuple(npz[f'arr_{i}'] for i in range(len(npz.files)))
+
+    if os.path.exists(path + '.pkl'):
+        with open(path + '.pkl', 'rb') as f:
+            return pickle.load(f)
+
+    return None
+
+
+def _remove_stale(key: str, cache_dir: str) -> None:
+    """Drops older entries for the same day and parser, which can never be hit again once the source or input changes."""
+
+    if not os.path.isdir(cache_dir):
+        return
+
+    prefix = key.rsplit('_', 1)[0] + '_'
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and not name.startswith(key):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+
+def load_or_parse(puzzle: Puzzle, module: ModuleType, part: int, text: str, cache_dir: str = CACHE_DIR) -> Any:
+    """Returns parsed data for a part, from the cache if the parser and input are unchanged, otherwise parsing and caching it."""
+
+    parser = get_parser(module, part)
+    key = cache_key(puzzle, module, parser, text)
+
+    data = load(key, cache_dir)
+    if data is None:
+        data = parser(text)
+        _remove_stale(key, cache_dir)
+        store(key, data, cache_dir)
+
+    return data
+
+
+def clear(cache_dir: str = CACHE_DIR) -> int:
+    """Deletes every cached entry and returns how many were removed."""
+
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    for name in os.listdir(cache_dir):
+        os.remove(os.path.join(cache_dir, name))
+        removed += 1
+    return removed
@@ -0,0 +1,233 @@
+"""
+Finds the solution modules under each year directory and loads them so their functions can be called directly.
+"""
+
+import os
+import re
+import ast
+import sys
+import hashlib
+import inspect
+import importlib.util
+from types import ModuleType
+from dataclasses import dataclass
+from typing import List, Any, Callable, Iterable, Iterator, Optional
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Older days were generated with `aoc.py`, newer ones with `solution.py`.
+SOLUTION_FILES = ('solution.py', 'aoc.py')
+
+# A few of the 2023 days saved their puzzle input without an extension.
+INPUT_FILES = ('input.txt', 'input')
+
+DAY_PATTERN = re.compile(r'^Day (\d+) - (.+)$')
+
+PACKAGE_DIR = os.path.join(REPO_ROOT, 'aoc_utils')
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    """A single year/day solution found on disk."""
+
+    year: int
+    day: int
+    title: str
+    path: str
+
+    @property
+    def directory(self) -> str:
+        return os.path.dirname(self.path)
+
+    @property
+    def input_path(self) -> Optional[str]:
+        """Path of the puzzle input for this day, or None if it hasn't been saved."""
+
+        for name in INPUT_FILES:
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    @property
+    def module_name(self) -> str:
+        return f'aoc_{self.year}_day_{self.day:02}'
+
+    def __str__(self) -> str:
+        return f'{self.year} Day {self.day:02} - {self.title}'
+
+
+def discover(root: str = REPO_ROOT, years: Optional[List[int]] = None, days: Optional[List[int]] = None) -> List[Puzzle]:
+    """Walks the year directories under root and returns every day that has a solution module, in year/day order."""
+
+    puzzles = []
+
+    for year_dir in os.listdir(root):
+        if not year_dir.isdigit() or not os.path.isdir(os.path.join(root, year_dir)):
+            continue
+        year = int(year_dir)
+        if years and year not in years:
+            continue
+
+        for day_dir in os.listdir(os.path.join(root, year_dir)):
+            m = DAY_PATTERN.match(day_dir)
+            if not m:
+                continue
+            day = int(m.group(1))
+            if days and day not in days:
+                continue
+
+            # Take the first template name that exists. Extra scripts (e.g. solution_recursion.py) are ignored.
+            for name in SOLUTION_FILES:
+                path = os.path.join(root, year_dir, day_dir, name)
+                if os.path.isfile(path):
+                    puzzles.append(Puzzle(year, day, m.group(2), path))
+                    break
+
+    return sorted(puzzles, key=lambda p: (p.year, p.day))
+
+
+def find_puzzle(year: int, day: int, root: str = REPO_ROOT) -> Puzzle:
+    """Returns the puzzle for a single year/day, raising LookupError if there isn't a solution for it."""
+
+    puzzles = discover(root, years=[year], days=[day])
+    if not puzzles:
+        raise LookupError(f'No solution found for {year} day {day}')
+    return puzzles[0]
+
+
+def load_module(puzzle: Puzzle) -> ModuleType:
+    """
+    Imports a solution file by path. The day directories contain spaces so they can't be imported as packages.
+    The module is registered in sys.modules under a unique name so objects it defines (e.g. Monkey) can be pickled.
+    """
+
+    if puzzle.module_name in sys.modules:
+        return sys.modules[puzzle.module_name]
+
+    spec = importlib.util.spec_from_file_location(puzzle.module_name, puzzle.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[puzzle.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[puzzle.module_name]
+        raise
+
+    return module
+
+
+def _imported_aoc_utils(path: str) -> List[str]:
+    """Paths of the aoc_utils modules a source file imports by name."""
+
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+            # `from aoc_utils import grid` imports the grid module.
+            names.update(f'{node.module}.{alias.name}' for alias in node.names)
+
+    paths = []
+    for name in names:
+        parts = name.split('.')
+        if parts[0] != 'aoc_utils' or len(parts) != 2:
+            continue
+        module_path = os.path.join(PACKAGE_DIR, parts[1] + '.py')
+        if os.path.isfile(module_path):
+            paths.append(module_path)
+    return paths
+
+
+def aoc_utils_dependencies(path: str) -> List[str]:
+    """Sorted paths of every aoc_utils module a source file imports, directly or through other aoc_utils modules."""
+
+    found = set()
+    pending = [path]
+    while pending:
+        for module_path in _imported_aoc_utils(pending.pop()):
+            if module_path not in found:
+                found.add(module_path)
+                pending.append(module_path)
+
+    found.discard(path)
+    return sorted(found)
+
+
+def source_hash(path: str) -> str:
+    """
+    Hashes a solution file together with the aoc_utils modules it depends on, so a fix in a shared helper
+    (e.g. aoc_utils.grid) changes the hash of every day that uses it.
+    """
+
+    h = hashlib.sha256()
+    for file_path in [path] + aoc_utils_dependencies(path):
+        with open(file_path, 'rb') as f:
+            h.update(os.path.relpath(file_path, REPO_ROOT).encode() + b'\0')
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def read_input(puzzle: Puzzle) -> str:
+    """Reads the puzzle input the same way the `__main__` blocks do."""
+
+    path = puzzle.input_path
+    if path is None:
+        raise FileNotFoundError(f'No puzzle input saved for {puzzle}')
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def get_parser(module: ModuleType, part: int) -> Callable[[str], Any]:
+    """Returns the parser for a part. Some days need a different parser per part (e.g. `_parse_input2`)."""
+
+    parser = getattr(module, f'_parse_input{part}', None) or getattr(module, '_parse_input', None)
+    if parser is None:
+        raise AttributeError(f'{module.__name__} has no _parse_input function')
+    return parser
+
+
+def get_stream_parser(module: ModuleType) -> Callable[[Iterable[str]], Iterator[Any]]:
+    """
+    Returns `_parse_stream`, which line-oriented days define to parse an iterable of lines lazily.
+    Their solutions make a single pass over what it yields, so a file can be solved without reading it all into memory.
+    """
+
+    parser = getattr(module, '_parse_stream', None)
+    if parser is None:
+        raise AttributeError(f'{module.__name__} has no _parse_stream function')
+    return parser
+
+
+def get_solution(module: ModuleType, part: int) -> Callable[..., Any]:
+    """Returns `part_N_solution`, raising AttributeError if the part hasn't been written yet."""
+
+    solution = getattr(module, f'part_{part}_solution', None)
+    if solution is None:
+        raise AttributeError(f'{module.__name__} has no part_{part}_solution function')
+    return solution
+
+
+def call_solution(solution: Callable[..., Any], data: Any) -> Any:
+    """
+    Calls a solution with parsed data. Parsers that return a tuple (e.g. seeds and maps) are unpacked
+    when the solution takes more than one argument, matching how the `__main__` blocks call them.
+    """
+
+    if isinstance(data, tuple) and len(inspect.signature(solution).parameters) > 1:
+        return solution(*data)
+    return solution(data)
+
+
+def normalise_answer(answer: Any) -> Any:
+    """Converts numpy scalars (e.g. from np.prod) into plain Python values so they print and serialise cleanly."""
+
+    if type(answer).__module__ == 'numpy' and getattr(answer, 'ndim', None) == 0:
+        return answer.item()
+    return answer
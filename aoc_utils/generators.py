@@ -0,0 +1,602 @@
+"""
+Synthetic puzzle inputs at arbitrary sizes, for seeing how each solution scales.
+
+Every implemented day has a generator that takes a size (lines, grid side, monkeys etc. depending on the day)
+and a seed, and returns input text in the same format as that day's `input.txt`. Sweep mode benchmarks a day
+across a range of sizes and fits the empirical complexity, i.e. the k in O(n^k).
+
+Usage:
+    python -m aoc_utils.generators generate --year 2024 --day 1 --size 1000000 -o big.txt
+    python -m aoc_utils.generators sweep --year 2021 --day 1 --sizes 10000 100000 1000000
+"""
+
+import sys
+import math
+import string
+import random
+import argparse
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from aoc_utils.discovery import find_puzzle, load_module
+from aoc_utils.benchmark import benchmark_text
+from aoc_utils.runner import PARTS
+
+
+@dataclass(frozen=True)
+class Generator:
+    """A day's input generator, what its size parameter means, and the sizes swept by default."""
+
+    func: Callable[[int, random.Random], str]
+    unit: str
+    sizes: Tuple[int, ...]
+
+
+GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+
+def generator(year: int, day: int, unit: str, sizes: Tuple[int, ...]):
+    """Registers a generator function for a year/day."""
+
+    def register(func: Callable[[int, random.Random], str]) -> Callable[[int, random.Random], str]:
+        GENERATORS[(year, day)] = Generator(func, unit, sizes)
+        return func
+
+    return register
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    """Returns generated input text for a year/day. The same seed always gives the same text."""
+
+    if (year, day) not in GENERATORS:
+        raise LookupError(f'No input generator for {year} day {day}')
+    return GENERATORS[(year, day)].func(size, random.Random(seed))
+
+
+# Distinct prime divisors for 2022 day 11, as in the real input, which caps how many monkeys it can generate.
+PRIMES = [p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+
+
+def _grid(rows: List[List[str]]) -> str:
+    return '\n'.join(''.join(row) for row in rows) + '\n'
+
+
+# 2021
+
+
+@generator(2021, 1, 'depth readings', (10_000, 100_000, 1_000_000))
+def sonar_sweep(size: int, rng: random.Random) -> str:
+    depth = 100
+    lines = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        lines.append(str(depth))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2021, 2, 'commands', (10_000, 100_000, 1_000_000))
+def dive(size: int, rng: random.Random) -> str:
+    cmds = ('forward', 'down', 'up')
+    return '\n'.join(f'{rng.choice(cmds)} {rng.randint(1, 9)}' for _ in range(size)) + '\n'
+
+
+@generator(2021, 3, 'reports', (1_000, 10_000, 100_000))
+def binary_diagnostic(size: int, rng: random.Random) -> str:
+    # Reports are unique, as in the real input, so there's a single oxygen and CO2 rating.
+    bits = max(12, size.bit_length() + 1)
+    return '\n'.join(format(n, f'0{bits}b') for n in rng.sample(range(2 ** bits), size)) + '\n'
+
+
+# 2022
+
+
+@generator(2022, 1, 'elves', (10_000, 100_000, 1_000_000))
+def calorie_counting(size: int, rng: random.Random) -> str:
+    elves = ['\n'.join(str(rng.randint(1000, 9999)) for _ in range(rng.randint(1, 8))) for _ in range(size)]
+    return '\n\n'.join(elves)
+
+
+@generator(2022, 2, 'rounds', (10_000, 100_000, 1_000_000))
+def rock_paper_scissors(size: int, rng: random.Random) -> str:
+    return '\n'.join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size))
+
+
+@generator(2022, 8, 'grid side', (50, 100, 200))
+def treetop_tree_house(size: int, rng: random.Random) -> str:
+    return _grid([[str(rng.randint(0, 9)) for _ in range(size)] for _ in range(size)]).rstrip('\n')
+
+
+@generator(2022, 9, 'moves', (1_000, 10_000, 100_000))
+def rope_bridge(size: int, rng: random.Random) -> str:
+    return '\n'.join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}" for _ in range(size))
+
+
+@generator(2022, 10, 'instructions', (1_000, 10_000, 100_000))
+def cathode_ray_tube(size: int, rng: random.Random) -> str:
+    lines = []
+    x = 1
+    cycles = 0
+    for _ in range(size):
+        if rng.random() < 0.3:
+            lines.append('noop')
+        else:
+            # Keep X near the 40 pixel screen so the picture isn't blank.
+            v = rng.randint(-10, 10)
+            if not -5 <= x + v <= 45:
+                v = -v
+            x += v
+            lines.append(f'addx {v}')
+            cycles += 1
+        cycles += 1
+
+    # Finish on a whole row of the 40 pixel wide screen.
+    lines += ['noop'] * (-cycles % 40)
+    return '\n'.join(lines)
+
+
+@generator(2022, 11, 'monkeys', (4, 8, 16, 32, 50))
+def monkey_in_the_middle(size: int, rng: random.Random) -> str:
+    # Every monkey throws to two other monkeys, and each needs its own prime divisor.
+    if size < 3:
+        raise ValueError(f'Monkey in the Middle needs at least 3 monkeys, got {size}')
+    if size > len(PRIMES):
+        raise ValueError(f'Monkey in the Middle supports at most {len(PRIMES)} monkeys, got {size}')
+
+    # Only one monkey squares, otherwise part 1 worry levels explode.
+    divisors = rng.sample(PRIMES[:max(size, 8) * 2], size)
+    squarer = rng.randrange(size)
+
+    monkeys = []
+    for i in range(size):
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if i == squarer:
+            operation = 'old * old'
+        else:
+            operation = f"old {rng.choice('*+')} {rng.randint(1, 19)}"
+        true_idx, false_idx = rng.sample([m for m in range(size) if m != i], 2)
+        monkeys.append(
+            f'Monkey {i}:\n'
+            f'  Starting items: {items}\n'
+            f'  Operation: new = {operation}\n'
+            f'  Test: divisible by {divisors[i]}\n'
+            f'    If true: throw to monkey {true_idx}\n'
+            f'    If false: throw to monkey {false_idx}'
+        )
+    return '\n\n'.join(monkeys)
+
+
+@generator(2022, 12, 'grid side', (100, 500, 2000))
+def hill_climbing_algorithm(size: int, rng: random.Random) -> str:
+    # Height rises from a at the top left to z at the bottom right. The top row and right column are left
+    # untouched so there's always a route from S to E, everything else is randomly lowered.
+    span = max(2 * (size - 1), 1)
+    rows = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            h = (r + c) * 25 // span
+            if r > 0 and c < size - 1:
+                h = max(0, h - rng.randint(0, 3))
+            row.append(string.ascii_lowercase[h])
+        rows.append(row)
+    rows[0][0] = 'S'
+    rows[-1][-1] = 'E'
+    return _grid(rows).rstrip('\n')
+
+
+# 2023
+
+
+@generator(2023, 1, 'lines', (10_000, 100_000, 1_000_000))
+def trebuchet(size: int, rng: random.Random) -> str:
+    words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+    lines = []
+    for _ in range(size):
+        parts = [rng.choice(words) if rng.random() < 0.3 else rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 12))]
+        # Part 1 needs at least one numeric digit per line.
+        parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        lines.append(''.join(parts))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2023, 2, 'games', (10_000, 100_000, 1_000_000))
+def cube_conundrum(size: int, rng: random.Random) -> str:
+    lines = []
+    for game in range(1, size + 1):
+        hands = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            hands.append(', '.join(f'{rng.randint(1, 20)} {colour}' for colour in colours))
+        lines.append(f"Game {game}: {'; '.join(hands)}")
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2023, 4, 'cards', (1_000, 10_000, 100_000))
+def scratchcards(size: int, rng: random.Random) -> str:
+    lines = []
+    for card in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        # Most cards don't win, so each card wins less than one copy on average and the number of copies stays
+        # bounded rather than growing exponentially along the table. A card can't win cards past the end of it.
+        matches = min(rng.randint(1, 10) if rng.random() < 0.1 else 0, size - card)
+        others = [n for n in range(1, 100) if n not in winning]
+        have = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(have)
+        lines.append(f"Card {card:>3}: {' '.join(f'{n:>2}' for n in winning)} | {' '.join(f'{n:>2}' for n in have)}")
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2023, 5, 'seeds and ranges per map', (100, 1_000, 10_000))
+def seed_fertilizer(size: int, rng: random.Random) -> str:
+    upper = 2 ** 32
+    seeds = ' '.join(str(rng.randrange(upper)) for _ in range(size + size % 2))
+    categories = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+
+    sections = [f'seeds: {seeds}']
+    for source, dest in zip(categories, categories[1:]):
+        # Split the number line into non-overlapping source ranges and map each one somewhere random.
+        bounds = sorted(rng.sample(range(1, upper), size))
+        ranges = []
+        for start, end in zip([0] + bounds, bounds):
+            length = end - start
+            ranges.append(f'{rng.randrange(upper - length)} {start} {length}')
+        rng.shuffle(ranges)
+        sections.append(f'{source}-to-{dest} map:\n' + '\n'.join(ranges))
+
+    return '\n\n'.join(sections)
+
+
+@generator(2023, 6, 'part 2 race time', (100_000, 1_000_000, 10_000_000))
+def wait_for_it(size: int, rng: random.Random) -> str:
+    # Part 2 joins all the race times together, so split the digits of size across four races.
+    digits = str(max(size, 2))
+    cuts = sorted(rng.sample(range(1, len(digits)), min(3, len(digits) - 1)))
+    times = [digits[i:j] for i, j in zip([0] + cuts, cuts + [len(digits)])]
+    # A leading zero would be dropped by int() in part 1, so bump it. A race needs at least 2ms for any hold to
+    # beat a record, otherwise part 1's product is 0.
+    times = [('1' + t[1:]) if t[0] == '0' else t for t in times]
+    times = ['2' if t == '1' else t for t in times]
+
+    # Records are set with a hold short of the best one, so every race can be won.
+    distances = []
+    for t in map(int, times):
+        hold = rng.randint(0, t // 2 - 1)
+        distances.append(str(hold * (t - hold)))
+
+    width = max(map(len, times + distances)) + 3
+    return (f"Time:    {''.join(t.rjust(width) for t in times)}\n"
+            f"Distance:{''.join(d.rjust(width) for d in distances)}\n")
+
+
+@generator(2023, 7, 'hands', (1_000, 10_000, 100_000))
+def camel_cards(size: int, rng: random.Random) -> str:
+    # Hands must be unique, and there are only 13^5 of them.
+    size = min(size, 13 ** 5)
+    hands = set()
+    while len(hands) < size:
+        hands.add(''.join(rng.choice('23456789TJQKA') for _ in range(5)))
+    return '\n'.join(f'{hand} {rng.randint(1, 1000)}' for hand in sorted(hands, key=lambda _: rng.random())) + '\n'
+
+
+@generator(2023, 8, 'nodes', (100, 1_000, 10_000))
+def haunted_wasteland(size: int, rng: random.Random) -> str:
+    # Node names are three letters, so there can be at most 26^3 of them.
+    size = max(2, min(size, 26 ** 3))
+    names = set()
+    while len(names) < size - 2:
+        name = ''.join(rng.choice(string.ascii_uppercase) for _ in range(3))
+        if name not in ('AAA', 'ZZZ'):
+            names.add(name)
+    nodes = ['AAA'] + sorted(names, key=lambda _: rng.random()) + ['ZZZ']
+
+    # Every node only points further along the list, so any instruction sequence reaches ZZZ.
+    lines = []
+    for i, node in enumerate(nodes[:-1]):
+        ahead = nodes[i + 1:i + 6]
+        lines.append(f'{node} = ({rng.choice(ahead)}, {rng.choice(ahead)})')
+    lines.append('ZZZ = (ZZZ, ZZZ)')
+    rng.shuffle(lines)
+
+    instructions = ''.join(rng.choice('LR') for _ in range(rng.randint(50, 300)))
+    return instructions + '\n\n' + '\n'.join(lines) + '\n'
+
+
+@generator(2023, 9, 'histories', (1_000, 10_000, 100_000))
+def mirage_maintenance(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        coeffs = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        lines.append(' '.join(str(sum(c * x ** n for n, c in enumerate(coeffs))) for x in range(21)))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2023, 10, 'grid side', (50, 100, 200))
+def pipe_maze(size: int, rng: random.Random) -> str:
+    # A serpentine loop that fills the grid inside a one cell border of junk pipes, so the loop is as long as possible.
+    size = max(size, 6)
+    rows = cols = size - 2
+    if rows % 2:
+        rows -= 1
+
+    # Walk the loop: along the top row, snake back and forth through the rest, then up the first column.
+    path = [(0, c) for c in range(cols)]
+    for r in range(1, rows):
+        span = range(cols - 1, 0, -1) if r % 2 else range(1, cols)
+        path += [(r, c) for c in span]
+    path += [(r, 0) for r in range(rows - 1, 0, -1)]
+
+    pipes = {
+        frozenset({(-1, 0), (1, 0)}): '|', frozenset({(0, -1), (0, 1)}): '-',
+        frozenset({(-1, 0), (0, 1)}): 'L', frozenset({(-1, 0), (0, -1)}): 'J',
+        frozenset({(1, 0), (0, -1)}): '7', frozenset({(1, 0), (0, 1)}): 'F',
+    }
+
+    grid = [[rng.choice('.|-LJ7F') for _ in range(size)] for _ in range(size)]
+    for n, (r, c) in enumerate(path):
+        (pr, pc), (nr, nc) = path[n - 1], path[(n + 1) % len(path)]
+        grid[r + 1][c + 1] = pipes[frozenset({(pr - r, pc - c), (nr - r, nc - c)})]
+
+    # S sits in the second row of the loop, where its up and down neighbours are '-' and can't be entered.
+    grid[2][1 + cols // 2] = 'S'
+    return _grid(grid)
+
+
+@generator(2023, 11, 'grid side', (50, 100, 200))
+def cosmic_expansion(size: int, rng: random.Random) -> str:
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    grid = [
+        ['#' if r not in empty_rows and c not in empty_cols and rng.random() < 0.03 else '.' for c in range(size)]
+        for r in range(size)
+    ]
+    return _grid(grid)
+
+
+@generator(2023, 13, 'patterns', (100, 1_000, 10_000))
+def point_of_incidence(size: int, rng: random.Random) -> str:
+    patterns = []
+    for _ in range(size):
+        height, width = rng.choice([7, 9, 11, 13, 15, 17]), rng.choice([7, 9, 11, 13, 15, 17])
+        grid = [[rng.choice('#.') for _ in range(width)] for _ in range(height)]
+
+        # Mirror part of the pattern about a random horizontal or vertical line.
+        if rng.random() < 0.5:
+            line = rng.randint(1, height - 1)
+            for i in range(min(line, height - line)):
+                grid[line + i] = list(grid[line - 1 - i])
+        else:
+            line = rng.randint(1, width - 1)
+            for row in grid:
+                for i in range(min(line, width - line)):
+                    row[line + i] = row[line - 1 - i]
+
+        patterns.append('\n'.join(''.join(row) for row in grid))
+    return '\n\n'.join(patterns) + '\n'
+
+
+@generator(2023, 15, 'steps', (10_000, 100_000, 1_000_000))
+def lens_library(size: int, rng: random.Random) -> str:
+    labels = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 6))) for _ in range(max(size // 4, 1))]
+    steps = [f'{label}={rng.randint(1, 9)}' if rng.random() < 0.6 else f'{label}-' for label in rng.choices(labels, k=size)]
+    return ','.join(steps) + '\n'
+
+
+@generator(2023, 16, 'grid side', (50, 100, 200))
+def floor_will_be_lava(size: int, rng: random.Random) -> str:
+    return _grid([[rng.choice('/\\|-') if rng.random() < 0.1 else '.' for _ in range(size)] for _ in range(size)])
+
+
+# 2024
+
+
+@generator(2024, 1, 'location pairs', (10_000, 100_000, 1_000_000))
+def historian_hysteria(size: int, rng: random.Random) -> str:
+    return '\n'.join(f'{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}' for _ in range(size)) + '\n'
+
+
+@generator(2024, 2, 'reports', (10_000, 100_000, 1_000_000))
+def red_nosed_reports(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        sign = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            # Mostly safe steps, with the occasional bad one.
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-2, 6)
+            level += sign * step
+            levels.append(level)
+        lines.append(' '.join(map(str, levels)))
+    return '\n'.join(lines)
+
+
+@generator(2024, 3, 'characters', (10_000, 100_000, 1_000_000))
+def mull_it_over(size: int, rng: random.Random) -> str:
+    tokens = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.3:
+            token = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+        elif roll < 0.35:
+            token = rng.choice(["do()", "don't()"])
+        elif roll < 0.45:
+            # Near misses that the regex must reject.
+            token = rng.choice([f'mul[{rng.randint(1, 99)},{rng.randint(1, 99)}]', f'mul({rng.randint(1, 99)}, {rng.randint(1, 99)})', 'mul(4*'])
+        else:
+            token = ''.join(rng.choice("%&*@^!?()[]{}<>:;,'+-_/ how where select from") for _ in range(rng.randint(1, 6)))
+        tokens.append(token)
+        length += len(token)
+    return ''.join(tokens)
+
+
+@generator(2024, 4, 'grid side', (100, 500, 1_000))
+def ceres_search(size: int, rng: random.Random) -> str:
+    return _grid([[rng.choice('XMAS') for _ in range(size)] for _ in range(size)])
+
+
+@generator(2024, 5, 'updates', (100, 1_000, 10_000))
+def print_queue(size: int, rng: random.Random) -> str:
+    # As in the real input, 49 pages with a rule for every pair of them.
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f'{a}|{b}' for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+
+    rank = {page: i for i, page in enumerate(pages)}
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=rank.get)
+        updates.append(','.join(map(str, update)))
+
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates)
+
+
+def _guard_escapes(grid: List[List[str]], r: int, c: int) -> bool:
+    """Walks the guard to check it leaves the grid. Part 1 never terminates if the guard gets stuck in a loop."""
+
+    moves = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    facing = 0
+    seen = set()
+    while (r, c, facing) not in seen:
+        seen.add((r, c, facing))
+        dr, dc = moves[facing]
+        if not (0 <= r + dr < len(grid) and 0 <= c + dc < len(grid[0])):
+            return True
+        if grid[r + dr][c + dc] == '#':
+            facing = (facing + 1) % 4
+        else:
+            r, c = r + dr, c + dc
+    return False
+
+
+@generator(2024, 6, 'grid side', (100, 500, 1_000))
+def guard_gallivant(size: int, rng: random.Random) -> str:
+    while True:
+        grid = [['#' if rng.random() < 0.02 else '.' for _ in range(size)] for _ in range(size)]
+        r, c = rng.randrange(size), rng.randrange(size)
+        grid[r][c] = '^'
+        if _guard_escapes(grid, r, c):
+            return _grid(grid)
+
+
+def fit_exponent(sizes: List[int], seconds: List[float]) -> Optional[float]:
+    """Least squares slope of log(time) against log(size), i.e. the k in O(n^k)."""
+
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def sweep(year: int, day: int, sizes: Optional[List[int]] = None, parts=PARTS, seed: int = 0,
+          repeat: int = 3, budget: Optional[float] = 30) -> List[Dict[str, Any]]:
+    """
+    Benchmarks a day's parse and solve on generated inputs of increasing size and fits the complexity of each part.
+    Once a size takes longer than budget seconds, larger sizes for that part are skipped.
+    """
+
+    gen = GENERATORS[(year, day)]
+    sizes = sorted(sizes or gen.sizes)
+    module = load_module(find_puzzle(year, day))
+
+    inputs = {size: generate(year, day, size, seed) for size in sizes}
+
+    results = []
+    for part in parts:
+        rows = []
+        for size in sizes:
+            row = {'size': size, 'status': 'ok'}
+            try:
+                _, parse, solve = benchmark_text(module, part, inputs[size], repeat=repeat, warmup=0, budget=budget)
+                row['parse_s'] = parse['median_ns'] / 1e9
+                row['solve_s'] = solve['median_ns'] / 1e9
+            except Exception as e:
+                row['status'] = f'{type(e).__name__}: {e}'
+                rows.append(row)
+                break
+            rows.append(row)
+            if budget is not None and row['solve_s'] > budget:
+                break
+
+        ok = [r for r in rows if r['status'] == 'ok']
+        results.append({
+            'year': year,
+            'day': day,
+            'part': part,
+            'unit': gen.unit,
+            'rows': rows,
+            'parse_exponent': fit_exponent([r['size'] for r in ok], [r['parse_s'] for r in ok]),
+            'solve_exponent': fit_exponent([r['size'] for r in ok], [r['solve_s'] for r in ok]),
+        })
+
+    return results
+
+
+def print_sweep(results: List[Dict[str, Any]]) -> None:
+    for result in results:
+        print(f"\n{result['year']} Day {result['day']:02} Part {result['part']} (size = {result['unit']})")
+        print(f"{'Size':>12}{'Parse (s)':>12}{'Solve (s)':>12}")
+        for row in result['rows']:
+            if row['status'] == 'ok':
+                print(f"{row['size']:>12}{row['parse_s']:>12.4f}{row['solve_s']:>12.4f}")
+            else:
+                print(f"{row['size']:>12}  {row['status']}")
+
+        for stage in ('parse', 'solve'):
+            k = result[f'{stage}_exponent']
+            print(f"{stage.capitalize()} scaling: " + ('not enough data' if k is None else f'~O(n^{k:.2f})'))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aoc_utils.generators', description='Generate scaled puzzle inputs.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    gen = commands.add_parser('generate', help='Write a generated input.')
+    gen.add_argument('--year', type=int, required=True)
+    gen.add_argument('--day', type=int, required=True)
+    gen.add_argument('--size', type=int, required=True)
+    gen.add_argument('--seed', type=int, default=0)
+    gen.add_argument('-o', '--output', help='File to write to (default: stdout).')
+
+    swp = commands.add_parser('sweep', help='Benchmark a day across input sizes and fit its complexity.')
+    swp.add_argument('--year', type=int, required=True)
+    swp.add_argument('--day', type=int, required=True)
+    swp.add_argument('--sizes', type=int, nargs='+', help="Sizes to run (default: the day's preset sizes).")
+    swp.add_argument('--part', type=int, nargs='+', choices=PARTS, default=list(PARTS))
+    swp.add_argument('--seed', type=int, default=0)
+    swp.add_argument('--repeat', type=int, default=3)
+    swp.add_argument('--budget', type=float, default=30, help='Skip larger sizes once a solve takes this many seconds.')
+
+    commands.add_parser('list', help='List the days that have generators.')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'list':
+        for (year, day), gen in sorted(GENERATORS.items()):
+            print(f'{year} Day {day:02}  size = {gen.unit}  default sweep = {list(gen.sizes)}')
+
+    elif args.command == 'generate':
+        text = generate(args.year, args.day, args.size, args.seed)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+
+    elif args.command == 'sweep':
+        print_sweep(sweep(args.year, args.day, args.sizes, args.part, args.seed, args.repeat, args.budget))
+
+
+if __name__ == "__main__":
+    main()
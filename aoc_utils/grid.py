@@ -0,0 +1,167 @@
+"""
+A 2D character grid backed by a contiguous uint8 numpy array.
+
+Most grid puzzles are ASCII, so each cell is stored as its byte value. That's a quarter of the memory of a
+`<U1` array and means hot loops compare ints (e.g. `grid[r, c] == ord('#')`, or `grid[r, c] in b'|7F'`)
+rather than strings.
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Iterator, Optional
+
+import numpy as np
+
+
+# (row, column) offsets. The first four are the orthogonal neighbours.
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+ALL_DIRECTIONS = ORTHOGONAL + DIAGONAL
+
+
+class Grid:
+    """
+    Wraps a 2D uint8 array of ASCII codes.
+    Indexing goes straight to the array, so `grid[r, c]` is an int and `grid[r]` is a row view.
+    """
+
+    __slots__ = ('cells',)
+
+    def __init__(self, cells: np.ndarray) -> None:
+        if cells.ndim != 2:
+            raise ValueError(f'Grid needs a 2D array, got {cells.ndim}D')
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+
+    @classmethod
+    def from_text(cls, text: str) -> Grid:
+        """Builds a grid from newline separated rows. Blank lines at either end are ignored."""
+
+        return cls.from_lines(text.strip('\n').splitlines())
+
+    @classmethod
+    def from_lines(cls, lines: List[str]) -> Grid:
+        """Builds a grid from equal length rows in one pass over the raw bytes, rather than a list per row."""
+
+        if not lines:
+            return cls(np.zeros((0, 0), dtype=np.uint8))
+
+        width = len(lines[0])
+        if any(len(line) != width for line in lines):
+            raise ValueError('All grid rows must be the same length')
+
+        buffer = bytearray(''.join(lines).encode('ascii'))
+        return cls(np.frombuffer(buffer, dtype=np.uint8).reshape(len(lines), width))
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(value, str):
+            value = ord(value)
+        self.cells[key] = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and np.array_equal(self.cells, other.cells)
+
+    def __repr__(self) -> str:
+        return f'Grid(nrows={self.nrows}, ncols={self.ncols})'
+
+    def __str__(self) -> str:
+        return '\n'.join(row.tobytes().decode('ascii') for row in self.cells)
+
+    def __getstate__(self):
+        return self.cells
+
+    def __setstate__(self, cells) -> None:
+        self.cells = cells
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def nrows(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def ncols(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def size(self) -> int:
+        return self.cells.size
+
+    @property
+    def flat(self) -> np.ndarray:
+        """1D view of the cells, indexed by `to_index`."""
+        return self.cells.reshape(-1)
+
+    def copy(self) -> Grid:
+        return Grid(self.cells.copy())
+
+    def row(self, r: int) -> np.ndarray:
+        """View of a row. Writes go through to the grid."""
+        return self.cells[r, :]
+
+    def col(self, c: int) -> np.ndarray:
+        """View of a column. Writes go through to the grid."""
+        return self.cells[:, c]
+
+    def char(self, r: int, c: int) -> str:
+        return chr(self.cells[r, c])
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.cells.shape[0] and 0 <= c < self.cells.shape[1]
+
+    def neighbours(self, r: int, c: int, diagonal: bool = False) -> Iterator[Tuple[int, int]]:
+        """Yields the in-bounds 4 (or 8 with diagonal) neighbours of a cell."""
+
+        nrows, ncols = self.cells.shape
+        for dr, dc in (ALL_DIRECTIONS if diagonal else ORTHOGONAL):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < nrows and 0 <= nc < ncols:
+                yield nr, nc
+
+    def to_index(self, r: int, c: int) -> int:
+        """Flat (row-major) index of a cell."""
+        return r * self.cells.shape[1] + c
+
+    def to_coord(self, index: int) -> Tuple[int, int]:
+        """(row, column) of a flat index."""
+        return divmod(index, self.cells.shape[1])
+
+    def mask(self, chars: str) -> np.ndarray:
+        """Boolean array of the cells holding any of chars."""
+
+        if len(chars) == 1:
+            return self.cells == ord(chars)
+        return np.isin(self.cells, np.frombuffer(chars.encode('ascii'), dtype=np.uint8))
+
+    def find(self, chars: str) -> Optional[Tuple[int, int]]:
+        """(row, column) of the first cell, in reading order, holding any of chars. None if there isn't one."""
+
+        hits = np.flatnonzero(self.mask(chars))
+        if hits.size == 0:
+            return None
+        return self.to_coord(int(hits[0]))
+
+    def positions(self, chars: str) -> np.ndarray:
+        """(n, 2) array of the (row, column) of every cell holding any of chars, in reading order."""
+        return np.argwhere(self.mask(chars))
+
+    def count(self, chars: str) -> int:
+        return int(np.count_nonzero(self.mask(chars)))
+
+    def shift(self, dr: int, dc: int, fill: int = 0) -> np.ndarray:
+        """
+        Array the same shape as the grid where each cell holds the value dr rows and dc columns away,
+        or fill where that falls off the edge. Lets neighbour comparisons run over the whole grid at once.
+        """
+
+        nrows, ncols = self.cells.shape
+        out = np.full(self.cells.shape, fill, dtype=self.cells.dtype)
+        if abs(dr) >= nrows or abs(dc) >= ncols:
+            return out
+
+        out[max(-dr, 0):nrows - max(dr, 0), max(-dc, 0):ncols - max(dc, 0)] = \
+            self.cells[max(dr, 0):nrows - max(-dr, 0), max(dc, 0):ncols - max(-dc, 0)]
+        return out
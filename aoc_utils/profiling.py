@@ -0,0 +1,195 @@
+"""
+cProfile and tracemalloc capture for a single stage (parse or solve) of a puzzle part.
+
+Each stage is written as a `.pstats` file, which `python -m pstats` and snakeviz can open, and as collapsed
+stacks (`a;b;c 1234`), which flamegraph.pl, speedscope and inferno consume. cProfile only records caller/callee
+pairs rather than whole stacks, so the collapsed stacks are rebuilt from that call graph, sharing each function's
+time between its callers in proportion to how much of it each one accounted for.
+
+Usage:
+    python -m aoc_utils --profile --year 2023 --day 7
+    python -m aoc_utils --profile profiles/ --top 20
+"""
+
+import os
+import pstats
+import cProfile
+import tracemalloc
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from aoc_utils.discovery import REPO_ROOT
+
+
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'profiles')
+
+# Deep enough for any recursion in the solutions, but stops pathological call graphs blowing up.
+MAX_STACK_DEPTH = 64
+
+
+def reset_peak_memory() -> None:
+    """
+    Resets the process's peak resident memory, so `peak_memory` covers only what runs after this.
+    Only Linux supports this (via /proc). Elsewhere it does nothing and the peak covers the whole process.
+    """
+
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def peak_memory() -> Optional[int]:
+    """
+    Peak resident memory of this process in bytes, or None where /proc isn't available.
+    Unlike tracemalloc this costs nothing while the code runs, but it includes the interpreter and imported modules.
+    """
+
+    try:
+        with open('/proc/self/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def profile_call(func: Callable[..., Any], *args: Any) -> Tuple[Any, pstats.Stats, int]:
+    """
+    Calls func under cProfile and tracemalloc, returning its result, the profile stats and the peak bytes allocated.
+    Both add overhead, so the times are for finding hot spots, not for comparing against benchmarks.
+    """
+
+    profiler = cProfile.Profile()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    try:
+        profiler.enable()
+        try:
+            result = func(*args)
+        finally:
+            profiler.disable()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    return result, pstats.Stats(profiler), max(peak, 0)
+
+
+def _label(func: Tuple[str, int, str]) -> str:
+    """file:line(name), with paths inside the repo made relative. Collapsed stack frames can't contain ';'."""
+
+    filename, line, name = func
+    if filename == '~':
+        return name
+    if filename.startswith(REPO_ROOT):
+        filename = os.path.relpath(filename, REPO_ROOT)
+    return f'{filename}:{line}({name})'.replace(';', ',')
+
+
+def collapsed_stacks(stats: pstats.Stats) -> List[str]:
+    """
+    Rebuilds `frame;frame;frame microseconds` lines from the caller graph in stats.
+    Recursive calls are cut off where a function already appears on the stack.
+    """
+
+    raw = stats.stats
+    callees: Dict[tuple, Dict[tuple, float]] = {}
+    roots = []
+
+    for func, (_, _, _, _, callers) in raw.items():
+        known_callers = [caller for caller in callers if caller in raw]
+        if not known_callers:
+            roots.append(func)
+        for caller in known_callers:
+            # callers maps caller -> (primitive calls, calls, tottime, cumtime) for calls made from that caller.
+            callees.setdefault(caller, {})[func] = callers[caller][3]
+
+    totals: Dict[str, float] = {}
+
+    def walk(func: tuple, share: float, stack: List[str], on_stack: set) -> None:
+        tottime = raw[func][2]
+        frame = stack + [_label(func)]
+        # share is the fraction of this function's total time spent under this particular stack.
+        key = ';'.join(frame)
+        totals[key] = totals.get(key, 0.0) + tottime * share
+
+        if len(frame) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_total = raw[callee][3]
+            if callee in on_stack or callee_total <= 0:
+                continue
+            walk(callee, share * min(edge_time / callee_total, 1.0), frame, on_stack | {callee})
+
+    for root in roots:
+        walk(root, 1.0, [], {root})
+
+    return [f'{stack} {round(seconds * 1e6)}' for stack, seconds in totals.items() if seconds * 1e6 >= 1]
+
+
+def hot_functions(stats: pstats.Stats, top: int = 10) -> List[Dict[str, Any]]:
+    """The top functions by time spent in the function itself (excluding what it calls)."""
+
+    rows = [
+        {'function': _label(func), 'ncalls': ncalls, 'tottime': tottime, 'cumtime': cumtime}
+        for func, (_, ncalls, tottime, cumtime, _) in stats.stats.items()
+        # Leave out the profiler switching itself off.
+        if '_lsprof.Profiler' not in func[2]
+    ]
+    rows.sort(key=lambda r: r['tottime'], reverse=True)
+    return rows[:top]
+
+
+def write_profile(stats: pstats.Stats, output_dir: str, name: str) -> Dict[str, str]:
+    """Writes name.pstats and name.collapsed to output_dir and returns their paths."""
+
+    os.makedirs(output_dir, exist_ok=True)
+    pstats_path = os.path.join(output_dir, name + '.pstats')
+    collapsed_path = os.path.join(output_dir, name + '.collapsed')
+
+    stats.dump_stats(pstats_path)
+    with open(collapsed_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(collapsed_stacks(stats)) + '\n')
+
+    return {'pstats': pstats_path, 'collapsed': collapsed_path}
+
+
+def profile_stage(func: Callable[..., Any], args: tuple, output_dir: str, name: str, top: int = 10) -> Tuple[Any, Dict[str, Any]]:
+    """Profiles one stage, writes its files and returns the result along with a summary that can cross process boundaries."""
+
+    result, stats, peak = profile_call(func, *args)
+    summary = {
+        'peak_memory': peak,
+        'total_time': stats.total_tt,
+        'hot': hot_functions(stats, top),
+        'files': write_profile(stats, output_dir, name),
+    }
+    return result, summary
+
+
+def _format_bytes(n: int) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if n < 1024:
+            return f'{n:.0f} {unit}' if unit == 'B' else f'{n:.1f} {unit}'
+        n /= 1024
+    return f'{n:.1f} GiB'
+
+
+def print_profiles(results: List[Dict[str, Any]]) -> None:
+    """Prints peak memory and the hot functions of each profiled stage."""
+
+    for r in results:
+        for stage, summary in r.get('profile', {}).items():
+            print(f"\n{r['year']} Day {r['day']:02} Part {r['part']} {stage}: "
+                  f"{summary['total_time']:.4f}s profiled, peak memory {_format_bytes(summary['peak_memory'])}")
+            print(f"  {'ncalls':>10}{'tottime':>10}{'cumtime':>10}  function")
+            for row in summary['hot']:
+                print(f"  {row['ncalls']:>10}{row['tottime']:>10.4f}{row['cumtime']:>10.4f}  {row['function']}")
+            print(f"  -> {summary['files']['pstats']}")
@@ -0,0 +1,220 @@
+"""
+Runs every year/day/part solution in the repo from a single entry point.
+
+Jobs are spread across a process pool so the full catalogue takes roughly as long as the slowest
+day rather than the sum of all of them, and each worker only pays the numpy import once.
+
+Usage:
+    python -m aoc_utils --workers 4
+    python -m aoc_utils --year 2023 --day 7 --part 2
+    python -m aoc_utils --year 2023 --day 7 --profile
+    python -m aoc_utils --force    # Recompute parts that already have a stored answer
+"""
+
+import os
+import time
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from aoc_utils import answers, cache, profiling
+from aoc_utils.discovery import (
+    Puzzle, discover, load_module, read_input, get_parser, get_solution, call_solution, normalise_answer
+)
+
+
+PARTS = (1, 2)
+
+
+def run_job(puzzle: Puzzle, part: int, use_cache: bool = True, profile_dir: Optional[str] = None,
+            top: int = 10) -> Dict[str, Any]:
+    """
+    Parses the input and solves a single part. Any failure (missing input, unfinished part, syntax error)
+    is caught and reported in the result so one broken day doesn't stop the rest of the run.
+    With use_cache, parsed input is loaded from the on-disk cache when the parser and input are unchanged.
+    With profile_dir, parsing and solving each run under cProfile and tracemalloc, their profiles are written there,
+    and the peak memory and top hot functions are added to the result.
+    """
+
+    # Peak resident memory is reset per job, since pool workers run many jobs.
+    profiling.reset_peak_memory()
+
+    result = {
+        'year': puzzle.year,
+        'day': puzzle.day,
+        'title': puzzle.title,
+        'part': part,
+        'answer': None,
+        'parse_time': None,
+        'solve_time': None,
+        'peak_memory': None,
+        'status': 'ok',
+        'stored': False,
+    }
+
+    try:
+        module = load_module(puzzle)
+        solution = get_solution(module, part)
+        text = read_input(puzzle)
+
+        if use_cache:
+            parse = lambda t: cache.load_or_parse(puzzle, module, part, t)
+        else:
+            parse = get_parser(module, part)
+
+        if profile_dir is None:
+            start = time.perf_counter()
+            data = parse(text)
+            result['parse_time'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            answer = call_solution(solution, data)
+            result['solve_time'] = time.perf_counter() - start
+
+        else:
+            name = f'{puzzle.year}_{puzzle.day:02}_part{part}'
+            result['profile'] = {}
+
+            start = time.perf_counter()
+            data, result['profile']['parse'] = profiling.profile_stage(parse, (text,), profile_dir, f'{name}_parse', top)
+            result['parse_time'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            answer, result['profile']['solve'] = profiling.profile_stage(call_solution, (solution, data), profile_dir, f'{name}_solve', top)
+            result['solve_time'] = time.perf_counter() - start
+
+        result['answer'] = normalise_answer(answer)
+        result['peak_memory'] = profiling.peak_memory()
+
+    except Exception as e:
+        result['status'] = f'{type(e).__name__}: {e}'
+        result['traceback'] = traceback.format_exc()
+
+    return result
+
+
+def run(puzzles: List[Puzzle], parts=PARTS, workers: Optional[int] = None, use_cache: bool = True,
+        profile_dir: Optional[str] = None, top: int = 10, use_store: bool = True,
+        force: bool = False) -> List[Dict[str, Any]]:
+    """
+    Schedules one job per puzzle part across a process pool and returns the results in year/day/part order.
+    With use_store, parts whose input and solution file are unchanged since a previous run are served from the
+    answer store rather than recomputed (unless force), and fresh results are added to it. Profiled runs are
+    never stored, since the profilers inflate their timings.
+    """
+
+    conn = answers.connect() if use_store else None
+    keys = {puzzle: answers.job_key(puzzle) for puzzle in puzzles} if conn else {}
+
+    results, jobs = [], []
+    for puzzle in puzzles:
+        for part in parts:
+            stored = None
+            if conn and keys[puzzle] and not force and profile_dir is None:
+                stored = answers.lookup(conn, puzzle, part, keys[puzzle])
+            if stored:
+                results.append(stored)
+            else:
+                jobs.append((puzzle, part))
+
+    # Running in-process keeps tracebacks and profilers simple when only one worker is wanted.
+    if workers == 1:
+        computed = [run_job(puzzle, part, use_cache, profile_dir, top) for puzzle, part in jobs]
+    elif jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_job, puzzle, part, use_cache, profile_dir, top) for puzzle, part in jobs]
+            computed = [future.result() for future in futures]
+    else:
+        computed = []
+
+    if conn:
+        for (puzzle, _), result in zip(jobs, computed):
+            if result['status'] == 'ok' and keys[puzzle] and profile_dir is None:
+                answers.record(conn, result, keys[puzzle])
+        conn.close()
+
+    return sorted(results + computed, key=lambda r: (r['year'], r['day'], r['part']))
+
+
+def _format_answer(answer: Any, width: int = 24) -> str:
+    """Answers are mostly ints, but a few days return screens or tuples so truncate long ones."""
+
+    if answer is None:
+        return '-'
+    text = str(answer)
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    return '-' if seconds is None else f'{seconds:.4f}'
+
+
+def _format_memory(peak: Optional[int]) -> str:
+    return '-' if peak is None else f'{peak / 2 ** 20:.1f}'
+
+
+def print_table(results: List[Dict[str, Any]], wall_time: Optional[float] = None) -> None:
+    """
+    Prints one row per year/day/part with the answer, timings, peak memory and status.
+    Answers served from the store show the timings recorded when they were computed.
+    """
+
+    header = f"{'Year':<6}{'Day':<5}{'Part':<6}{'Answer':<26}{'Parse (s)':>11}{'Solve (s)':>11}{'Peak (MiB)':>12}  Status"
+    print(header)
+    print('-' * len(header))
+
+    for r in results:
+        print(
+            f"{r['year']:<6}{r['day']:<5}{r['part']:<6}{_format_answer(r['answer']):<26}"
+            f"{_format_time(r['parse_time']):>11}{_format_time(r['solve_time']):>11}{_format_memory(r.get('peak_memory')):>12}"
+            f"  {r['status']}{' (stored)' if r.get('stored') else ''}"
+        )
+
+    print('-' * len(header))
+    solved = sum(r['status'] == 'ok' for r in results)
+    stored = sum(bool(r.get('stored')) for r in results)
+    total_cpu = sum((r['parse_time'] or 0) + (r['solve_time'] or 0) for r in results if not r.get('stored'))
+    summary = f'{solved}/{len(results)} parts solved ({stored} from the answer store). Total solve time: {total_cpu:.4f}s'
+    if wall_time is not None:
+        summary += f', wall clock: {wall_time:.4f}s'
+    print(summary)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aoc_utils', description='Run Advent of Code solutions.')
+    parser.add_argument('--year', type=int, nargs='+', help='Only run these years.')
+    parser.add_argument('--day', type=int, nargs='+', help='Only run these days.')
+    parser.add_argument('--part', type=int, nargs='+', choices=PARTS, default=list(PARTS), help='Only run these parts.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes (default: all cores).')
+    parser.add_argument('--no-cache', action='store_true', help='Always parse the input rather than loading it from the parse cache.')
+    parser.add_argument('--clear-cache', action='store_true', help='Delete the parse cache before running.')
+    parser.add_argument('--profile', nargs='?', const=profiling.DEFAULT_OUTPUT_DIR, metavar='DIR',
+                        help='Profile parsing and solving, writing .pstats and collapsed stacks to DIR (default: profiles/). '
+                             'Implies --no-cache so parsing is what gets profiled.')
+    parser.add_argument('--force', action='store_true', help='Recompute every part, even if the answer store has a result for it.')
+    parser.add_argument('--no-store', action='store_true', help="Don't read or write the answer store.")
+    parser.add_argument('--top', type=int, default=10, help='Hot functions to print per profiled stage (default: 10).')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    if args.clear_cache:
+        print(f'Removed {cache.clear()} cached inputs.')
+
+    puzzles = discover(years=args.year, days=args.day)
+
+    start = time.perf_counter()
+    results = run(puzzles, parts=args.part, workers=args.workers, use_cache=not (args.no_cache or args.profile),
+                  profile_dir=args.profile, top=args.top, use_store=not args.no_store, force=args.force)
+    wall_time = time.perf_counter() - start
+
+    print_table(results, wall_time)
+    if args.profile:
+        profiling.print_profiles(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Graph searches (BFS, multi-source BFS, Dijkstra and A*) over implicit graphs.
+
+Nodes are ints in range(n_nodes), usually flat grid indices (see `Grid.to_index`) or a flat index combined
+with extra state such as a direction. Edges come from a neighbours callback, so the graph never has to be built.
+Distances, visited flags and the BFS queue live in preallocated flat buffers rather than sets or lists of tuples,
+so membership checks are O(1) and memory is a fixed 8 bytes or so per node.
+
+The callback searches still do their per-node work in Python, at around a microsecond per edge, so a few million
+cells takes seconds. `bfs_levels` expands a whole BFS level at a time with numpy over edge masks from `grid_edges`,
+which is far faster on open grids where frontiers are wide. On a long single-file path (e.g. a pipe loop) each level
+is only a node or two, the per-level numpy overhead dominates, and the callback `bfs` is quicker.
+"""
+
+import heapq
+from array import array
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from aoc_utils.grid import Grid, ALL_DIRECTIONS, ORTHOGONAL
+
+
+UNREACHED = -1
+
+Goal = Optional[Union[int, Callable[[int], bool]]]
+
+# (flat offset, allowed) pairs. node + offset is a neighbour of node wherever allowed[node] is True.
+Edges = Sequence[Tuple[int, np.ndarray]]
+
+
+class SearchResult:
+    """Distances from the start node(s) and, if found, the goal that stopped the search."""
+
+    __slots__ = ('dist', 'parent', 'goal')
+
+    def __init__(self, dist: Union[array, np.ndarray], parent: Optional[Union[array, np.ndarray]], goal: Optional[int]) -> None:
+        self.dist = dist
+        self.parent = parent
+        self.goal = goal
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+    @property
+    def distance(self) -> Optional[int]:
+        """Distance to the goal, or None if no goal was reached."""
+        return None if self.goal is None else int(self.dist[self.goal])
+
+    @property
+    def distances(self) -> np.ndarray:
+        """Zero-copy numpy view of the distances, UNREACHED (-1) for nodes the search didn't reach."""
+        return np.frombuffer(self.dist, dtype=np.int64)
+
+    @property
+    def visited(self) -> np.ndarray:
+        """Boolean array of the nodes the search reached."""
+        return self.distances != UNREACHED
+
+    def path(self, node: Optional[int] = None) -> List[int]:
+        """Nodes from a start to node (default: the goal). Needs the search to have been run with track_path."""
+
+        if self.parent is None:
+            raise ValueError('Search was run without track_path')
+        node = self.goal if node is None else node
+        if node is None or self.dist[node] == UNREACHED:
+            return []
+
+        path = [node]
+        while self.parent[node] != UNREACHED:
+            node = self.parent[node]
+            path.append(node)
+        return path[::-1]
+
+
+def _goal_test(goal: Goal) -> Optional[Callable[[int], bool]]:
+    if goal is None or callable(goal):
+        return goal
+    return lambda node: node == goal
+
+
+def bfs(n_nodes: int, starts: Iterable[int], neighbours: Callable[[int], Iterable[int]], goal: Goal = None,
+        track_path: bool = False) -> SearchResult:
+    """
+    Breadth first search from one or more start nodes, each at distance 0.
+    goal is a node or a predicate. The search stops as soon as a goal is reached, otherwise it explores everything reachable.
+    """
+
+    is_goal = _goal_test(goal)
+    dist = array('q', [UNREACHED]) * n_nodes
+    parent = array('q', [UNREACHED]) * n_nodes if track_path else None
+
+    # Every node is queued at most once, so a flat buffer with head/tail pointers never overflows.
+    queue = array('q', [0]) * n_nodes
+    head = tail = 0
+
+    for start in starts:
+        if dist[start] != UNREACHED:
+            continue
+        dist[start] = 0
+        if is_goal and is_goal(start):
+            return SearchResult(dist, parent, start)
+        queue[tail] = start
+        tail += 1
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        d = dist[node] + 1
+
+        for nxt in neighbours(node):
+            if dist[nxt] != UNREACHED:
+                continue
+            dist[nxt] = d
+            if parent is not None:
+                parent[nxt] = node
+            if is_goal and is_goal(nxt):
+                return SearchResult(dist, parent, nxt)
+            queue[tail] = nxt
+            tail += 1
+
+    return SearchResult(dist, parent, None)
+
+
+def bfs_levels(n_nodes: int, starts: Iterable[int], edges: Edges, goal: Optional[Union[int, np.ndarray]] = None,
+               track_path: bool = False) -> SearchResult:
+    """
+    Breadth first search that expands a whole level of the frontier at once with numpy, rather than a node at a time.
+    goal is a node or a boolean mask of goal nodes, and the search stops at the first level that reaches one.
+    """
+
+    dist = np.full(n_nodes, UNREACHED, dtype=np.int64)
+    parent = np.full(n_nodes, UNREACHED, dtype=np.int64) if track_path else None
+
+    if goal is None or isinstance(goal, np.ndarray):
+        is_goal = goal
+    else:
+        is_goal = np.zeros(n_nodes, dtype=bool)
+        is_goal[goal] = True
+
+    frontier = np.unique(np.fromiter(starts, dtype=np.int64))
+    dist[frontier] = 0
+    level = 0
+
+    while frontier.size:
+        if is_goal is not None:
+            hits = frontier[is_goal[frontier]]
+            if hits.size:
+                return SearchResult(dist, parent, int(hits[0]))
+
+        level += 1
+        sources = [frontier[allowed[frontier]] for _, allowed in edges]
+        targets = np.concatenate([src + offset for src, (offset, _) in zip(sources, edges)])
+
+        # Keep the first edge into each node that hasn't been reached yet.
+        fresh = np.flatnonzero(dist[targets] == UNREACHED)
+        frontier, first = np.unique(targets[fresh], return_index=True)
+        dist[frontier] = level
+        if parent is not None:
+            parent[frontier] = np.concatenate(sources)[fresh[first]]
+
+    return SearchResult(dist, parent, None)
+
+
+def dijkstra(n_nodes: int, starts: Iterable[int], neighbours: Callable[[int], Iterable[Tuple[int, int]]],
+             goal: Goal = None, heuristic: Optional[Callable[[int], int]] = None,
+             track_path: bool = False) -> SearchResult:
+    """
+    Shortest paths with non-negative integer edge costs. neighbours yields (node, cost) pairs.
+    With a heuristic (an admissible lower bound on the remaining cost to the goal) this is A*.
+    """
+
+    is_goal = _goal_test(goal)
+    dist = array('q', [UNREACHED]) * n_nodes
+    parent = array('q', [UNREACHED]) * n_nodes if track_path else None
+    done = bytearray(n_nodes)
+
+    heap = []
+    for start in starts:
+        dist[start] = 0
+        heap.append((heuristic(start) if heuristic else 0, 0, start))
+    heapq.heapify(heap)
+
+    while heap:
+        _, d, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = 1
+
+        if is_goal and is_goal(node):
+            return SearchResult(dist, parent, node)
+
+        for nxt, cost in neighbours(node):
+            nd = d + cost
+            old = dist[nxt]
+            if old == UNREACHED or nd < old:
+                dist[nxt] = nd
+                if parent is not None:
+                    parent[nxt] = node
+                heapq.heappush(heap, (nd + heuristic(nxt) if heuristic else nd, nd, nxt))
+
+    return SearchResult(dist, parent, None)
+
+
+def astar(n_nodes: int, starts: Iterable[int], neighbours: Callable[[int], Iterable[Tuple[int, int]]],
+          goal: Goal, heuristic: Callable[[int], int], track_path: bool = False) -> SearchResult:
+    """A* search, i.e. Dijkstra guided by a heuristic."""
+    return dijkstra(n_nodes, starts, neighbours, goal, heuristic, track_path)
+
+
+def grid_neighbours(grid: Grid, can_move: Optional[Callable[[int, int], bool]] = None, diagonal: bool = False,
+                    reverse: bool = False) -> Callable[[int], List[int]]:
+    """
+    Neighbours callback over a grid's flat indices.
+    can_move(from_cell, to_cell) gets the two cells' byte values and decides if the step is allowed (default: always).
+    With reverse, edges are followed backwards, i.e. a step from a to b is allowed if can_move(b, a),
+    which lets a search start from the destination.
+    """
+
+    cells = grid.flat.tobytes()
+    ncols = grid.ncols
+    size = grid.size
+
+    if diagonal:
+        steps = [(dr * ncols + dc, dc) for dr, dc in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))]
+    else:
+        steps = [(-ncols, 0), (1, 1), (ncols, 0), (-1, -1)]
+
+    def neighbours(node: int) -> List[int]:
+        col = node % ncols
+        here = cells[node]
+        out = []
+        for delta, dc in steps:
+            nxt = node + delta
+            # Stay on the grid, and don't wrap from one end of a row to the other.
+            if not 0 <= nxt < size or not 0 <= col + dc < ncols:
+                continue
+            if can_move is not None:
+                if reverse:
+                    if not can_move(cells[nxt], here):
+                        continue
+                elif not can_move(here, cells[nxt]):
+                    continue
+            out.append(nxt)
+        return out
+
+    return neighbours
+
+
+def grid_edges(grid: Grid, can_move: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+               diagonal: bool = False, reverse: bool = False) -> List[Tuple[int, np.ndarray]]:
+    """
+    Edges for `bfs_levels` over a grid's flat indices, worked out for every cell at once.
+    can_move(from_cells, to_cells) is as for grid_neighbours, but gets int16 arrays of byte values (so differences can
+    go negative) and returns a boolean array.
+    """
+
+    cells = grid.cells.astype(np.int16)
+    nrows, ncols = grid.shape
+
+    edges = []
+    for dr, dc in (ALL_DIRECTIONS if diagonal else ORTHOGONAL):
+        # The cells whose neighbour in this direction is on the grid, and those neighbours.
+        here = (slice(max(-dr, 0), nrows - max(dr, 0)), slice(max(-dc, 0), ncols - max(dc, 0)))
+        there = (slice(max(dr, 0), nrows - max(-dr, 0)), slice(max(dc, 0), ncols - max(-dc, 0)))
+
+        allowed = np.zeros(grid.shape, dtype=bool)
+        if can_move is None:
+            allowed[here] = True
+        elif reverse:
+            allowed[here] = can_move(cells[there], cells[here])
+        else:
+            allowed[here] = can_move(cells[here], cells[there])
+        edges.append((dr * ncols + dc, allowed.reshape(-1)))
+
+    return edges
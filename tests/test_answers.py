@@ -0,0 +1,38 @@
+from aoc_utils import answers
+from aoc_utils.discovery import Puzzle
+
+
+PUZZLE = Puzzle(2099, 6, 'Answers', 'solution.py')
+
+
+def result(part, answer, solve_time=1.0):
+    return {'year': 2099, 'day': 6, 'part': part, 'answer': answer, 'parse_time': 0.1, 'solve_time': solve_time,
+            'peak_memory': 1 << 20}
+
+
+def test_record_and_lookup(tmp_path):
+    conn = answers.connect(str(tmp_path / 'answers.sqlite3'))
+    key = ('input', 'source')
+    assert answers.lookup(conn, PUZZLE, 1, key) is None
+
+    answers.record(conn, result(1, 42), key)
+    stored = answers.lookup(conn, PUZZLE, 1, key)
+    assert stored['answer'] == 42 and stored['stored'] and stored['status'] == 'ok'
+
+    # A changed solution or input, or another part, doesn't match.
+    assert answers.lookup(conn, PUZZLE, 1, ('input', 'edited')) is None
+    assert answers.lookup(conn, PUZZLE, 1, ('other', 'source')) is None
+    assert answers.lookup(conn, PUZZLE, 2, key) is None
+
+    # The latest run wins, and every run stays in the history.
+    answers.record(conn, result(1, 43, solve_time=0.5), key)
+    assert answers.lookup(conn, PUZZLE, 1, key)['answer'] == 43
+    assert [row['solve_time'] for row in answers.history(conn, 2099, 6, 1)] == [1.0, 0.5]
+    conn.close()
+
+
+def test_answers_that_json_cannot_hold_are_stored_as_text(tmp_path):
+    conn = answers.connect(str(tmp_path / 'answers.sqlite3'))
+    answers.record(conn, result(2, {1, 2}), ('input', 'source'))
+    assert answers.lookup(conn, PUZZLE, 2, ('input', 'source'))['answer'] == '{1, 2}'
+    conn.close()
@@ -0,0 +1,38 @@
+from aoc_utils.batch import run_batch
+from aoc_utils.discovery import Puzzle
+
+
+CRASHING_DAY = '''\
+import os
+
+
+def _parse_input(data):
+    if data.strip() == 'crash':
+        os._exit(1)
+    return int(data)
+
+
+def part_1_solution(data):
+    return data + 1
+'''
+
+
+def test_worker_death_only_fails_its_own_input(tmp_path):
+    solution = tmp_path / 'solution.py'
+    solution.write_text(CRASHING_DAY)
+
+    paths = []
+    for i in range(8):
+        path = tmp_path / f'input{i}.txt'
+        path.write_text('crash' if i == 3 else str(i))
+        paths.append(str(path))
+
+    puzzle = Puzzle(2099, 1, 'Crash', str(solution))
+    results = {r['input']: r for r in run_batch(puzzle, paths, parts=(1,), workers=3)}
+
+    assert len(results) == len(paths)
+    assert results[paths[3]]['status'].startswith('BrokenProcessPool')
+    for i, path in enumerate(paths):
+        if i != 3:
+            assert results[path]['status'] == 'ok'
+            assert results[path]['answer'] == i + 1
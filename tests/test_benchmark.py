@@ -0,0 +1,14 @@
+from aoc_utils.benchmark import percentile
+
+
+def test_percentile_nearest_rank_20():
+    values = list(range(1, 21))
+    assert percentile(values, 95) == 19
+    assert percentile(values, 50) == 10
+    assert percentile(values, 100) == 20
+
+
+def test_percentile_nearest_rank_100():
+    values = list(range(100, 0, -1))
+    assert percentile(values, 95) == 95
+    assert percentile(values, 0) == 1
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import numpy as np
+
+from aoc_utils import cache
+from aoc_utils.discovery import Puzzle, load_module
+from aoc_utils.grid import Grid
+
+
+def test_grid_is_stored_as_npy_and_memory_mapped(tmp_path):
+    grid = Grid.from_text('#.#\n..#\n')
+    path = cache.store('grid', grid, str(tmp_path))
+    assert path.endswith('.grid.npy')
+
+    loaded = cache.load('grid', str(tmp_path))
+    assert isinstance(loaded, Grid) and loaded == grid
+    assert isinstance(loaded.cells.base, np.memmap)
+
+    # Copy-on-write, so a solution marking cells doesn't change the entry.
+    loaded[0, 1] = '#'
+    assert cache.load('grid', str(tmp_path)) == grid
+
+
+PARSER_DAY = '''\
+calls = []
+
+
+def _parse_input(data):
+    calls.append(data)
+    return [int(line) for line in data.split()]
+'''
+
+
+def test_load_or_parse_hits_misses_and_invalidates(tmp_path):
+    source = tmp_path / 'solution.py'
+    source.write_text(PARSER_DAY)
+    puzzle = Puzzle(2099, 5, 'Cache', str(source))
+    cache_dir = str(tmp_path / 'cache')
+
+    try:
+        module = load_module(puzzle)
+        assert cache.load_or_parse(puzzle, module, 1, '1\n2\n', cache_dir) == [1, 2]
+        assert cache.load_or_parse(puzzle, module, 1, '1\n2\n', cache_dir) == [1, 2]
+        assert len(module.calls) == 1
+
+        # A different input misses, and replaces the entry for the old one.
+        assert cache.load_or_parse(puzzle, module, 1, '3\n', cache_dir) == [3]
+        assert len(module.calls) == 2
+        assert len(os.listdir(cache_dir)) == 1
+
+        # So does any edit to the solution file.
+        source.write_text(PARSER_DAY + '\n')
+        assert cache.load_or_parse(puzzle, module, 1, '3\n', cache_dir) == [3]
+        assert len(module.calls) == 3
+        assert len(os.listdir(cache_dir)) == 1
+
+        assert cache.clear(cache_dir) == 1
+        assert cache.load_or_parse(puzzle, module, 1, '3\n', cache_dir) == [3]
+        assert len(module.calls) == 4
+    finally:
+        sys.modules.pop(puzzle.module_name, None)
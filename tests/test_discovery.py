@@ -0,0 +1,79 @@
+import os
+import sys
+
+import pytest
+
+from aoc_utils import discovery
+
+
+SOLUTION = '''\
+def _parse_input(data):
+    first, second = data.split()
+    return int(first), int(second)
+
+
+def part_1_solution(first, second):
+    return first + second
+
+
+def part_2_solution(pair):
+    return max(pair)
+'''
+
+
+@pytest.fixture
+def tree(tmp_path):
+    day = tmp_path / '2099' / 'Day 3 - Test Puzzle'
+    day.mkdir(parents=True)
+    (day / 'solution.py').write_text(SOLUTION)
+    # solution.py is taken over aoc.py, and extra scripts are ignored.
+    (day / 'aoc.py').write_text('raise ImportError')
+    (day / 'input.txt').write_text('4 7\n')
+
+    # Directories that aren't years or days are skipped.
+    (tmp_path / 'aoc_utils').mkdir()
+    (tmp_path / '2099' / 'notes').mkdir()
+    (tmp_path / '2099' / 'Day 4 - Unsolved').mkdir()
+
+    yield tmp_path
+    sys.modules.pop('aoc_2099_day_03', None)
+
+
+def test_discover_round_trip(tree):
+    puzzles = discovery.discover(str(tree))
+    assert [(p.year, p.day, p.title) for p in puzzles] == [(2099, 3, 'Test Puzzle')]
+
+    puzzle = discovery.find_puzzle(2099, 3, str(tree))
+    assert puzzle == puzzles[0]
+    assert puzzle.path.endswith('solution.py')
+    assert discovery.read_input(puzzle) == '4 7\n'
+
+    module = discovery.load_module(puzzle)
+    assert discovery.load_module(puzzle) is module
+    data = discovery.get_parser(module, 1)(discovery.read_input(puzzle))
+
+    # Tuples are unpacked for solutions that take more than one argument, and passed whole otherwise.
+    assert discovery.call_solution(discovery.get_solution(module, 1), data) == 11
+    assert discovery.call_solution(discovery.get_solution(module, 2), data) == 7
+
+
+def test_missing_days_and_parts(tree):
+    with pytest.raises(LookupError):
+        discovery.find_puzzle(2099, 4, str(tree))
+    assert discovery.discover(str(tree), years=[2098]) == []
+
+    module = discovery.load_module(discovery.find_puzzle(2099, 3, str(tree)))
+    with pytest.raises(AttributeError):
+        discovery.get_stream_parser(module)
+
+
+def test_source_hash_follows_aoc_utils_imports(tmp_path):
+    path = tmp_path / 'solution.py'
+    path.write_text('from aoc_utils.search import bfs\n')
+    deps = [os.path.basename(p) for p in discovery.aoc_utils_dependencies(str(path))]
+    # search imports grid, so a change to either changes the hash.
+    assert deps == ['grid.py', 'search.py']
+
+    before = discovery.source_hash(str(path))
+    path.write_text('from aoc_utils.search import bfs\n\n')
+    assert discovery.source_hash(str(path)) != before
@@ -0,0 +1,33 @@
+import pytest
+
+from aoc_utils.discovery import find_puzzle, load_module
+
+
+@pytest.fixture(scope='module')
+def dive():
+    return load_module(find_puzzle(2021, 2))
+
+
+def test_encode(dive):
+    ops, mags = dive.encode('forward 5\n\ndown 3\nup 2\n')
+    assert ops.tolist() == [dive.FORWARD, dive.DOWN, dive.UP]
+    assert mags.tolist() == [5, 3, 2]
+
+
+@pytest.mark.parametrize('text, message', [
+    ('fly 5\n', 'Unknown command'),
+    ('downward 3\n', 'Unknown command'),
+    ('uphill 2\n', 'Unknown command'),
+    ('förward 2\n', 'Unknown command'),
+    ('forward 5\ndown\nup 3\n', 'commands but'),
+    ('forward 5\ndown x\n', 'Bad magnitude'),
+])
+def test_encode_rejects_bad_input(dive, text, message):
+    with pytest.raises(ValueError, match=message):
+        dive.encode(text)
+
+
+def test_stream_matches_whole_input(dive):
+    lines = dive.EXAMPLE_INPUT.splitlines()
+    assert dive.part_2_solution(dive._parse_stream(lines, chunk_size=4)) == dive.EXAMPLE_OUTPUT_PART2
+    assert dive.part_1_solution(dive._parse_stream(lines, chunk_size=4)) == dive.EXAMPLE_OUTPUT_PART1
@@ -0,0 +1,48 @@
+import pytest
+
+from aoc_utils.discovery import find_puzzle, load_module, get_parser, get_solution, call_solution
+from aoc_utils.generators import GENERATORS, PRIMES, generate
+
+
+def test_monkey_in_the_middle_smallest_size():
+    text = generate(2022, 11, 3)
+    assert text.count('Monkey ') == 3
+
+
+@pytest.mark.parametrize('size', [0, 1, 2])
+def test_monkey_in_the_middle_too_few_monkeys(size):
+    with pytest.raises(ValueError, match='at least 3 monkeys'):
+        generate(2022, 11, size)
+
+
+def solve(year, day, text, part):
+    module = load_module(find_puzzle(year, day))
+    return call_solution(get_solution(module, part), get_parser(module, part)(text))
+
+
+@pytest.mark.parametrize('year, day', sorted(GENERATORS))
+def test_generated_input_parses_and_solves(year, day):
+    text = generate(year, day, GENERATORS[(year, day)].sizes[0])
+    assert solve(year, day, text, 1) is not None
+
+
+@pytest.mark.parametrize('size', [0, 1, 2, 10, 1001, GENERATORS[(2023, 6)].sizes[-1]])
+def test_wait_for_it_every_race_can_be_won(size):
+    assert solve(2023, 6, generate(2023, 6, size), 1) > 0
+    assert solve(2023, 6, generate(2023, 6, size), 2) > 0
+
+
+def test_monkey_in_the_middle_largest_sizes():
+    text = generate(2022, 11, GENERATORS[(2022, 11)].sizes[-1])
+    assert solve(2022, 11, text, 1) > 0
+    assert solve(2022, 11, text, 2) > 0
+
+    # Every monkey needs its own prime divisor.
+    assert solve(2022, 11, generate(2022, 11, len(PRIMES)), 1) > 0
+    with pytest.raises(ValueError, match=f'at most {len(PRIMES)} monkeys'):
+        generate(2022, 11, len(PRIMES) + 1)
+
+
+def test_scratchcards_copies_stay_bounded():
+    size = GENERATORS[(2023, 4)].sizes[-1]
+    assert size <= solve(2023, 4, generate(2023, 4, size), 2) < 10 * size
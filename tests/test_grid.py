@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from aoc_utils.grid import Grid
+
+
+GRID = Grid.from_text('''
+#..
+.#.
+..S
+''')
+
+
+def test_neighbours_stay_on_the_grid():
+    assert sorted(GRID.neighbours(0, 0)) == [(0, 1), (1, 0)]
+    assert sorted(GRID.neighbours(0, 0, diagonal=True)) == [(0, 1), (1, 0), (1, 1)]
+    assert sorted(GRID.neighbours(2, 1)) == [(1, 1), (2, 0), (2, 2)]
+    assert len(list(GRID.neighbours(1, 1, diagonal=True))) == 8
+
+    assert GRID.in_bounds(2, 2)
+    assert not GRID.in_bounds(3, 0) and not GRID.in_bounds(0, -1)
+
+
+def test_indices_and_lookups():
+    assert GRID.shape == (3, 3)
+    assert GRID.to_coord(GRID.to_index(2, 1)) == (2, 1)
+    assert GRID.find('S') == (2, 2)
+    assert GRID.find('X') is None
+    assert GRID.positions('#').tolist() == [[0, 0], [1, 1]]
+    assert GRID.count('#S') == 3
+    assert str(GRID) == '#..\n.#.\n..S'
+
+
+def test_shift_fills_off_the_edge():
+    # Each cell gets the value of the cell below it.
+    shifted = GRID.shift(1, 0, fill=ord('x'))
+    assert [row.tobytes() for row in shifted] == [b'.#.', b'..S', b'xxx']
+    assert np.all(GRID.shift(0, 3) == 0)
+
+
+def test_rows_must_be_the_same_length():
+    with pytest.raises(ValueError):
+        Grid.from_lines(['ab', 'c'])
+    assert Grid.from_text('').shape == (0, 0)
@@ -0,0 +1,44 @@
+from copy import deepcopy
+
+from aoc_utils.discovery import find_puzzle, load_module
+from aoc_utils.generators import generate
+
+
+def test_part_2_falls_back_to_play_when_cycles_are_too_long(monkeypatch):
+    aoc = load_module(find_puzzle(2022, 11))
+    monkeys = aoc._parse_input(aoc.EXAMPLE_INPUT)
+
+    # The example's items take hundreds of rounds to repeat.
+    monkeypatch.setattr(aoc, 'MIN_CYCLE_ROUNDS', 10)
+    monkeypatch.setattr(aoc, 'CYCLE_SEARCH_FRACTION', 1000)
+    assert aoc.inspection_counts(monkeys, 10000, releif=False) is None
+
+    calls = []
+    play = aoc.play
+    monkeypatch.setattr(aoc, 'play', lambda *args, **kwargs: calls.append(args) or play(*args, **kwargs))
+    assert aoc.part_2_solution(deepcopy(monkeys)) == aoc.EXAMPLE_OUTPUT_PART2
+    assert len(calls) == 1
+
+
+def test_cycle_search_scales_with_rounds():
+    aoc = load_module(find_puzzle(2022, 11))
+    # Some of these items take almost 2000 rounds to repeat.
+    monkeys = aoc._parse_input(generate(2022, 11, 10))
+
+    # A tenth of 10000 rounds is too few to find those cycles, so part 2 plays the rounds out.
+    assert aoc.inspection_counts(monkeys, 10000, releif=False) is None
+    played = deepcopy(monkeys)
+    assert aoc.part_2_solution(deepcopy(monkeys)) == aoc.play(played, 10000, releif=False)
+
+    # A longer game searches for longer, finds them and counts the same as playing it.
+    played = deepcopy(monkeys)
+    aoc.play(played, 30000, releif=False)
+    assert aoc.inspection_counts(monkeys, 30000, releif=False) == [monkey.inspected_count for monkey in played]
+
+
+def test_billion_rounds_follow_cycles():
+    aoc = load_module(find_puzzle(2022, 11))
+    monkeys = aoc._parse_input(aoc.EXAMPLE_INPUT)
+    counts = aoc.inspection_counts(monkeys, 10 ** 9, releif=False)
+    assert counts is not None
+    assert sum(counts) > 10 ** 9
@@ -0,0 +1,50 @@
+import os
+
+from aoc_utils import profiling
+
+
+def leaf(n):
+    return sum(range(n))
+
+
+def branch(n):
+    # A loop rather than a comprehension, which is a frame of its own on older Pythons.
+    results = []
+    for _ in range(50):
+        results.append(leaf(n))
+    return results
+
+
+def test_profile_call_returns_the_result_and_stats():
+    result, stats, peak = profiling.profile_call(branch, 2000)
+    assert result == [leaf(2000)] * 50
+    assert peak >= 0
+
+    hot = profiling.hot_functions(stats, top=50)
+    leaf_row = next(row for row in hot if row['function'].endswith('(leaf)'))
+    assert leaf_row['ncalls'] == 50
+
+
+def test_collapsed_stacks_nest_callees_under_callers():
+    _, stats, _ = profiling.profile_call(branch, 20000)
+    lines = [line.rsplit(' ', 1) for line in profiling.collapsed_stacks(stats)]
+    assert all(int(micros) >= 1 for _, micros in lines)
+
+    stacks = [stack for stack, _ in lines]
+    leaf_stack = next(stack for stack in stacks if stack.endswith('(leaf)'))
+    assert leaf_stack.split(';')[-2].endswith('(branch)')
+    assert f'{leaf_stack};<built-in method builtins.sum>' in stacks
+
+
+def test_profile_stage_writes_files(tmp_path):
+    result, summary = profiling.profile_stage(branch, (100,), str(tmp_path), 'stage', top=3)
+    assert result == [leaf(100)] * 50
+    assert len(summary['hot']) <= 3
+    assert os.path.getsize(summary['files']['pstats']) > 0
+    assert os.path.exists(summary['files']['collapsed'])
+
+
+def test_peak_memory():
+    profiling.reset_peak_memory()
+    peak = profiling.peak_memory()
+    assert peak is None or peak > 0
@@ -0,0 +1,36 @@
+import pytest
+
+from aoc_utils.discovery import find_puzzle, load_module
+
+
+@pytest.fixture(scope='module')
+def rps():
+    return load_module(find_puzzle(2022, 2))
+
+
+@pytest.mark.parametrize('text', ['A Y\nB X\nC Z', 'A Y\r\nB X\r\nC Z\r\n\n'])
+def test_count_rounds(rps, text):
+    assert rps.count_rounds(text.encode()).tolist() == [0, 1, 0, 1, 0, 0, 0, 0, 1]
+
+
+@pytest.mark.parametrize('text, line', [
+    ('A Y\nB\nC Z', 2),
+    ('A Y\nB X Z\nC Z', 2),
+    ('A Y\n\nB X', 2),
+    ('A Y\nD X', 2),
+    ('A Y\nB X\nC', 3),
+])
+def test_count_rounds_rejects_malformed_lines(rps, text, line):
+    with pytest.raises(ValueError, match=f'Round {line} '):
+        rps.count_rounds(text.encode())
+
+
+def test_count_file(rps, tmp_path, monkeypatch):
+    path = tmp_path / 'input.txt'
+    path.write_text('')
+    assert rps.count_file(str(path)).tolist() == [0] * 9
+
+    # Small chunks, so rounds are counted across several of them.
+    monkeypatch.setattr(rps, 'CHUNK_BYTES', 6)
+    path.write_text(rps.EXAMPLE_INPUT + '\n')
+    assert rps.score(rps.count_file(str(path))) == (rps.EXAMPLE_OUTPUT_PART1, rps.EXAMPLE_OUTPUT_PART2)
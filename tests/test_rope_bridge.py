@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from aoc_utils.discovery import find_puzzle, load_module
+from aoc_utils.generators import generate
+
+
+@pytest.fixture(scope='module')
+def rope():
+    return load_module(find_puzzle(2022, 9))
+
+
+def stepped(rope, moves, knots=10):
+    r = rope.Rope(knots)
+    for direction, count in moves:
+        r.move(direction, count)
+    return r.visited_counts()
+
+
+@pytest.mark.parametrize('script', [
+    'R 5\nU 8\nL 8\nD 3\nR 17\nD 10\nL 25\nU 20',
+    'R 1\nU 1',
+    'R 3\nL 3',
+    'R 4\nU 4\nL 3\nD 1\nR 4\nD 1\nL 5\nR 2',
+])
+def test_sweeps_match_stepping(rope, monkeypatch, script):
+    moves = rope._parse_input(script) * 300
+    # Sweep even small cycles so the sweep and overlap counting is exercised.
+    monkeypatch.setattr(rope, 'MIN_SWEEP_STEPS', 1)
+    assert rope.simulate(moves, 10) == stepped(rope, moves)
+
+
+def test_sweeps_past_a_stepped_prefix(rope):
+    moves = rope._parse_input(generate(2022, 9, 200)) + rope._parse_input('R 2\nU 1') * 20000
+    r = rope.Rope(10)
+    r.run(moves)
+    assert any(r.sweeps)
+    assert r.visited_counts() == stepped(rope, moves)
+
+
+def test_random_scripts_are_stepped(rope):
+    # Random scripts only repeat by chance, in blocks too short to be worth a sweep.
+    moves = rope._parse_input(generate(2022, 9, 5000))
+    r = rope.Rope(10)
+    start = time.perf_counter()
+    r.run(moves)
+    counts = r.visited_counts()
+    elapsed = time.perf_counter() - start
+
+    assert not any(r.sweeps)
+    assert counts == stepped(rope, moves)
+
+    # No slower than stepping every move, give or take a generous margin for a noisy machine.
+    start = time.perf_counter()
+    stepped(rope, moves)
+    assert elapsed < 3 * (time.perf_counter() - start) + 0.5
@@ -0,0 +1,60 @@
+import sys
+
+import pytest
+
+from aoc_utils import answers, runner
+from aoc_utils.discovery import Puzzle
+
+
+SOLUTION = '''\
+def _parse_input(data):
+    return [int(line) for line in data.split()]
+
+
+def part_1_solution(data):
+    return sum(data)
+
+
+def part_2_solution(data):
+    raise ValueError('not solved yet')
+'''
+
+
+@pytest.fixture
+def puzzle(tmp_path):
+    (tmp_path / 'solution.py').write_text(SOLUTION)
+    (tmp_path / 'input.txt').write_text('1\n2\n3\n')
+    puzzle = Puzzle(2099, 7, 'Runner', str(tmp_path / 'solution.py'))
+    yield puzzle
+    sys.modules.pop(puzzle.module_name, None)
+
+
+def test_run_job_reports_answers_and_failures(puzzle):
+    solved = runner.run_job(puzzle, 1, use_cache=False)
+    assert solved['status'] == 'ok' and solved['answer'] == 6
+    assert solved['parse_time'] >= 0 and solved['solve_time'] >= 0
+
+    failed = runner.run_job(puzzle, 2, use_cache=False)
+    assert failed['status'] == 'ValueError: not solved yet'
+    assert failed['answer'] is None and 'Traceback' in failed['traceback']
+
+
+def test_run_serves_stored_answers(puzzle, tmp_path, monkeypatch):
+    connect = answers.connect
+    monkeypatch.setattr(answers, 'connect', lambda: connect(str(tmp_path / 'answers.sqlite3')))
+
+    first = runner.run([puzzle], workers=1, use_cache=False)
+    assert [(r['part'], r['answer'], r['stored']) for r in first] == [(1, 6, False), (2, None, False)]
+
+    # Only the solved part was stored. The failed one runs again, as does everything with force.
+    again = runner.run([puzzle], workers=1, use_cache=False)
+    assert [(r['part'], r['stored']) for r in again] == [(1, True), (2, False)]
+    forced = runner.run([puzzle], workers=1, use_cache=False, force=True)
+    assert not any(r['stored'] for r in forced)
+
+
+def test_print_table(puzzle, capsys):
+    runner.print_table(runner.run([puzzle], workers=1, use_cache=False, use_store=False))
+    out = capsys.readouterr().out
+    assert '1/2 parts solved' in out
+    assert 'ValueError: not solved yet' in out
@@ -0,0 +1,79 @@
+import pytest
+
+from aoc_utils.grid import Grid
+from aoc_utils.search import UNREACHED, astar, bfs, bfs_levels, dijkstra, grid_edges, grid_neighbours
+
+
+# The wall forces the route from the top left round the bottom, so the top right is 10 steps away, not 4.
+MAZE = Grid.from_text('''\
+..#..
+..#..
+..#..
+.....
+''')
+
+TOP_LEFT, TOP_RIGHT, BOTTOM_RIGHT = MAZE.to_index(0, 0), MAZE.to_index(0, 4), MAZE.to_index(3, 4)
+
+OPEN = lambda here, there: there != ord('#')
+
+
+def test_bfs_distances():
+    result = bfs(MAZE.size, [TOP_LEFT], grid_neighbours(MAZE, OPEN))
+    assert result.dist[TOP_RIGHT] == 10
+    assert result.dist[BOTTOM_RIGHT] == 7
+    assert result.dist[MAZE.to_index(0, 2)] == UNREACHED
+
+
+def test_bfs_levels_matches_bfs():
+    callback = bfs(MAZE.size, [TOP_LEFT], grid_neighbours(MAZE, OPEN))
+    levels = bfs_levels(MAZE.size, [TOP_LEFT], grid_edges(MAZE, OPEN))
+    assert levels.distances.tolist() == callback.distances.tolist()
+
+
+@pytest.mark.parametrize('search', [bfs, bfs_levels])
+def test_bfs_stops_at_goal_with_path(search):
+    neighbours = grid_neighbours(MAZE, OPEN) if search is bfs else grid_edges(MAZE, OPEN)
+    result = search(MAZE.size, [TOP_LEFT], neighbours, goal=TOP_RIGHT, track_path=True)
+
+    assert result.distance == 10
+    path = result.path()
+    assert path[0] == TOP_LEFT and path[-1] == TOP_RIGHT and len(path) == 11
+    assert all(abs(a - b) in (1, MAZE.ncols) for a, b in zip(path, path[1:]))
+
+
+def test_grid_edges_do_not_wrap_rows():
+    grid = Grid.from_text('ab\ncd\n')
+    result = bfs_levels(grid.size, [grid.to_index(0, 1)], grid_edges(grid))
+    # (1, 0) is two steps away, not one step round the end of row 0.
+    assert result.distances.tolist() == [1, 0, 2, 1]
+
+
+def weighted_neighbours(grid):
+    """Stepping onto a digit costs that digit."""
+
+    steps = grid_neighbours(grid)
+    return lambda node: [(nxt, grid.flat[nxt] - ord('0')) for nxt in steps(node)]
+
+
+# The cheap route runs round the outside rather than straight across the 9s.
+COSTS = Grid.from_text('''\
+1111
+1991
+1991
+1111
+''')
+
+
+def test_dijkstra_distances():
+    result = dijkstra(COSTS.size, [0], weighted_neighbours(COSTS))
+    assert result.dist[COSTS.size - 1] == 6
+    assert result.dist[COSTS.to_index(1, 1)] == 10
+
+
+def test_astar_matches_dijkstra():
+    goal = COSTS.size - 1
+    heuristic = lambda node: sum(abs(a - b) for a, b in zip(COSTS.to_coord(node), COSTS.to_coord(goal)))
+
+    result = astar(COSTS.size, [0], weighted_neighbours(COSTS), goal, heuristic, track_path=True)
+    assert result.distance == 6
+    assert all(COSTS.flat[node] == ord('1') for node in result.path())
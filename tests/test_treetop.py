@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from aoc_utils.discovery import find_puzzle, load_module
+from aoc_utils.grid import Grid
+
+
+@pytest.fixture(scope='module')
+def treetop():
+    return load_module(find_puzzle(2022, 8))
+
+
+def random_forest(nrows, ncols, seed=0):
+    rng = np.random.default_rng(seed)
+    return Grid(rng.integers(ord('0'), ord('9') + 1, size=(nrows, ncols), dtype=np.uint8))
+
+
+def test_view_distances_left(treetop):
+    trees = treetop.heights(random_forest(20, 30))
+    expected = np.zeros(trees.shape, dtype=np.int32)
+    for i, j in np.ndindex(trees.shape):
+        k = j - 1
+        while k > 0 and trees[i, k] < trees[i, j]:
+            k -= 1
+        expected[i, j] = j - max(k, 0)
+    assert np.array_equal(treetop.view_distances_left(trees), expected)
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (1, 7), (7, 1), (37, 53)])
+@pytest.mark.parametrize('rows_per_tile', [0, 1, 3, 1000])
+def test_tiled_matches_in_memory(treetop, shape, rows_per_tile):
+    grid = random_forest(*shape)
+    tile_bytes = max(1, rows_per_tile * shape[1])
+    assert treetop.tiled_part_1_solution(grid.cells, tile_bytes) == treetop.part_1_solution(grid)
+    assert treetop.tiled_part_2_solution(grid.cells, tile_bytes) == treetop.part_2_solution(grid)
+
+
+def test_tiled_from_file(treetop, tmp_path):
+    grid = random_forest(50, 40, seed=1)
+    path = tmp_path / 'input.txt'
+    path.write_bytes(b'\n'.join(row.tobytes() for row in grid.cells))
+
+    forest = treetop.open_forest(str(path))
+    for tile_bytes in (40, 400, 1 << 20):
+        assert treetop.tiled_part_1_solution(forest, tile_bytes) == treetop.part_1_solution(grid)
+        assert treetop.tiled_part_2_solution(forest, tile_bytes) == treetop.part_2_solution(grid)